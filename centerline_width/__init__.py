@@ -1,11 +1,33 @@
+# batchProcessing.py function calls
+from .batchProcessing import _process_river
+from .batchProcessing import _river_outputs_as_completed
+from .batchProcessing import process_many_iter
+from .batchProcessing import process_many
+
 # centerline.py function calls
 from .centerline import _generate_nx_graph
 from .centerline import _networkx_graph_shortest_path
+from .centerline import _generate_csgraph
+from .centerline import _csgraph_shortest_path
+from .centerline import _centerline_graph
 from .centerline import _centerline_path
+from .centerline import _starting_ending_node_indices
+from .centerline import _centerline_path_from_graph
+from .centerline import _centerline_path_from_csgraph
+from .centerline import _bank_tiles
+from .centerline import _stitch_centerline_tiles
+from .centerline import _tiled_centerline_path
 from .centerline import _equal_distance_centerline
 from .centerline import _evenly_spaced_centerline
 from .centerline import _smoothed_centerline
 
+# centerlineEngines.py function calls
+from .centerlineEngines import _skeleton_centerline_path
+from .centerlineEngines import _delaunay_centerline_path
+from .centerlineEngines import _segment_voronoi_centerline_path
+from .centerlineEngines import _raster_centerline_path
+from .centerlineEngines import _bank_pairing_centerline_path
+
 # channelMigration.py function calls
 from .channelMigration import _centerline_migration_rate
 
@@ -18,6 +40,13 @@ from .error_handling import _error_handling_save_centerline_mat
 from .error_handling import _errror_handling_txt_to_csv
 from .error_handling import _error_handling_kml_to_csv
 from .error_handling import _error_handling_centerline_width
+from .error_handling import _error_handling_from_dataframe
+from .error_handling import _error_handling_from_arrays
+from .error_handling import _error_handling_river_parameters
+from .error_handling import _error_handling_run_stage
+from .error_handling import _error_handling_save_river
+from .error_handling import _error_handling_load_river
+from .error_handling import _error_handling_process_many
 from .error_handling import _error_handling_incremental_sinuosity
 
 # getCoordinatesKML.py function calls
@@ -32,9 +61,14 @@ from .plotDiagrams import plot_centerline_width
 
 # preprocessing.py function calls
 from .preprocessing import _left_right_coordinates
+from .preprocessing import _verify_bank_coordinates
+from .preprocessing import _banks_flipped
 from .preprocessing import _generate_polygon
 from .preprocessing import _generate_voronoi
+from .preprocessing import _voronoi_connections
 from .preprocessing import _points_from_voronoi
+from .preprocessing import _simplify_bank_coordinates
+from .preprocessing import _local_channel_width
 from .preprocessing import _interpolate_between_points
 
 # riverCenterlineClass.py function calls
@@ -43,11 +77,40 @@ from .riverCenterlineClass import CenterlineWidth
 
 # relativeDistance.py function calls
 from .relativeDistance import _relative_single_coordinate
+from .relativeDistance import _relative_coordinates_array
+from .relativeDistance import _lon_lat_from_relative_array
 from .relativeDistance import _relative_bank_coordinates
 from .relativeDistance import _relative_centerline_coordinates
 from .relativeDistance import _relative_ridge_coordinates
+from .relativeDistance import _relative_voronoi
 from .relativeDistance import _relative_width_coordinates
 
+# riverCache.py function calls
+from .riverCache import _cached_output_names
+from .riverCache import _cache_key
+from .riverCache import _encode_outputs
+from .riverCache import _decode_outputs
+from .riverCache import _load_cached_outputs
+from .riverCache import _save_cached_outputs
+from .riverCache import _evict_cache
+from .riverCache import _save_river
+from .riverCache import _load_river
+
+# riverProfile.py function calls
+from .riverProfile import _profile_stage
+from .riverProfile import _profile_function
+from .riverProfile import _max_rss_mb
+
+# riverStages.py function calls
+from .riverStages import river_stages
+from .riverStages import _profiled_step
+from .riverStages import _stage_output_names
+from .riverStages import _stage_step_for_output
+from .riverStages import _stage_dependencies
+from .riverStages import _uses_tiles
+from .riverStages import _uses_voronoi_graph
+from .riverStages import _dependent_stage_output_names
+
 # riverFeatures.py function calls
 from .riverFeatures import _calculate_river_area
 from .riverFeatures import _centerline_length
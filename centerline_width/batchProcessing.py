@@ -0,0 +1,241 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      batchProcessing.py runs the centerline and width calculations for multiple                 #
+#      rivers (.csv files) in parallel across a pool of processes                                 #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - process_many_iter: yields the outputs of each           #
+#                                              river as it finishes                               #
+#                                                                                                 #
+#                                       - process_many: returns a summary table of the            #
+#                                              outputs for all rivers                             #
+#                                                                                                 #
+#                                       - _process_river: backend function that creates           #
+#                                              a river object and returns its outputs             #
+#                                                                                                 #
+#                                       - _river_outputs_as_completed: backend function           #
+#                                              that runs rivers in a process pool and yields      #
+#                                              the outputs as each river finishes                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Standard Library Imports
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import logging
+
+# Related Third Party Imports
+import pandas as pd
+
+# Internal Local Imports
+import centerline_width
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+# Outputs always included in the summary table
+_summary_output_names = [
+    "area", "right_bank_length", "left_bank_length", "centerline_length",
+    "sinuosity"
+]
+
+
+def _process_river(csv_data: str = None,
+                   river_options: dict = None,
+                   outputs: list = None) -> dict:
+    # Create a river object and return the requested outputs, failures are returned as an error instead of being raised
+    river_outputs = {"river_name": csv_data, "error": None}
+    try:
+        river_object = centerline_width.CenterlineWidth(csv_data=csv_data,
+                                                        **river_options)
+        if river_object.centerline_voronoi is None:
+            river_outputs[
+                "error"] = "[FAILED] No direct path found from starting node to ending node"
+        for output_name in outputs:
+            river_outputs[output_name] = getattr(river_object, output_name)
+    except Exception as river_error:
+        river_outputs["error"] = f"{type(river_error).__name__}: {river_error}"
+    return river_outputs
+
+
+def process_many_iter(paths: list = None,
+                      workers: int = None,
+                      outputs: list = None,
+                      cutoff: int = None,
+                      interpolate_data: bool = False,
+                      interpolate_n: int = 5,
+                      interpolate_n_centerpoints: int = None,
+                      equal_distance: int = 10,
+                      ellipsoid: str = "WGS84",
+                      interpolate_spacing_m: [int, float] = None,
+                      interpolate_width_ratio: [int, float] = None,
+                      simplify_tolerance_m: [int, float] = None,
+                      auto_orient: bool = False,
+                      tile_size: int = None,
+                      tile_overlap: int = None,
+                      centerline_engine: str = "voronoi",
+                      raster_resolution_m: [int, float] = None,
+                      graph_backend: str = "networkx",
+                      path_search: str = "breadth_first",
+                      cache_dir: str = None,
+                      cache_max_mb: int = 100):
+    # Return an iterator of {"river_name", "error", output name: value} for each river in the order the rivers finish
+    # With workers != 1, the rivers run in a process pool: on macOS/Windows (spawn) call from a script within if __name__ == "__main__":
+    centerline_width._error_handling_process_many(
+        paths=paths,
+        workers=workers,
+        outputs=outputs,
+        cutoff=cutoff,
+        interpolate_data=interpolate_data,
+        interpolate_n=interpolate_n,
+        interpolate_n_centerpoints=interpolate_n_centerpoints,
+        equal_distance=equal_distance,
+        ellipsoid=ellipsoid,
+        interpolate_spacing_m=interpolate_spacing_m,
+        interpolate_width_ratio=interpolate_width_ratio,
+        simplify_tolerance_m=simplify_tolerance_m,
+        auto_orient=auto_orient,
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        centerline_engine=centerline_engine,
+        raster_resolution_m=raster_resolution_m,
+        graph_backend=graph_backend,
+        path_search=path_search,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb)
+
+    river_options = {
+        "cutoff": cutoff,
+        "interpolate_data": interpolate_data,
+        "interpolate_n": interpolate_n,
+        "interpolate_n_centerpoints": interpolate_n_centerpoints,
+        "equal_distance": equal_distance,
+        "ellipsoid": ellipsoid,
+        "interpolate_spacing_m": interpolate_spacing_m,
+        "interpolate_width_ratio": interpolate_width_ratio,
+        "simplify_tolerance_m": simplify_tolerance_m,
+        "auto_orient": auto_orient,
+        "tile_size": tile_size,
+        "tile_overlap": tile_overlap,
+        "centerline_engine": centerline_engine,
+        "raster_resolution_m": raster_resolution_m,
+        "graph_backend": graph_backend,
+        "path_search": path_search,
+        "cache_dir": cache_dir,
+        "cache_max_mb": cache_max_mb
+    }
+    if outputs is None:
+        outputs = []
+    outputs = _summary_output_names + [
+        output_name
+        for output_name in outputs if output_name not in _summary_output_names
+    ]
+
+    return _river_outputs_as_completed(paths=paths,
+                                       workers=workers,
+                                       river_options=river_options,
+                                       outputs=outputs)
+
+
+def _river_outputs_as_completed(paths: list = None,
+                                workers: int = None,
+                                river_options: dict = None,
+                                outputs: list = None):
+    # Yield the outputs of each river as soon as the river is processed
+    if workers == 1:
+        # run in the current process (useful for debugging)
+        for csv_data in paths:
+            yield _process_river(csv_data, river_options, outputs)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        river_futures = {
+            executor.submit(_process_river, csv_data, river_options, outputs):
+            csv_data
+            for csv_data in paths
+        }
+        for river_future in as_completed(river_futures):
+            try:
+                yield river_future.result()
+            except Exception as pool_error:  # worker process ended unexpectedly
+                yield {
+                    "river_name": river_futures[river_future],
+                    "error": f"{type(pool_error).__name__}: {pool_error}"
+                }
+
+
+def process_many(paths: list = None,
+                 workers: int = None,
+                 outputs: list = None,
+                 cutoff: int = None,
+                 interpolate_data: bool = False,
+                 interpolate_n: int = 5,
+                 interpolate_n_centerpoints: int = None,
+                 equal_distance: int = 10,
+                 ellipsoid: str = "WGS84",
+                 interpolate_spacing_m: [int, float] = None,
+                 interpolate_width_ratio: [int, float] = None,
+                 simplify_tolerance_m: [int, float] = None,
+                 auto_orient: bool = False,
+                 tile_size: int = None,
+                 tile_overlap: int = None,
+                 centerline_engine: str = "voronoi",
+                 raster_resolution_m: [int, float] = None,
+                 graph_backend: str = "networkx",
+                 path_search: str = "breadth_first",
+                 cache_dir: str = None,
+                 cache_max_mb: int = 100) -> pd.DataFrame:
+    # Return a summary table (one row per river, in the same order as paths) of the area, lengths, sinuosity, and requested outputs
+    # With workers != 1, the rivers run in a process pool: on macOS/Windows (spawn) call from a script within if __name__ == "__main__":
+    all_river_outputs = process_many_iter(
+        paths=paths,
+        workers=workers,
+        outputs=outputs,
+        cutoff=cutoff,
+        interpolate_data=interpolate_data,
+        interpolate_n=interpolate_n,
+        interpolate_n_centerpoints=interpolate_n_centerpoints,
+        equal_distance=equal_distance,
+        ellipsoid=ellipsoid,
+        interpolate_spacing_m=interpolate_spacing_m,
+        interpolate_width_ratio=interpolate_width_ratio,
+        simplify_tolerance_m=simplify_tolerance_m,
+        auto_orient=auto_orient,
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        centerline_engine=centerline_engine,
+        raster_resolution_m=raster_resolution_m,
+        graph_backend=graph_backend,
+        path_search=path_search,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb)
+
+    # rivers finish in any order, each river fills the next row of its path (the same path can be listed more than once)
+    path_rows = {}
+    for path_index, csv_data in enumerate(paths):
+        path_rows.setdefault(csv_data, []).append(path_index)
+    river_results = [None] * len(paths)
+    for rivers_processed, river_outputs in enumerate(all_river_outputs,
+                                                     start=1):
+        river_results[path_rows[river_outputs["river_name"]].pop(
+            0)] = river_outputs
+        if river_outputs["error"] is None:
+            logger.info(
+                f"[SUCCESS] {rivers_processed}/{len(paths)} rivers processed - {river_outputs['river_name']}"
+            )
+        else:
+            logger.info(
+                f"[FAILED]  {rivers_processed}/{len(paths)} rivers processed - {river_outputs['river_name']}: {river_outputs['error']}"
+            )
+
+    summary_columns = ["river_name", "error"] + _summary_output_names
+    if outputs is not None:
+        summary_columns += [
+            output_name for output_name in outputs
+            if output_name not in summary_columns
+        ]
+    return pd.DataFrame(river_results, columns=summary_columns)
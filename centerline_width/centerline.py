@@ -12,9 +12,41 @@
 #                                              calculate the shortest path through                #
 #                                              the Voronoi points to generate centerline          #
 #                                                                                                 #
+#                                       - _generate_csgraph: backend to generate a scipy          #
+#                                              sparse graph from the Voronoi connections          #
+#                                                                                                 #
+#                                       - _csgraph_shortest_path: backend to calculate            #
+#                                              the shortest path (node indices) through           #
+#                                              the sparse graph                                   #
+#                                                                                                 #
+#                                       - _centerline_graph: backend to generate all              #
+#                                              possible connections and the graph from            #
+#                                              the Voronoi points                                 #
+#                                                                                                 #
 #                                       - _centerline_path: backend to find all possible          #
 #                                              paths generated by the Voronoi points              #
 #                                                                                                 #
+#                                       - _starting_ending_node_indices: backend to               #
+#                                              select the starting/ending node from the           #
+#                                              connections between the nodes                      #
+#                                                                                                 #
+#                                       - _centerline_path_from_graph: backend to find            #
+#                                              the centerline from an existing graph              #
+#                                                                                                 #
+#                                       - _centerline_path_from_csgraph: backend to find          #
+#                                              the centerline from an existing sparse             #
+#                                              graph                                              #
+#                                                                                                 #
+#                                       - _bank_tiles: backend to split the banks into            #
+#                                              overlapping along-stream tiles                     #
+#                                                                                                 #
+#                                       - _stitch_centerline_tiles: backend to join the           #
+#                                              centerline of each tile in the overlap             #
+#                                                                                                 #
+#                                       - _tiled_centerline_path: backend to find the             #
+#                                              centerline of each tile and stitch them            #
+#                                              together                                           #
+#                                                                                                 #
 #                                       - _equal_distance_centerline: backend to                  #
 #                                              interpolate the centerline at an equal             #
 #                                              physical distance                                  #
@@ -31,7 +63,6 @@
 
 # Standard Library Imports
 import logging
-import math
 
 # Related Third Party Imports
 import geopy.distance
@@ -39,7 +70,11 @@ import networkx as nx
 import numpy as np
 from pyproj import Geod
 from scipy import interpolate
-from shapely.geometry import Point, LineString
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra
+from scipy.spatial import cKDTree
+import shapely
+from shapely.geometry import LineString
 
 # Internal Local Imports
 import centerline_width
@@ -51,37 +86,32 @@ stream_handler = logging.StreamHandler()
 logger.addHandler(stream_handler)
 
 
-def _generate_nx_graph(all_points_dict: dict = None) -> (dict, list):
+def _generate_nx_graph(all_points_dict: dict = None,
+                       ellipsoid: str = "WGS84") -> (dict, list):
     # Generate a NetworkX graph to find the largest graph
 
-    def _distance_between(start: tuple = None, end: tuple = None) -> float:
-        # return the distance between two points on a graph
-        lat1 = start[0]
-        lat2 = end[0]
-        lon1 = start[1]
-        lon2 = end[1]
-        p = math.pi / 180
-        a = 0.5 - math.cos((lat2 - lat1) * p) / 2 + math.cos(
-            lat1 * p) * math.cos(lat2 * p) * (1 - math.cos(
-                (lon2 - lon1) * p)) / 2
-        return math.asin(math.sqrt(a))
-
-    # nodes as lat/lon positions, weighted by the distance between each position
-
+    # nodes as lat/lon positions, weighted by the geodesic distance (meters) between each position (all edges at once)
+    start_end_points = [
+        (start_point, end_point)
+        for start_point, end_point_list in all_points_dict.items()
+        for end_point in end_point_list
+    ]
     all_connections_in_graph = nx.Graph()  # all possible paths
-    node_as_keys_pos_values = {}
-    for start_point, end_point_list in all_points_dict.items():
-        node_as_keys_pos_values[start_point] = (start_point[0], start_point[1])
-        all_connections_in_graph.add_node(start_point,
-                                          pos=(start_point[0], start_point[1]))
-        for end_point in end_point_list:
-            all_connections_in_graph.add_node(end_point,
-                                              pos=(end_point[0], end_point[1]))
-            node_as_keys_pos_values[end_point] = (end_point[0], end_point[1])
-            all_connections_in_graph.add_edge(start_point,
-                                              end_point,
-                                              weight=_distance_between(
-                                                  start_point, end_point))
+    all_connections_in_graph.add_nodes_from(
+        (node, {
+            "pos": (node[0], node[1])
+        }) for start_point, end_point_list in all_points_dict.items()
+        for node in [start_point, *end_point_list])
+    if start_end_points:
+        # (E, 2, 2) array of the [longitude, latitude] of the start/end of each edge
+        edge_points = np.asarray(start_end_points, dtype=np.float64)
+        _, _, edge_length_m = Geod(ellps=ellipsoid).inv(
+            edge_points[:, 0, 0], edge_points[:, 0, 1], edge_points[:, 1, 0],
+            edge_points[:, 1, 1])
+        all_connections_in_graph.add_weighted_edges_from(
+            (start_point, end_point, edge_length)
+            for (start_point, end_point), edge_length in zip(
+                start_end_points, edge_length_m.tolist()))
 
     components_of_subgraphs = [
         all_connections_in_graph.subgraph(c).copy()
@@ -98,13 +128,33 @@ def _generate_nx_graph(all_points_dict: dict = None) -> (dict, list):
 
 def _networkx_graph_shortest_path(nx_graph=None,
                                   starting_node=None,
-                                  ending_node=None):
+                                  ending_node=None,
+                                  path_search: str = "breadth_first",
+                                  ellipsoid: str = "WGS84"):
     # Find the shortest path if it exists
+    # breadth_first: fewest connections, astar: shortest distance (A* with the geodesic distance to the ending node)
     if starting_node is not None:
         try:
-            shortest_path = nx.shortest_path(nx_graph,
-                                             source=starting_node,
-                                             target=ending_node)
+            if path_search == "astar":
+                # geodesic distance (meters) from each node to the ending node, never longer than the remaining path
+                graph_nodes = list(nx_graph.nodes())
+                node_coordinates = np.asarray(graph_nodes, dtype=np.float64)
+                _, _, distance_to_end = Geod(ellps=ellipsoid).inv(
+                    node_coordinates[:, 0], node_coordinates[:, 1],
+                    np.full(len(graph_nodes), ending_node[0]),
+                    np.full(len(graph_nodes), ending_node[1]))
+                distance_to_end = dict(
+                    zip(graph_nodes, distance_to_end.tolist()))
+                shortest_path = nx.astar_path(
+                    nx_graph,
+                    source=starting_node,
+                    target=ending_node,
+                    heuristic=lambda node, _: distance_to_end[node],
+                    weight="weight")
+            else:
+                shortest_path = nx.shortest_path(nx_graph,
+                                                 source=starting_node,
+                                                 target=ending_node)
             logger.info("[SUCCESS] Valid centerline path found")
         except nx.NetworkXNoPath:  # no direct path found
             logger.info(
@@ -117,72 +167,395 @@ def _networkx_graph_shortest_path(nx_graph=None,
         return None
 
 
+def _generate_csgraph(
+    vertex_positions: np.ndarray = None,
+    connection_ids: np.ndarray = None,
+    ellipsoid: str = "WGS84"
+) -> (np.ndarray, np.ndarray, csr_matrix, np.ndarray):
+    # Generate a scipy sparse graph (integer node indices) to find the largest graph, returns the node positions, connections, graph, and nodes of the largest subgraph
+    # Connections are ordered by start point (in the order of the Voronoi points dictionary) and nodes are numbered in the order they are first connected
+    connection_ids = np.asarray(connection_ids, dtype=np.intp).reshape(-1, 2)
+    _, first_start_index, start_group = np.unique(connection_ids[:, 0],
+                                                  return_index=True,
+                                                  return_inverse=True)
+    connection_ids = connection_ids[np.argsort(
+        first_start_index[start_group.reshape(-1)], kind="stable")]
+    node_ids, first_node_index, node_of_connection = np.unique(
+        connection_ids, return_index=True, return_inverse=True)
+    node_order = np.argsort(first_node_index)
+    node_index = np.empty(len(node_ids), dtype=np.intp)
+    node_index[node_order] = np.arange(len(node_ids))
+    connections = node_index[node_of_connection.reshape(-1)].reshape(-1, 2)
+    node_coordinates = np.asarray(vertex_positions,
+                                  dtype=np.float64)[node_ids[node_order]]
+
+    # edges weighted by the geodesic distance (meters) between each [longitude, latitude] position
+    edges = connections[connections[:, 0] != connections[:, 1]]
+    _, _, edge_length_m = Geod(ellps=ellipsoid).inv(
+        node_coordinates[edges[:, 0], 0], node_coordinates[edges[:, 0], 1],
+        node_coordinates[edges[:, 1], 0], node_coordinates[edges[:, 1], 1])
+    all_connections_in_graph = csr_matrix(
+        (edge_length_m, (edges[:, 0], edges[:, 1])),
+        shape=(len(node_coordinates), len(node_coordinates)))
+
+    # components are labeled in the order of their first node, the first of the largest components is kept
+    _, node_labels = connected_components(all_connections_in_graph,
+                                          directed=False)
+    nodes_of_largest_subgraph = np.flatnonzero(
+        node_labels == np.bincount(node_labels).argmax())
+
+    return node_coordinates, connections, all_connections_in_graph, nodes_of_largest_subgraph
+
+
+def _csgraph_shortest_path(csgraph: csr_matrix = None,
+                           starting_index: int = None,
+                           ending_index: int = None,
+                           path_search: str = "breadth_first") -> list:
+    # Find the shortest path (node indices) if it exists
+    # breadth_first: fewest connections, astar: shortest distance (scipy does not include A*, the weighted Dijkstra path has the same length)
+    if starting_index is None:
+        return None
+    _, predecessors = dijkstra(csgraph,
+                               directed=False,
+                               indices=starting_index,
+                               return_predecessors=True,
+                               unweighted=path_search != "astar")
+    if ending_index != starting_index and predecessors[ending_index] < 0:
+        logger.info(
+            "[FAILED]  No direct path found from starting node to ending node. To view gaps, plot_centerline(display_all_possible_paths=True). Recommended fix, rerun CenterlineWidth: set interpolate_data=True or (if interpolate_data=True) increase interpolate_n"
+        )
+        return None
+    shortest_path = [ending_index]
+    while shortest_path[-1] != starting_index:
+        shortest_path.append(int(predecessors[shortest_path[-1]]))
+    logger.info("[SUCCESS] Valid centerline path found")
+    return shortest_path[::-1]
+
+
+def _centerline_graph(river_voronoi=None,
+                      river_polygon=None,
+                      ellipsoid: str = "WGS84") -> (dict, nx.Graph, list):
+    # Return all possible path connections from Voronoi as a dictionary, the NetworkX graph, and nodes of the largest subgraph
+    start_end_points_dict = centerline_width._points_from_voronoi(
+        river_voronoi,
+        river_polygon)  # All possible path connections from Voronoi
+    nx_graphs, largest_subgraph_nodes = _generate_nx_graph(
+        start_end_points_dict, ellipsoid)
+    return start_end_points_dict, nx_graphs, largest_subgraph_nodes
+
+
 def _centerline_path(river_voronoi=None,
                      river_polygon=None,
                      top_polygon_line: LineString = None,
                      bottom_polygon_line: LineString = None,
-                     multiple_connections: int = 0):
+                     multiple_connections: int = 0,
+                     graph_backend: str = "networkx",
+                     ellipsoid: str = "WGS84",
+                     path_search: str = "breadth_first"):
     # Return the starting node, ending node, all possible paths positions, and all paths starting/end position as a dictionary
-    start_end_points_dict = centerline_width._points_from_voronoi(
-        river_voronoi,
-        river_polygon)  # All possible path connections from Voronoi
-    nx_graphs, largest_subgraph_nodes = _generate_nx_graph(
-        start_end_points_dict)
-
-    x_ridge_point = []  # X position on path
-    y_ridge_point = []  # Y position on path
-    starting_node = None  # starting position at the top of the river
-    ending_node = None  # ending position at the bottom of the river
-    for start_point, end_point_list in start_end_points_dict.items():
-        if len(
-                end_point_list
-        ) > multiple_connections:  # TESTING TESTING: Show only the end points that have multiple connections (set to 0 during production)
-            # Find the starting and ending node based on distance from the top and bottom of the polygon
-            if starting_node is None:
-                starting_node = start_point
-            else:
-                # Only include if starting point node is on the largest subgraph (that represents the centerline)
-                if start_point in largest_subgraph_nodes:
-                    # if start_point is closer to the top of the polygon than the current starting_node
-                    if Point(start_point).distance(top_polygon_line) <= Point(
-                            starting_node).distance(top_polygon_line):
-                        starting_node = start_point
-            for end_point in end_point_list:
-                if ending_node is None:
-                    ending_node = end_point
-                # Only include if starting point node is on the largest subgraph (that represents the centerline)
-                if start_point in largest_subgraph_nodes:
-                    # if the end_point is closer to the top of the polygon than the current starting_node
-                    if Point(end_point).distance(top_polygon_line) <= Point(
-                            starting_node).distance(top_polygon_line):
-                        starting_node = end_point
-                    else:
-                        # if start_point is closer to the bottom than current ending_node
-                        if Point(start_point).distance(
-                                bottom_polygon_line) <= Point(
-                                    ending_node).distance(bottom_polygon_line):
-                            ending_node = start_point
-                        # if end_point is closer to the bottom than current ending_node
-                        if Point(end_point).distance(
-                                bottom_polygon_line) <= Point(
-                                    ending_node).distance(bottom_polygon_line):
-                            ending_node = end_point
-                # Save all starting and end positions for all possible paths
-                x_ridge_point.append((start_point[0], end_point[0]))
-                y_ridge_point.append((start_point[1], end_point[1]))
-
-    if starting_node is None:
+    if graph_backend == "csgraph":
+        node_coordinates, connections, csgraph, largest_subgraph_nodes = _generate_csgraph(
+            *centerline_width._voronoi_connections(river_voronoi,
+                                                   river_polygon),
+            ellipsoid=ellipsoid)
+        return _centerline_path_from_csgraph(node_coordinates, connections,
+                                             csgraph, largest_subgraph_nodes,
+                                             top_polygon_line,
+                                             bottom_polygon_line, path_search)
+    start_end_points_dict, nx_graphs, largest_subgraph_nodes = _centerline_graph(
+        river_voronoi, river_polygon, ellipsoid)
+    return _centerline_path_from_graph(start_end_points_dict, nx_graphs,
+                                       largest_subgraph_nodes,
+                                       top_polygon_line, bottom_polygon_line,
+                                       multiple_connections, path_search,
+                                       ellipsoid)
+
+
+def _starting_ending_node_indices(connections: np.ndarray = None,
+                                  distance_to_top: np.ndarray = None,
+                                  distance_to_bottom: np.ndarray = None,
+                                  in_largest_subgraph: np.ndarray = None):
+    # Return the index of the starting node (closest to the top of the polygon) and ending node (closest to the bottom of the polygon)
+    # connections: (M, 2) array of node indices (start, end) with the connections of each start point next to each other
+    # Same result as checking each connection in order, where a later node at the same distance replaces the current node:
+    # the node is the last candidate with the smallest distance, and the end points of connections that move the starting node are not ending node candidates
+    connections = np.asarray(connections, dtype=np.intp).reshape(-1, 2)
+    if len(connections) == 0:
+        return None, None
+    start_nodes = connections[:, 0]
+    end_nodes = connections[:, 1]
+    first_connection = np.r_[True, start_nodes[1:] != start_nodes[:-1]]
+    start_in_largest = in_largest_subgraph[start_nodes]
+
+    # starting node candidates for each connection: the start point (first connection of a start point) then the end point, only on the largest subgraph (the first start point is always a candidate)
+    start_point_candidate = first_connection & start_in_largest
+    start_point_candidate[0] = True
+    top_candidates = np.full((len(connections), 2), np.inf)
+    top_candidates[start_point_candidate,
+                   0] = distance_to_top[start_nodes[start_point_candidate]]
+    top_candidates[start_in_largest,
+                   1] = distance_to_top[end_nodes[start_in_largest]]
+    top_candidates = top_candidates.reshape(-1)
+    starting_index = connections.reshape(-1)[np.flatnonzero(
+        top_candidates == top_candidates.min())[-1]]
+
+    # closest distance to the top before checking the end point of each connection, the end point moves the starting node when it is as close
+    closest_to_top = np.minimum.accumulate(top_candidates)[0::2]
+    moves_starting_node = start_in_largest & (distance_to_top[end_nodes]
+                                              <= closest_to_top)
+
+    # ending node candidates: the first end point, then the start and end point of each connection on the largest subgraph that does not move the starting node
+    bottom_check = start_in_largest & ~moves_starting_node
+    bottom_candidates = np.full((len(connections), 2), np.inf)
+    bottom_candidates[bottom_check] = distance_to_bottom[
+        connections[bottom_check]]
+    bottom_candidates = np.concatenate(
+        [distance_to_bottom[end_nodes[:1]],
+         bottom_candidates.reshape(-1)])
+    ending_index = np.concatenate([
+        end_nodes[:1], connections.reshape(-1)
+    ])[np.flatnonzero(bottom_candidates == bottom_candidates.min())[-1]]
+    return int(starting_index), int(ending_index)
+
+
+def _centerline_path_from_graph(start_end_points_dict: dict = None,
+                                nx_graphs: nx.Graph = None,
+                                largest_subgraph_nodes: list = None,
+                                top_polygon_line: LineString = None,
+                                bottom_polygon_line: LineString = None,
+                                multiple_connections: int = 0,
+                                path_search: str = "breadth_first",
+                                ellipsoid: str = "WGS84"):
+    # Return the starting node, ending node, all possible paths positions, and centerline from an existing Voronoi graph
+    # TESTING TESTING: Show only the end points that have multiple connections (set multiple_connections to 0 during production)
+    start_end_points = [
+        (start_point, end_point)
+        for start_point, end_point_list in start_end_points_dict.items()
+        if len(end_point_list) > multiple_connections
+        for end_point in end_point_list
+    ]
+    # Save all starting and end positions for all possible paths
+    x_ridge_point = [(start_point[0], end_point[0])
+                     for start_point, end_point in start_end_points]
+    y_ridge_point = [(start_point[1], end_point[1])
+                     for start_point, end_point in start_end_points]
+
+    # Distance from each node to the top and bottom of the polygon (calculated once for all nodes)
+    graph_nodes = list(
+        dict.fromkeys(node for start_end_point in start_end_points
+                      for node in start_end_point))
+    node_index = {node: i for i, node in enumerate(graph_nodes)}
+    connections = np.array([[node_index[start_point], node_index[end_point]]
+                            for start_point, end_point in start_end_points],
+                           dtype=np.intp).reshape(-1, 2)
+    node_points = shapely.points(
+        np.asarray(graph_nodes, dtype=np.float64).reshape(-1, 2))
+    distance_to_top = shapely.distance(node_points, top_polygon_line)
+    distance_to_bottom = shapely.distance(node_points, bottom_polygon_line)
+    # Only include nodes on the largest subgraph (that represents the centerline)
+    largest_subgraph_nodes = set(largest_subgraph_nodes)
+    in_largest_subgraph = np.fromiter(
+        (node in largest_subgraph_nodes for node in graph_nodes),
+        dtype=bool,
+        count=len(graph_nodes))
+
+    # Find the starting and ending node based on distance from the top and bottom of the polygon
+    starting_index, ending_index = _starting_ending_node_indices(
+        connections, distance_to_top, distance_to_bottom, in_largest_subgraph)
+
+    if starting_index is None:
         logger.critical(
             "\nCRITICAL ERROR, Polygon too short for the Voronoi diagram generated (no starting node found), unable to plot centerline. Set display_voronoi=True to view vertices. Can typically be fixed by adding more data to expand range"
         )
-        shortest_path_points = None
-    else:
-        shortest_path_points = _networkx_graph_shortest_path(
-            nx_graphs, starting_node, ending_node)
+        return None, None, x_ridge_point, y_ridge_point, None
+
+    starting_node = graph_nodes[starting_index]
+    ending_node = graph_nodes[ending_index]
+    shortest_path_points = _networkx_graph_shortest_path(
+        nx_graphs, starting_node, ending_node, path_search, ellipsoid)
 
     return starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_points
 
 
+def _centerline_path_from_csgraph(node_coordinates: np.ndarray = None,
+                                  connections: np.ndarray = None,
+                                  csgraph: csr_matrix = None,
+                                  largest_subgraph_nodes: np.ndarray = None,
+                                  top_polygon_line: LineString = None,
+                                  bottom_polygon_line: LineString = None,
+                                  path_search: str = "breadth_first"):
+    # Return the starting node, ending node, all possible paths positions, and centerline from an existing sparse graph
+    # The starting/ending node are selected in the same order as _centerline_path_from_graph, with node indices instead of positions
+    x_ridge_point = list(map(tuple, node_coordinates[connections, 0].tolist()))
+    y_ridge_point = list(map(tuple, node_coordinates[connections, 1].tolist()))
+
+    # Distance from each node to the top and bottom of the polygon (calculated once for all nodes)
+    node_points = shapely.points(node_coordinates)
+    distance_to_top = shapely.distance(node_points, top_polygon_line)
+    distance_to_bottom = shapely.distance(node_points, bottom_polygon_line)
+    in_largest_subgraph = np.zeros(len(node_coordinates), dtype=bool)
+    in_largest_subgraph[largest_subgraph_nodes] = True
+
+    starting_index, ending_index = _starting_ending_node_indices(
+        connections, distance_to_top, distance_to_bottom, in_largest_subgraph)
+
+    if starting_index is None:
+        logger.critical(
+            "\nCRITICAL ERROR, Polygon too short for the Voronoi diagram generated (no starting node found), unable to plot centerline. Set display_voronoi=True to view vertices. Can typically be fixed by adding more data to expand range"
+        )
+        return None, None, x_ridge_point, y_ridge_point, None
+
+    shortest_path_indices = _csgraph_shortest_path(csgraph, starting_index,
+                                                   ending_index, path_search)
+    shortest_path_points = None
+    if shortest_path_indices is not None:
+        shortest_path_points = list(
+            map(tuple, node_coordinates[shortest_path_indices].tolist()))
+    return tuple(node_coordinates[starting_index].tolist()), tuple(
+        node_coordinates[ending_index].tolist(
+        )), x_ridge_point, y_ridge_point, shortest_path_points
+
+
+def _bank_tiles(left_bank_coordinates: np.ndarray = None,
+                right_bank_coordinates: np.ndarray = None,
+                tile_size: int = None,
+                tile_overlap: int = None) -> [list, list]:
+    # Split the banks into overlapping tiles along the river, returns the (left, right) banks of each tile and the line across the river in the middle of each overlap
+    # Tiles are measured in points along the longer bank, both banks are split at the same fraction of their length
+    max_bank_len = max(len(left_bank_coordinates), len(right_bank_coordinates))
+
+    def bankLengthFraction(bank_coordinates):
+        # fraction of the total bank length at each point
+        bank_length = np.concatenate(
+            [[0.0],
+             np.cumsum(np.hypot(*np.diff(bank_coordinates, axis=0).T))])
+        return bank_length / bank_length[-1]
+
+    bank_length_fractions = {
+        "left": bankLengthFraction(left_bank_coordinates),
+        "right": bankLengthFraction(right_bank_coordinates)
+    }
+    longer_bank = "left" if len(left_bank_coordinates) >= len(
+        right_bank_coordinates) else "right"
+
+    def bankIndex(bank_name, position):
+        # index on a bank at the same fraction of its length as the position (index) on the longer bank
+        position_fraction = np.interp(position, np.arange(max_bank_len),
+                                      bank_length_fractions[longer_bank])
+        return min(
+            int(
+                np.searchsorted(bank_length_fractions[bank_name],
+                                position_fraction)),
+            len(bank_length_fractions[bank_name]) - 1)
+
+    def bankTile(bank_name, bank_coordinates, tile_start, tile_end):
+        # points on a bank between the start and end positions (inclusive)
+        return bank_coordinates[bankIndex(bank_name, tile_start
+                                          ):bankIndex(bank_name, tile_end) + 1]
+
+    tile_step = tile_size - tile_overlap
+    # the last tile ends at the end of the banks (and overlaps the previous tile by at least tile_overlap)
+    tile_starts = list(range(0, max_bank_len - tile_size,
+                             tile_step)) + [max(max_bank_len - tile_size, 0)]
+
+    bank_tiles = []
+    overlap_lines = []
+    for tile_number, tile_start in enumerate(tile_starts):
+        tile_end = min(tile_start + tile_size, max_bank_len) - 1
+        bank_tiles.append(
+            (bankTile("left", left_bank_coordinates, tile_start, tile_end),
+             bankTile("right", right_bank_coordinates, tile_start, tile_end)))
+        if tile_number + 1 < len(tile_starts):
+            overlap_middle = (tile_starts[tile_number + 1] + tile_end) / 2
+            overlap_lines.append(
+                LineString([
+                    left_bank_coordinates[bankIndex("left", overlap_middle)],
+                    right_bank_coordinates[bankIndex("right", overlap_middle)]
+                ]))
+    return bank_tiles, overlap_lines
+
+
+def _stitch_centerline_tiles(centerline_tiles: list = None,
+                             overlap_lines: list = None) -> list:
+    # Join the centerline of each tile (ordered from the top to the bottom of each tile) into a single centerline
+    # Away from the edges of a tile, the Voronoi vertices of neighboring tiles are identical, so the tiles are
+    # joined at the shared centerline point closest to the middle of the overlap (or the closest pair of points)
+    stitched_centerline = []
+    upper_tile_centerline = centerline_tiles[-1]
+    for tile_number in range(len(centerline_tiles) - 2, -1, -1):
+        lower_tile_centerline = centerline_tiles[tile_number]
+        lower_point_index = {
+            lower_point: i
+            for i, lower_point in enumerate(lower_tile_centerline)
+        }
+        shared_point_indices = [
+            i for i, upper_point in enumerate(upper_tile_centerline)
+            if upper_point in lower_point_index
+        ]
+        if shared_point_indices:
+            distance_to_overlap = shapely.distance(
+                shapely.points(
+                    [upper_tile_centerline[i] for i in shared_point_indices]),
+                overlap_lines[tile_number])
+            upper_cut = shared_point_indices[int(
+                np.argmin(distance_to_overlap))]
+            lower_cut = lower_point_index[upper_tile_centerline[upper_cut]]
+        else:
+            distance_to_lower, closest_lower_point = cKDTree(
+                lower_tile_centerline).query(upper_tile_centerline)
+            upper_cut = int(np.argmin(distance_to_lower))
+            lower_cut = int(closest_lower_point[upper_cut])
+        stitched_centerline.extend(upper_tile_centerline[:upper_cut])
+        upper_tile_centerline = lower_tile_centerline[lower_cut:]
+    stitched_centerline.extend(upper_tile_centerline)
+    return stitched_centerline
+
+
+def _tiled_centerline_path(left_bank_coordinates: np.ndarray = None,
+                           right_bank_coordinates: np.ndarray = None,
+                           tile_size: int = None,
+                           tile_overlap: int = None,
+                           graph_backend: str = "networkx",
+                           ellipsoid: str = "WGS84",
+                           path_search: str = "breadth_first"):
+    # Return the starting node, ending node, all possible paths positions, and centerline found independently for each tile
+    # Only a single tile is held in memory at a time (Voronoi and graph are bounded by the tile size)
+    bank_tiles, overlap_lines = _bank_tiles(left_bank_coordinates,
+                                            right_bank_coordinates, tile_size,
+                                            tile_overlap)
+    x_ridge_point = []
+    y_ridge_point = []
+    centerline_tiles = []
+    for tile_number, (left_tile, right_tile) in enumerate(bank_tiles):
+        tile_name = f"Tile {tile_number + 1}/{len(bank_tiles)}"
+        tile_polygon, tile_top, tile_bottom = centerline_width._generate_polygon(
+            left_tile, right_tile, coord_type=tile_name, ellipsoid=ellipsoid)
+        tile_voronoi = centerline_width._generate_voronoi(left_tile,
+                                                          right_tile,
+                                                          coord_type=tile_name)
+        _, _, tile_x_ridge_point, tile_y_ridge_point, tile_centerline = _centerline_path(
+            tile_voronoi,
+            tile_polygon,
+            tile_top,
+            tile_bottom,
+            graph_backend=graph_backend,
+            ellipsoid=ellipsoid,
+            path_search=path_search)
+        x_ridge_point.extend(tile_x_ridge_point)
+        y_ridge_point.extend(tile_y_ridge_point)
+        if tile_centerline is None:
+            logger.critical(
+                f"\nCRITICAL ERROR, no centerline found for {tile_name}, unable to stitch the centerline. Recommended fix, increase tile_size or tile_overlap"
+            )
+            return None, None, x_ridge_point, y_ridge_point, None
+        centerline_tiles.append(tile_centerline)
+
+    centerline_coordinates = _stitch_centerline_tiles(centerline_tiles,
+                                                      overlap_lines)
+    return centerline_coordinates[0], centerline_coordinates[
+        -1], x_ridge_point, y_ridge_point, centerline_coordinates
+
+
 def _equal_distance_centerline(centerline_coordinates: list = None,
                                equal_distance: int = None,
                                ellipsoid="WGS84") -> list:
@@ -281,10 +654,9 @@ def _smoothed_centerline(river_object=None,
     smoothed_coordinates = list(zip(x_smoothed, y_smoothed))
 
     # Check if smoothed centerline lies outside polygon
-    points_outside_polygon = 0
-    for centerline_point in smoothed_coordinates:
-        if not river_object.bank_polygon.contains(Point(centerline_point)):
-            points_outside_polygon += 1
+    points_outside_polygon = int(
+        np.count_nonzero(~shapely.contains_xy(river_object.bank_polygon,
+                                              x_smoothed, y_smoothed)))
     if points_outside_polygon > 2:
         logger.critical(
             f"\nWARNING: Partially invalid smoothed centerline due to sparse centerline data ({points_outside_polygon} points lie outside the polygon), fix recommendation: rerun CenterlineWidth to create river object with interpolate_n_centerpoints set to {round(len(centerline_coordinates)*2.5)}+\n"
@@ -0,0 +1,394 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      centerlineEngines.py contains the alternative methods (engines) to find the                #
+#      centerline, used instead of the Voronoi graph (centerline_engine)                          #
+#                                                                                                 #
+#      Each engine returns the same outputs as the Voronoi centerline: starting node,             #
+#      ending node, all possible paths (x/y ridge points), and the centerline                     #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _skeleton_centerline_path: backend to find the          #
+#                                              centerline through a skeleton graph of             #
+#                                              nodes and edges (scipy sparse graph)               #
+#                                                                                                 #
+#                                       - _delaunay_centerline_path: backend to find the          #
+#                                              centerline through the midpoints of the            #
+#                                              Delaunay triangles within the polygon              #
+#                                                                                                 #
+#                                       - _segment_voronoi_centerline_path: backend to            #
+#                                              find the centerline through the Voronoi            #
+#                                              ridges between the left and right bank             #
+#                                              segments (sampled by the channel width)            #
+#                                                                                                 #
+#                                       - _raster_cells: number of raster cells that cover        #
+#                                              the bounds of the polygon                          #
+#                                                                                                 #
+#                                       - _raster_centerline_path: backend to find the            #
+#                                              centerline along the ridge of the distance         #
+#                                              transform of the rasterized polygon                #
+#                                                                                                 #
+#                                       - _bank_pairing_centerline_path: backend to find          #
+#                                              the centerline as the midpoints of matched         #
+#                                              left/right bank points                             #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Standard Library Imports
+import logging
+import math
+
+# Related Third Party Imports
+import numpy as np
+from pyproj import Geod
+from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra
+from scipy.spatial import Delaunay, Voronoi
+import shapely
+from shapely.geometry import LineString, Polygon
+
+# Internal Local Imports
+import centerline_width
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+# Maximum number of cells of the raster generated with the default raster_resolution_m (centerline_engine="raster")
+_raster_max_cells = 10000000
+
+
+def _skeleton_centerline_path(node_coordinates: np.ndarray = None,
+                              skeleton_edges: np.ndarray = None,
+                              top_polygon_line: LineString = None,
+                              bottom_polygon_line: LineString = None,
+                              ellipsoid: str = "WGS84"):
+    # Return the starting node, ending node, all possible paths positions, and centerline through a skeleton graph
+    # node_coordinates: (N, 2) array of [longitude, latitude], skeleton_edges: (M, 2) array of node indices
+    node_coordinates = np.asarray(node_coordinates, dtype=np.float64)
+    skeleton_edges = np.asarray(skeleton_edges, dtype=np.intp).reshape(-1, 2)
+    x_ridge_point = list(
+        map(tuple, node_coordinates[skeleton_edges, 0].tolist()))
+    y_ridge_point = list(
+        map(tuple, node_coordinates[skeleton_edges, 1].tolist()))
+
+    if len(skeleton_edges) == 0:
+        logger.critical(
+            "\nCRITICAL ERROR, Polygon too short for the skeleton generated (no starting node found), unable to plot centerline. Can typically be fixed by adding more data to expand range"
+        )
+        return None, None, x_ridge_point, y_ridge_point, None
+
+    # edges weighted by the distance (meters) between the nodes
+    _, _, edge_length = Geod(ellps=ellipsoid).inv(
+        node_coordinates[skeleton_edges[:, 0],
+                         0], node_coordinates[skeleton_edges[:, 0], 1],
+        node_coordinates[skeleton_edges[:, 1],
+                         0], node_coordinates[skeleton_edges[:, 1], 1])
+    skeleton_graph = coo_matrix(
+        (edge_length, (skeleton_edges[:, 0], skeleton_edges[:, 1])),
+        shape=(len(node_coordinates), len(node_coordinates))).tocsr()
+
+    # starting/ending node: nodes in the largest connected graph closest to the top/bottom of the polygon
+    _, node_labels = connected_components(skeleton_graph, directed=False)
+    edge_labels = node_labels[skeleton_edges[:, 0]]
+    largest_graph = np.bincount(edge_labels).argmax()
+    largest_graph_nodes = np.flatnonzero(node_labels == largest_graph)
+    largest_graph_points = shapely.points(
+        node_coordinates[largest_graph_nodes])
+    starting_index = largest_graph_nodes[np.argmin(
+        shapely.distance(largest_graph_points, top_polygon_line))]
+    ending_index = largest_graph_nodes[np.argmin(
+        shapely.distance(largest_graph_points, bottom_polygon_line))]
+    starting_node = tuple(node_coordinates[starting_index].tolist())
+    ending_node = tuple(node_coordinates[ending_index].tolist())
+
+    # shortest path from the starting node to the ending node
+    _, predecessors = dijkstra(skeleton_graph,
+                               directed=False,
+                               indices=starting_index,
+                               return_predecessors=True)
+    path_indices = [ending_index]
+    while path_indices[-1] != starting_index:
+        path_indices.append(predecessors[path_indices[-1]])
+    logger.info("[SUCCESS] Valid centerline path found")
+    shortest_path_points = list(
+        map(tuple, node_coordinates[path_indices[::-1]].tolist()))
+
+    return starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_points
+
+
+def _delaunay_centerline_path(left_bank_coordinates: np.ndarray = None,
+                              right_bank_coordinates: np.ndarray = None,
+                              river_polygon: Polygon = None,
+                              top_polygon_line: LineString = None,
+                              bottom_polygon_line: LineString = None,
+                              ellipsoid: str = "WGS84"):
+    # Return the starting node, ending node, all possible paths positions, and centerline from the Delaunay triangulation of the banks
+    # Nodes are the midpoints of the edges shared by two triangles within the polygon, connected through each triangle
+    all_banks_points = np.concatenate([
+        np.asarray(left_bank_coordinates, dtype=np.float64),
+        np.asarray(right_bank_coordinates, dtype=np.float64)
+    ])
+    river_triangles = Delaunay(all_banks_points)
+    logger.info("[SUCCESS] Delaunay triangulation generated")
+
+    # only include triangles with the center of the triangle within the polygon
+    triangle_centers = all_banks_points[river_triangles.simplices].mean(axis=1)
+    triangle_in_polygon = shapely.contains_xy(river_polygon,
+                                              triangle_centers[:, 0],
+                                              triangle_centers[:, 1])
+
+    # edge k of a triangle is opposite to vertex k, shared with neighbors[k] (-1 at the edge of the triangulation)
+    triangle_neighbors = river_triangles.neighbors
+    internal_edge = triangle_in_polygon[:, np.newaxis] & (
+        triangle_neighbors >= 0) & np.append(triangle_in_polygon,
+                                             False)[triangle_neighbors]
+    edge_vertices = np.sort(np.stack([
+        river_triangles.simplices[:, [1, 2]],
+        river_triangles.simplices[:, [0, 2]], river_triangles.simplices[:,
+                                                                        [0, 1]]
+    ],
+                                     axis=1),
+                            axis=2)
+
+    # one node for each internal edge (shared by two triangles), at the middle of the edge
+    unique_edges, edge_node = np.unique(edge_vertices[internal_edge],
+                                        axis=0,
+                                        return_inverse=True)
+    node_coordinates = all_banks_points[unique_edges].mean(axis=1)
+    triangle_edge_node = np.full(internal_edge.shape, -1, dtype=np.intp)
+    triangle_edge_node[internal_edge] = edge_node.reshape(-1)
+
+    # connect the nodes of the internal edges of each triangle (pairs of edges within a triangle)
+    skeleton_edges = np.concatenate([
+        triangle_edge_node[:, [first_edge, second_edge]]
+        for first_edge, second_edge in [(0, 1), (0, 2), (1, 2)]
+    ])
+    skeleton_edges = skeleton_edges[(skeleton_edges >= 0).all(axis=1)]
+
+    return _skeleton_centerline_path(node_coordinates, skeleton_edges,
+                                     top_polygon_line, bottom_polygon_line,
+                                     ellipsoid)
+
+
+def _segment_voronoi_centerline_path(left_bank_coordinates: np.ndarray = None,
+                                     right_bank_coordinates: np.ndarray = None,
+                                     river_polygon: Polygon = None,
+                                     top_polygon_line: LineString = None,
+                                     bottom_polygon_line: LineString = None,
+                                     segment_width_ratio: float = 0.5,
+                                     ellipsoid: str = "WGS84"):
+    # Return the starting node, ending node, all possible paths positions, and centerline from the Voronoi diagram of the bank segments
+    # Sites are sampled along each bank segment every segment_width_ratio * the local channel width (the bank coordinates are not changed)
+    # Only ridges between a left bank site and a right bank site are kept: the ridges between sites of the same bank (along a segment) are removed
+    right_bank_sites, left_bank_sites = centerline_width._interpolate_between_points(
+        left_bank_coordinates,
+        right_bank_coordinates,
+        interpolate_width_ratio=segment_width_ratio,
+        ellipsoid=ellipsoid)
+    all_banks_sites = np.concatenate([left_bank_sites, right_bank_sites])
+    right_bank_site = np.arange(len(all_banks_sites)) >= len(left_bank_sites)
+    river_voronoi = Voronoi(all_banks_sites)
+    logger.info(
+        f"[SUCCESS] Voronoi diagram generated from {len(all_banks_sites)} bank segment sites"
+    )
+
+    # ridges between the left and right bank with both vertices (not at infinity) within the polygon
+    ridge_vertices = np.asarray(river_voronoi.ridge_vertices,
+                                dtype=np.intp).reshape(-1, 2)
+    ridge_sites = np.asarray(river_voronoi.ridge_points, dtype=np.intp)
+    between_banks = (right_bank_site[ridge_sites[:, 0]] != right_bank_site[
+        ridge_sites[:, 1]]) & (ridge_vertices >= 0).all(axis=1)
+    ridge_vertices = ridge_vertices[between_banks]
+    vertex_in_polygon = shapely.contains_xy(river_polygon,
+                                            river_voronoi.vertices[:, 0],
+                                            river_voronoi.vertices[:, 1])
+    ridge_vertices = ridge_vertices[vertex_in_polygon[ridge_vertices].all(
+        axis=1)]
+
+    return _skeleton_centerline_path(river_voronoi.vertices, ridge_vertices,
+                                     top_polygon_line, bottom_polygon_line,
+                                     ellipsoid)
+
+
+def _raster_cells(bounds: tuple = None,
+                  raster_resolution_m: float = None) -> int:
+    # Return the number of raster cells that cover the bounds (min_x, min_y, max_x, max_y) of the polygon
+    # same number of cells as np.arange(min, max + raster_resolution_m, raster_resolution_m) in each direction
+    min_x, min_y, max_x, max_y = bounds
+    return math.ceil((max_x - min_x) / raster_resolution_m +
+                     1) * math.ceil((max_y - min_y) / raster_resolution_m + 1)
+
+
+def _raster_centerline_path(left_bank_coordinates: np.ndarray = None,
+                            right_bank_coordinates: np.ndarray = None,
+                            river_polygon: Polygon = None,
+                            top_bank: LineString = None,
+                            bottom_bank: LineString = None,
+                            raster_resolution_m: float = None,
+                            ellipsoid: str = "WGS84"):
+    # Return the starting node, ending node, all possible paths positions (none for a raster), centerline, and number of raster cells
+    # The polygon (relative distance from the first point of the left bank) is rasterized at raster_resolution_m meters and the
+    # centerline follows the ridge of the distance to the banks, from the top to the bottom of the polygon
+    first_point = np.asarray(left_bank_coordinates, dtype=np.float64)[0]
+    min_x, min_y, max_x, max_y = river_polygon.bounds
+    if raster_resolution_m is None:
+        # default resolution: a tenth of the median channel width, coarsened to limit the size of the raster of long rivers
+        raster_resolution_m = float(
+            np.median(
+                centerline_width._local_channel_width(left_bank_coordinates,
+                                                      right_bank_coordinates,
+                                                      ellipsoid))) / 10
+        if _raster_cells(river_polygon.bounds,
+                         raster_resolution_m) > _raster_max_cells:
+            coarse_resolution_m = np.sqrt(
+                (max_x - min_x) * (max_y - min_y) / _raster_max_cells)
+            while _raster_cells(river_polygon.bounds,
+                                coarse_resolution_m) > _raster_max_cells:
+                coarse_resolution_m *= 1.01
+            logger.warning(
+                f"WARNING, [raster_resolution_m]: Default resolution of {raster_resolution_m} meters generates more than {_raster_max_cells} cells, coarsened to {coarse_resolution_m} meters (set raster_resolution_m to use a finer resolution)"
+            )
+            raster_resolution_m = coarse_resolution_m
+    elif _raster_cells(river_polygon.bounds,
+                       raster_resolution_m) > _raster_max_cells:
+        logger.warning(
+            f"WARNING, [raster_resolution_m]: Resolution of {raster_resolution_m} meters generates more than {_raster_max_cells} cells, will use a large amount of memory"
+        )
+
+    # raster cells with the center of the cell within the polygon
+    cell_x = np.arange(min_x, max_x + raster_resolution_m, raster_resolution_m)
+    cell_y = np.arange(min_y, max_y + raster_resolution_m, raster_resolution_m)
+    raster_cells = len(cell_x) * len(cell_y)
+    logger.info(
+        f"[PROCESSING] Rasterizing polygon at {raster_resolution_m} meters ({len(cell_y)} x {len(cell_x)} cells)"
+    )
+    cell_in_polygon = shapely.contains_xy(river_polygon, cell_x[np.newaxis, :],
+                                          cell_y[:, np.newaxis])
+    # distance (meters) from each cell to the closest cell outside the polygon
+    distance_to_bank = ndimage.distance_transform_edt(
+        np.pad(cell_in_polygon, 1))[1:-1, 1:-1] * raster_resolution_m
+
+    # graph of neighboring cells within the polygon (8 neighbors), cost of each step is high close to the banks to follow the ridge
+    cell_index = np.full(cell_in_polygon.shape, -1, dtype=np.intp)
+    cell_index[cell_in_polygon] = np.arange(np.count_nonzero(cell_in_polygon))
+    rows, columns = cell_in_polygon.shape
+    cell_edges = []
+    edge_costs = []
+    for row_step, column_step in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+        start_rows = slice(0, rows - row_step)
+        end_rows = slice(row_step, rows)
+        start_columns = slice(max(-column_step, 0),
+                              columns - max(column_step, 0))
+        end_columns = slice(max(column_step, 0),
+                            columns - max(-column_step, 0))
+        start_index = cell_index[start_rows, start_columns]
+        end_index = cell_index[end_rows, end_columns]
+        neighbors = (start_index >= 0) & (end_index >= 0)
+        step_distance = np.hypot(row_step, column_step) * raster_resolution_m
+        average_distance = (distance_to_bank[start_rows, start_columns] +
+                            distance_to_bank[end_rows, end_columns]) / 2
+        cell_edges.append(
+            np.column_stack([start_index[neighbors], end_index[neighbors]]))
+        edge_costs.append(step_distance / average_distance[neighbors]**2)
+    cell_edges = np.concatenate(cell_edges)
+    raster_graph = coo_matrix(
+        (np.concatenate(edge_costs), (cell_edges[:, 0], cell_edges[:, 1])),
+        shape=(cell_index.max() + 1, cell_index.max() + 1)).tocsr()
+
+    # starting/ending cell: cells closest to the middle of the top/bottom of the polygon
+    cell_positions = np.column_stack([
+        cell_x[np.nonzero(cell_in_polygon)[1]],
+        cell_y[np.nonzero(cell_in_polygon)[0]]
+    ])
+    if len(cell_positions) == 0:
+        logger.critical(
+            "\nCRITICAL ERROR, Polygon too small for the raster generated (no cells within the polygon), unable to plot centerline. Recommended fix, decrease raster_resolution_m"
+        )
+        return None, None, [], [], None, raster_cells
+    top_middle = np.asarray(top_bank.centroid.coords[0])
+    bottom_middle = np.asarray(bottom_bank.centroid.coords[0])
+    starting_index = int(np.argmin(np.hypot(*(cell_positions - top_middle).T)))
+    ending_index = int(np.argmin(np.hypot(*(cell_positions -
+                                            bottom_middle).T)))
+
+    # lowest cost path from the starting cell to the ending cell
+    path_cost, predecessors = dijkstra(raster_graph,
+                                       directed=False,
+                                       indices=starting_index,
+                                       return_predecessors=True)
+    starting_node, ending_node = map(
+        tuple,
+        centerline_width._lon_lat_from_relative_array(
+            first_point, cell_positions[[starting_index, ending_index]],
+            ellipsoid).tolist())
+    if np.isinf(path_cost[ending_index]):
+        logger.info(
+            "[FAILED]  No direct path found from starting node to ending node. Recommended fix, rerun CenterlineWidth: decrease raster_resolution_m"
+        )
+        return starting_node, ending_node, [], [], None, raster_cells
+    path_indices = [ending_index]
+    while path_indices[-1] != starting_index:
+        path_indices.append(predecessors[path_indices[-1]])
+    logger.info("[SUCCESS] Valid centerline path found")
+    shortest_path_points = list(
+        map(
+            tuple,
+            centerline_width._lon_lat_from_relative_array(
+                first_point, cell_positions[path_indices[::-1]],
+                ellipsoid).tolist()))
+
+    return starting_node, ending_node, [], [], shortest_path_points, raster_cells
+
+
+def _bank_pairing_centerline_path(left_bank_coordinates: np.ndarray = None,
+                                  right_bank_coordinates: np.ndarray = None):
+    # Return the starting node, ending node, all possible paths positions (none for paired banks), and centerline from matched bank points
+    # Both banks are walked together from the start to the end (two pointers): each step moves along the left bank, the right bank,
+    # or both, whichever pair of points is closest, and the centerline is the middle of each matched pair (from the top to the bottom)
+    left_bank_coordinates = np.asarray(left_bank_coordinates, dtype=np.float64)
+    right_bank_coordinates = np.asarray(right_bank_coordinates,
+                                        dtype=np.float64)
+    # longitude scaled by the latitude (close to equal distances)
+    longitude_scale = np.cos(
+        np.radians(
+            np.mean(
+                np.concatenate([left_bank_coordinates,
+                                right_bank_coordinates])[:, 1])))
+    left_x, left_y = (left_bank_coordinates * [longitude_scale, 1]).T.tolist()
+    right_x, right_y = (right_bank_coordinates *
+                        [longitude_scale, 1]).T.tolist()
+    left_end = len(left_x) - 1
+    right_end = len(right_x) - 1
+
+    def pairDistance(left_index, right_index):
+        return (left_x[left_index] - right_x[right_index])**2 + (
+            left_y[left_index] - right_y[right_index])**2
+
+    left_index = 0
+    right_index = 0
+    matched_pairs = [(0, 0)]
+    while left_index < left_end or right_index < right_end:
+        next_pairs = []
+        if left_index < left_end and right_index < right_end:
+            next_pairs.append((left_index + 1, right_index + 1))
+        if left_index < left_end:
+            next_pairs.append((left_index + 1, right_index))
+        if right_index < right_end:
+            next_pairs.append((left_index, right_index + 1))
+        left_index, right_index = min(
+            next_pairs, key=lambda pair: pairDistance(pair[0], pair[1]))
+        matched_pairs.append((left_index, right_index))
+
+    matched_pairs = np.asarray(matched_pairs[::-1], dtype=np.intp)
+    centerline_coordinates = (left_bank_coordinates[matched_pairs[:, 0]] +
+                              right_bank_coordinates[matched_pairs[:, 1]]) / 2
+    logger.info("[SUCCESS] Valid centerline path found")
+    shortest_path_points = list(map(tuple, centerline_coordinates.tolist()))
+
+    return shortest_path_points[0], shortest_path_points[
+        -1], [], [], shortest_path_points
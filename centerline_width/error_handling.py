@@ -10,6 +10,11 @@
 # Standard Library Imports
 from io import StringIO
 import logging
+import os
+
+# Related Third Party Imports
+import numpy as np
+import pandas as pd
 
 # Internal Local Imports
 import centerline_width
@@ -540,9 +545,24 @@ def _error_handling_centerline_width(csv_data: str = None,
                                      cutoff: int = None,
                                      interpolate_data: bool = None,
                                      interpolate_n: int = None,
+                                     interpolate_spacing_m: [int,
+                                                             float] = None,
+                                     interpolate_width_ratio: [int,
+                                                               float] = None,
+                                     simplify_tolerance_m: [int, float] = None,
+                                     auto_orient: bool = None,
                                      interpolate_n_centerpoints: int = None,
                                      equal_distance: [int, float] = None,
-                                     ellipsoid: str = None) -> None:
+                                     ellipsoid: str = None,
+                                     tile_size: int = None,
+                                     tile_overlap: int = None,
+                                     centerline_engine: str = None,
+                                     raster_resolution_m: [int, float] = None,
+                                     graph_backend: str = None,
+                                     path_search: str = None,
+                                     cache_dir: str = None,
+                                     cache_max_mb: int = None,
+                                     outputs: list = None) -> None:
     # Error Handling for CenterlineWidth()
     if csv_data is None:
         raise ValueError("[csv_data]: Requires csv_data location")
@@ -553,6 +573,185 @@ def _error_handling_centerline_width(csv_data: str = None,
                 f"[csv_data]: Must be a str, current type = '{type(csv_data)}'"
             )
 
+    _error_handling_river_parameters(
+        cutoff=cutoff,
+        interpolate_data=interpolate_data,
+        interpolate_n=interpolate_n,
+        interpolate_spacing_m=interpolate_spacing_m,
+        interpolate_width_ratio=interpolate_width_ratio,
+        simplify_tolerance_m=simplify_tolerance_m,
+        auto_orient=auto_orient,
+        interpolate_n_centerpoints=interpolate_n_centerpoints,
+        equal_distance=equal_distance,
+        ellipsoid=ellipsoid,
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        centerline_engine=centerline_engine,
+        raster_resolution_m=raster_resolution_m,
+        graph_backend=graph_backend,
+        path_search=path_search,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb,
+        outputs=outputs)
+
+
+def _error_handling_from_dataframe(dataframe: pd.DataFrame = None,
+                                   river_name: str = None,
+                                   cutoff: int = None,
+                                   interpolate_data: bool = None,
+                                   interpolate_n: int = None,
+                                   interpolate_spacing_m: [int, float] = None,
+                                   interpolate_width_ratio: [int,
+                                                             float] = None,
+                                   simplify_tolerance_m: [int, float] = None,
+                                   auto_orient: bool = None,
+                                   interpolate_n_centerpoints: int = None,
+                                   equal_distance: [int, float] = None,
+                                   ellipsoid: str = None,
+                                   tile_size: int = None,
+                                   tile_overlap: int = None,
+                                   centerline_engine: str = None,
+                                   raster_resolution_m: [int, float] = None,
+                                   graph_backend: str = None,
+                                   path_search: str = None,
+                                   cache_dir: str = None,
+                                   cache_max_mb: int = None,
+                                   outputs: list = None) -> None:
+    # Error Handling for CenterlineWidth.from_dataframe()
+    if dataframe is None:
+        raise ValueError("[dataframe]: Requires a pandas DataFrame")
+    else:
+        if not isinstance(dataframe, pd.DataFrame):
+            raise ValueError(
+                f"[dataframe]: Must be a pandas DataFrame, current type = '{type(dataframe)}'"
+            )
+        else:
+            missing_columns = [
+                column for column in ["llat", "llon", "rlat", "rlon"]
+                if column not in dataframe.columns
+            ]
+            if missing_columns:
+                raise ValueError(
+                    f"[dataframe]: Must contain the columns ['llat', 'llon', 'rlat', 'rlon'], missing = {missing_columns}"
+                )
+
+    if river_name is not None and type(river_name) != str:
+        raise ValueError(
+            f"[river_name]: Must be a str, current type = '{type(river_name)}'"
+        )
+
+    _error_handling_river_parameters(
+        cutoff=cutoff,
+        interpolate_data=interpolate_data,
+        interpolate_n=interpolate_n,
+        interpolate_spacing_m=interpolate_spacing_m,
+        interpolate_width_ratio=interpolate_width_ratio,
+        simplify_tolerance_m=simplify_tolerance_m,
+        auto_orient=auto_orient,
+        interpolate_n_centerpoints=interpolate_n_centerpoints,
+        equal_distance=equal_distance,
+        ellipsoid=ellipsoid,
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        centerline_engine=centerline_engine,
+        raster_resolution_m=raster_resolution_m,
+        graph_backend=graph_backend,
+        path_search=path_search,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb,
+        outputs=outputs)
+
+
+def _error_handling_from_arrays(left_bank_coordinates: np.ndarray = None,
+                                right_bank_coordinates: np.ndarray = None,
+                                river_name: str = None,
+                                cutoff: int = None,
+                                interpolate_data: bool = None,
+                                interpolate_n: int = None,
+                                interpolate_spacing_m: [int, float] = None,
+                                interpolate_width_ratio: [int, float] = None,
+                                simplify_tolerance_m: [int, float] = None,
+                                auto_orient: bool = None,
+                                interpolate_n_centerpoints: int = None,
+                                equal_distance: [int, float] = None,
+                                ellipsoid: str = None,
+                                tile_size: int = None,
+                                tile_overlap: int = None,
+                                centerline_engine: str = None,
+                                raster_resolution_m: [int, float] = None,
+                                graph_backend: str = None,
+                                path_search: str = None,
+                                cache_dir: str = None,
+                                cache_max_mb: int = None,
+                                outputs: list = None) -> None:
+    # Error Handling for CenterlineWidth.from_arrays()
+    for bank_name, bank_coordinates in [
+        ("left_bank_coordinates", left_bank_coordinates),
+        ("right_bank_coordinates", right_bank_coordinates)
+    ]:
+        if bank_coordinates is None:
+            raise ValueError(
+                f"[{bank_name}]: Requires an array of [longitude, latitude] coordinates"
+            )
+        if not isinstance(bank_coordinates, (np.ndarray, list, tuple)):
+            raise ValueError(
+                f"[{bank_name}]: Must be a numpy array, current type = '{type(bank_coordinates)}'"
+            )
+        bank_shape = np.shape(bank_coordinates)
+        if len(bank_shape) != 2 or bank_shape[1] != 2:
+            raise ValueError(
+                f"[{bank_name}]: Must be an array with the shape (N, 2), current shape = '{bank_shape}'"
+            )
+
+    if river_name is not None and type(river_name) != str:
+        raise ValueError(
+            f"[river_name]: Must be a str, current type = '{type(river_name)}'"
+        )
+
+    _error_handling_river_parameters(
+        cutoff=cutoff,
+        interpolate_data=interpolate_data,
+        interpolate_n=interpolate_n,
+        interpolate_spacing_m=interpolate_spacing_m,
+        interpolate_width_ratio=interpolate_width_ratio,
+        simplify_tolerance_m=simplify_tolerance_m,
+        auto_orient=auto_orient,
+        interpolate_n_centerpoints=interpolate_n_centerpoints,
+        equal_distance=equal_distance,
+        ellipsoid=ellipsoid,
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        centerline_engine=centerline_engine,
+        raster_resolution_m=raster_resolution_m,
+        graph_backend=graph_backend,
+        path_search=path_search,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb,
+        outputs=outputs)
+
+
+def _error_handling_river_parameters(cutoff: int = None,
+                                     interpolate_data: bool = None,
+                                     interpolate_n: int = None,
+                                     interpolate_spacing_m: [int,
+                                                             float] = None,
+                                     interpolate_width_ratio: [int,
+                                                               float] = None,
+                                     simplify_tolerance_m: [int, float] = None,
+                                     auto_orient: bool = None,
+                                     interpolate_n_centerpoints: int = None,
+                                     equal_distance: [int, float] = None,
+                                     ellipsoid: str = None,
+                                     tile_size: int = None,
+                                     tile_overlap: int = None,
+                                     centerline_engine: str = None,
+                                     raster_resolution_m: [int, float] = None,
+                                     graph_backend: str = None,
+                                     path_search: str = None,
+                                     cache_dir: str = None,
+                                     cache_max_mb: int = None,
+                                     outputs: list = None) -> None:
+    # Error Handling for the options shared by CenterlineWidth(), from_dataframe(), and from_arrays()
     if cutoff is not None:
         if type(cutoff) != int:
             raise ValueError(
@@ -572,6 +771,56 @@ def _error_handling_centerline_width(csv_data: str = None,
                 "WARNING, [interpolate_n]: Setting interpolate_n above 15 will cause the code to execute exponentially slower"
             )
 
+    if interpolate_spacing_m is not None:
+        if type(interpolate_spacing_m) != int and type(
+                interpolate_spacing_m) != float:
+            raise ValueError(
+                f"[interpolate_spacing_m]: Must be a int or float, current type = '{type(interpolate_spacing_m)}'"
+            )
+        if interpolate_spacing_m <= 0:
+            raise ValueError(
+                f"[interpolate_spacing_m]: Must be a positive value, greater than 0, currently = '{interpolate_spacing_m}'"
+            )
+        if not interpolate_data:
+            raise ValueError(
+                "[interpolate_spacing_m]: Requires interpolate_data=True to add points between the bank coordinates"
+            )
+
+    if interpolate_width_ratio is not None:
+        if type(interpolate_width_ratio) != int and type(
+                interpolate_width_ratio) != float:
+            raise ValueError(
+                f"[interpolate_width_ratio]: Must be a int or float, current type = '{type(interpolate_width_ratio)}'"
+            )
+        if interpolate_width_ratio <= 0:
+            raise ValueError(
+                f"[interpolate_width_ratio]: Must be a positive value, greater than 0, currently = '{interpolate_width_ratio}'"
+            )
+        if not interpolate_data:
+            raise ValueError(
+                "[interpolate_width_ratio]: Requires interpolate_data=True to add points between the bank coordinates"
+            )
+        if interpolate_spacing_m is not None:
+            raise ValueError(
+                "[interpolate_width_ratio]: Cannot be set with interpolate_spacing_m, only one spacing can be used to add points between the bank coordinates"
+            )
+
+    if simplify_tolerance_m is not None:
+        if type(simplify_tolerance_m) != int and type(
+                simplify_tolerance_m) != float:
+            raise ValueError(
+                f"[simplify_tolerance_m]: Must be a int or float, current type = '{type(simplify_tolerance_m)}'"
+            )
+        if simplify_tolerance_m <= 0:
+            raise ValueError(
+                f"[simplify_tolerance_m]: Must be a positive value, greater than 0, currently = '{simplify_tolerance_m}'"
+            )
+
+    if type(auto_orient) != bool:
+        raise ValueError(
+            f"[auto_orient]: Must be a bool, current type = '{type(auto_orient)}'"
+        )
+
     if interpolate_n_centerpoints is not None:
         if type(interpolate_n_centerpoints) != int:
             raise ValueError(
@@ -605,6 +854,241 @@ def _error_handling_centerline_width(csv_data: str = None,
                 f"[ellipsoid]: Must be an available option in {ellipsoid_options}, current option = '{ellipsoid}'"
             )
 
+    if tile_size is not None:
+        if type(tile_size) != int:
+            raise ValueError(
+                f"[tile_size]: Must be a int, current type = '{type(tile_size)}'"
+            )
+        if tile_size < 10:
+            raise ValueError(
+                f"[tile_size]: Must be greater than 9, currently = '{tile_size}'"
+            )
+
+    if tile_overlap is not None:
+        if type(tile_overlap) != int:
+            raise ValueError(
+                f"[tile_overlap]: Must be a int, current type = '{type(tile_overlap)}'"
+            )
+        if tile_overlap <= 0:
+            raise ValueError(
+                f"[tile_overlap]: Must be a positive value, greater than 0, currently = '{tile_overlap}'"
+            )
+        if tile_size is None:
+            raise ValueError(
+                "[tile_overlap]: Requires tile_size to split the river into tiles"
+            )
+        if tile_overlap >= tile_size:
+            raise ValueError(
+                f"[tile_overlap]: Must be less than tile_size, currently = '{tile_overlap}' >= '{tile_size}'"
+            )
+
+    centerline_engine_options = [
+        "voronoi", "delaunay", "raster", "bank_pairing", "segment_voronoi"
+    ]
+    if type(centerline_engine) != str:
+        raise ValueError(
+            f"[centerline_engine]: Must be a str, current type = '{type(centerline_engine)}'"
+        )
+    else:
+        if centerline_engine not in centerline_engine_options:
+            raise ValueError(
+                f"[centerline_engine]: Must be an available option in {centerline_engine_options}, current option = '{centerline_engine}'"
+            )
+        if centerline_engine != "voronoi" and tile_size is not None:
+            raise ValueError(
+                f"[centerline_engine]: tile_size is only available with centerline_engine='voronoi', current option = '{centerline_engine}'"
+            )
+
+    if raster_resolution_m is not None:
+        if type(raster_resolution_m) != int and type(
+                raster_resolution_m) != float:
+            raise ValueError(
+                f"[raster_resolution_m]: Must be a int or float, current type = '{type(raster_resolution_m)}'"
+            )
+        if raster_resolution_m <= 0:
+            raise ValueError(
+                f"[raster_resolution_m]: Must be a positive value, greater than 0, currently = '{raster_resolution_m}'"
+            )
+        if centerline_engine != "raster":
+            raise ValueError(
+                "[raster_resolution_m]: Requires centerline_engine='raster' to rasterize the polygon"
+            )
+
+    graph_backend_options = ["networkx", "csgraph"]
+    if type(graph_backend) != str:
+        raise ValueError(
+            f"[graph_backend]: Must be a str, current type = '{type(graph_backend)}'"
+        )
+    else:
+        if graph_backend not in graph_backend_options:
+            raise ValueError(
+                f"[graph_backend]: Must be an available option in {graph_backend_options}, current option = '{graph_backend}'"
+            )
+        if graph_backend != "networkx" and centerline_engine != "voronoi":
+            raise ValueError(
+                f"[graph_backend]: Requires centerline_engine='voronoi' to search the Voronoi graph, current option = '{centerline_engine}'"
+            )
+
+    path_search_options = ["breadth_first", "astar"]
+    if type(path_search) != str:
+        raise ValueError(
+            f"[path_search]: Must be a str, current type = '{type(path_search)}'"
+        )
+    else:
+        if path_search not in path_search_options:
+            raise ValueError(
+                f"[path_search]: Must be an available option in {path_search_options}, current option = '{path_search}'"
+            )
+        if path_search != "breadth_first" and centerline_engine != "voronoi":
+            raise ValueError(
+                f"[path_search]: Requires centerline_engine='voronoi' to search the Voronoi graph, current option = '{centerline_engine}'"
+            )
+
+    if cache_dir is not None:
+        if type(cache_dir) != str:
+            raise ValueError(
+                f"[cache_dir]: Must be a str, current type = '{type(cache_dir)}'"
+            )
+
+    if cache_max_mb is not None:
+        if type(cache_max_mb) != int:
+            raise ValueError(
+                f"[cache_max_mb]: Must be a int, current type = '{type(cache_max_mb)}'"
+            )
+        if cache_max_mb <= 0:
+            raise ValueError(
+                f"[cache_max_mb]: Must be a positive value, greater than 0, currently = '{cache_max_mb}'"
+            )
+
+    if outputs is not None:
+        if type(outputs) != list:
+            raise ValueError(
+                f"[outputs]: Must be a list, current type = '{type(outputs)}'")
+        else:
+            output_options = []
+            for stage_name in centerline_width.river_stages:
+                output_options.extend(
+                    centerline_width._stage_output_names(stage_name))
+            for output_name in outputs:
+                if output_name not in output_options:
+                    raise ValueError(
+                        f"[outputs]: Must be an available option in {output_options}, current option = '{output_name}'"
+                    )
+
+
+def _error_handling_run_stage(stage_name: str = None,
+                              stage_function=None) -> None:
+    # Error Handling for CenterlineWidth.run_stage()
+    if stage_name is None:
+        raise ValueError("[stage_name]: Requires a stage name")
+    else:
+        if type(stage_name) != str:
+            raise ValueError(
+                f"[stage_name]: Must be a str, current type = '{type(stage_name)}'"
+            )
+        else:
+            stage_options = list(centerline_width.river_stages.keys())
+            if stage_name not in stage_options:
+                raise ValueError(
+                    f"[stage_name]: Must be an available option in {stage_options}, current option = '{stage_name}'"
+                )
+
+    if stage_function is not None and not callable(stage_function):
+        raise ValueError(
+            f"[stage_function]: Must be a function, current type = '{type(stage_function)}'"
+        )
+
+
+def _error_handling_save_river(path: str = None) -> None:
+    # Error Handling for CenterlineWidth.save()
+    if path is None:
+        raise ValueError("\nCRITICAL ERROR, [path]: Requires npz filename")
+    else:
+        if type(path) != str:
+            raise ValueError(
+                f"[path]: Must be a str, current type = '{type(path)}'")
+        else:
+            if not path.lower().endswith(".npz"):
+                raise ValueError(
+                    f"[path]: Extension must be a .npz file, current extension = '{os.path.splitext(path)[1]}'"
+                )
+
+
+def _error_handling_load_river(path: str = None) -> None:
+    # Error Handling for CenterlineWidth.load()
+    if path is None:
+        raise ValueError("\nCRITICAL ERROR, [path]: Requires npz filename")
+    else:
+        if type(path) != str:
+            raise ValueError(
+                f"[path]: Must be a str, current type = '{type(path)}'")
+
+
+## Error Handling: batchProcessing.py
+def _error_handling_process_many(paths: list = None,
+                                 workers: int = None,
+                                 outputs: list = None,
+                                 cutoff: int = None,
+                                 interpolate_data: bool = None,
+                                 interpolate_n: int = None,
+                                 interpolate_spacing_m: [int, float] = None,
+                                 interpolate_width_ratio: [int, float] = None,
+                                 simplify_tolerance_m: [int, float] = None,
+                                 auto_orient: bool = None,
+                                 interpolate_n_centerpoints: int = None,
+                                 equal_distance: [int, float] = None,
+                                 ellipsoid: str = None,
+                                 tile_size: int = None,
+                                 tile_overlap: int = None,
+                                 centerline_engine: str = None,
+                                 raster_resolution_m: [int, float] = None,
+                                 graph_backend: str = None,
+                                 path_search: str = None,
+                                 cache_dir: str = None,
+                                 cache_max_mb: int = None) -> None:
+    # Error Handling for process_many() and process_many_iter()
+    if paths is None:
+        raise ValueError("[paths]: Requires a list of csv file locations")
+    else:
+        if type(paths) != list:
+            raise ValueError(
+                f"[paths]: Must be a list, current type = '{type(paths)}'")
+        for csv_data in paths:
+            if type(csv_data) != str:
+                raise ValueError(
+                    f"[paths]: Must be a list of str, current type = '{type(csv_data)}'"
+                )
+
+    if workers is not None:
+        if type(workers) != int:
+            raise ValueError(
+                f"[workers]: Must be a int, current type = '{type(workers)}'")
+        if workers <= 0:
+            raise ValueError(
+                f"[workers]: Must be a positive value, greater than 0, currently = '{workers}'"
+            )
+
+    _error_handling_river_parameters(
+        cutoff=cutoff,
+        interpolate_data=interpolate_data,
+        interpolate_n=interpolate_n,
+        interpolate_spacing_m=interpolate_spacing_m,
+        interpolate_width_ratio=interpolate_width_ratio,
+        simplify_tolerance_m=simplify_tolerance_m,
+        auto_orient=auto_orient,
+        interpolate_n_centerpoints=interpolate_n_centerpoints,
+        equal_distance=equal_distance,
+        ellipsoid=ellipsoid,
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        centerline_engine=centerline_engine,
+        raster_resolution_m=raster_resolution_m,
+        graph_backend=graph_backend,
+        path_search=path_search,
+        cache_dir=cache_dir,
+        cache_max_mb=cache_max_mb,
+        outputs=outputs)
+
 
 ## Error Handling: riverFeatures.py
 def _error_handling_incremental_sinuosity(river_object=None,
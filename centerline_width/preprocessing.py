@@ -7,6 +7,12 @@
 #                                       - _left_right_coordinates: input left and right           #
 #                                              coordinates from the input values                  #
 #                                                                                                 #
+#                                       - _verify_bank_coordinates: verify that both              #
+#                                              banks contain valid coordinates                    #
+#                                                                                                 #
+#                                       - _banks_flipped: check if the right bank is in           #
+#                                              the reverse order of the left bank                 #
+#                                                                                                 #
 #                                       - _generate_polygon: generate river polygon               #
 #                                              based on input values                              #
 #                                              distance                                           #
@@ -14,6 +20,18 @@
 #                                       - _generate_voronoi: generate Voronoi diagram             #
 #                                              based on the left/right bank points                #
 #                                                                                                 #
+#                                       - _voronoi_connections: connections between the           #
+#                                              Voronoi vertices within the polygon (as            #
+#                                              indices of the vertex positions)                   #
+#                                                                                                 #
+#                                       - _simplify_bank_coordinates: remove bank points          #
+#                                              within a tolerance (meters) of the                 #
+#                                              simplified bank                                    #
+#                                                                                                 #
+#                                       - _local_channel_width: distance from each bank           #
+#                                              point to the closest point on the                  #
+#                                              opposite bank                                      #
+#                                                                                                 #
 #                                       - _interpolate_between_points: interpolates               #
 #                                              additional points at an even distance              #
 #                                              along river banks                                  #
@@ -22,16 +40,16 @@
 #                                                                                                 #
 
 # Standard Library Imports
-from collections import Counter
 import csv
 import logging
-import math
 import os
 
 # Related Third Party Imports
 import numpy as np
-from shapely.geometry import Point, Polygon, LineString
-from scipy.spatial import Voronoi
+from pyproj import Geod
+import shapely
+from shapely.geometry import Polygon, LineString
+from scipy.spatial import cKDTree, Voronoi
 
 # Internal Local Imports
 import centerline_width
@@ -43,145 +61,280 @@ stream_handler = logging.StreamHandler()
 logger.addHandler(stream_handler)
 
 
-def _left_right_coordinates(dataframe=None):
-    # returns the left and right coordinates from the input values
-    right_bank_coordinates = []
-    left_bank_coordinates = []
+def _left_right_coordinates(dataframe=None) -> [np.ndarray, np.ndarray]:
+    # returns the left and right coordinates from the input values as (N, 2) arrays of [longitude, latitude]
+    left_bank_coordinates = dataframe[["llon",
+                                       "llat"]].to_numpy(dtype=np.float64)
+    right_bank_coordinates = dataframe[["rlon",
+                                        "rlat"]].to_numpy(dtype=np.float64)
 
-    for index, row in dataframe.iterrows():
-        # iterate through input dataframe and save non-nan values
-        if not math.isnan(row.rlat) and not math.isnan(row.rlon):
-            right_bank_coordinates.append([row.rlon, row.rlat])
-        if not math.isnan(row.llat) and not math.isnan(row.llon):
-            left_bank_coordinates.append([row.llon, row.llat])
+    # only save non-nan values
+    left_bank_coordinates = left_bank_coordinates[
+        ~np.isnan(left_bank_coordinates).any(axis=1)]
+    right_bank_coordinates = right_bank_coordinates[
+        ~np.isnan(right_bank_coordinates).any(axis=1)]
 
     return left_bank_coordinates, right_bank_coordinates
 
 
-def _generate_polygon(
-        left_bank_lst: list = None,
-        right_bank_lst: list = None,
-        coord_type: str = None,
-        recursion_check: bool = False) -> [Polygon, LineString, LineString]:
-    # Return a shapely polygon based on the position of the river bank points
+def _verify_bank_coordinates(left_bank_lst: list = None,
+                             right_bank_lst: list = None) -> None:
+    # Raise an error when either bank has no valid (non-NaN) coordinates
     if len(right_bank_lst) == 0:
         raise ValueError("CRITICAL ERROR, right bank data is empty (or NaN)")
     if len(left_bank_lst) == 0:
         raise ValueError("\nCRITICAL ERROR, left bank data is empty (or NaN)")
-    circular_list_of_banks = left_bank_lst + right_bank_lst[::-1] + [
-        left_bank_lst[0]
-    ]
+
+
+def _banks_flipped(left_bank_lst: np.ndarray = None,
+                   right_bank_lst: np.ndarray = None,
+                   ellipsoid: str = "WGS84") -> bool:
+    # Return True when the right bank is in the reverse order of the left bank (start of the left bank is closer to the end of the right bank)
+    left_bank_lst = np.asarray(left_bank_lst, dtype=np.float64)
+    right_bank_lst = np.asarray(right_bank_lst, dtype=np.float64)
+    # distance between the start/end of the banks: [left start, left end] to [right start, right end] and [right end, right start]
+    _, _, bank_end_distance = Geod(ellps=ellipsoid).inv(
+        left_bank_lst[[0, -1, 0, -1], 0], left_bank_lst[[0, -1, 0, -1], 1],
+        right_bank_lst[[0, -1, -1, 0], 0], right_bank_lst[[0, -1, -1, 0], 1])
+    return bool(bank_end_distance[2] +
+                bank_end_distance[3] < bank_end_distance[0] +
+                bank_end_distance[1])
+
+
+def _generate_polygon(
+        left_bank_lst: np.ndarray = None,
+        right_bank_lst: np.ndarray = None,
+        coord_type: str = None,
+        ellipsoid: str = "WGS84") -> [Polygon, LineString, LineString]:
+    # Return a shapely polygon based on the position of the river bank points
+    _verify_bank_coordinates(left_bank_lst, right_bank_lst)
+    left_bank_lst = np.asarray(left_bank_lst, dtype=np.float64)
+    right_bank_lst = np.asarray(right_bank_lst, dtype=np.float64)
+    circular_list_of_banks = np.concatenate(
+        [left_bank_lst, right_bank_lst[::-1], left_bank_lst[:1]])
 
     river_polygon = Polygon(circular_list_of_banks)
-    top_river = LineString([
-        Point(left_bank_lst[::-1][0][0], left_bank_lst[::-1][0][1]),
-        Point(right_bank_lst[::-1][0][0], right_bank_lst[::-1][0][1])
-    ])
-    bottom_river = LineString([
-        Point(right_bank_lst[0][0], right_bank_lst[0][1]),
-        Point(left_bank_lst[0][0], left_bank_lst[0][1])
-    ])
+    top_river = LineString([left_bank_lst[-1], right_bank_lst[-1]])
+    bottom_river = LineString([right_bank_lst[0], left_bank_lst[0]])
 
-    if not river_polygon.is_valid and not recursion_check:
+    if not river_polygon.is_valid:
         logger.critical(
             f"[FAILED]  Invalid Polygon may need to be corrected - {coord_type}"
         )
-        # only run once with recursion_check set (just to check if reverse banks fixes issue)
-        polygon_check, _, _ = _generate_polygon(
-            left_bank_lst=left_bank_lst,
-            right_bank_lst=right_bank_lst[::-1],
-            coord_type=coord_type,
-            recursion_check=True)
-        if polygon_check.is_valid:
+        # check the direction of the banks from the start/end points (without generating a polygon with the reversed bank), relative coordinates use the same banks
+        if coord_type != "Relative Distance" and _banks_flipped(
+                left_bank_lst, right_bank_lst, ellipsoid):
             logger.critical(
-                "\nWARNING: Invalid Polygon Due to Flipped Banks, fix recommendation: rerun convertColumnsToCSV() and set flip_direction=True (or reset to default 'False' if currently set to flip_direction=True)\n"
+                "\nWARNING: Invalid Polygon Due to Flipped Banks, fix recommendation: create the river object with auto_orient=True or rerun convertColumnsToCSV() and set flip_direction=True (or reset to default 'False' if currently set to flip_direction=True)\n"
             )
-    if river_polygon.is_valid and not recursion_check:
+    else:
         logger.info(f"[SUCCESS] Valid polygon generated - {coord_type}")
 
+    # Prepare the polygon (spatial index of the polygon edges) once, used by all containment queries on the polygon
+    shapely.prepare(river_polygon)
+
     return river_polygon, top_river, bottom_river
 
 
-def _generate_voronoi(left_bank_lst: list = None,
-                      right_bank_lst: list = None,
+def _generate_voronoi(left_bank_lst: np.ndarray = None,
+                      right_bank_lst: np.ndarray = None,
                       coord_type: str = None) -> Voronoi:
     # Generate a Voronoi diagram based on the left/right bank points
-    all_banks_points = left_bank_lst + right_bank_lst
-    all_banks_points = np.array(all_banks_points)
+    all_banks_points = np.concatenate([
+        np.asarray(left_bank_lst, dtype=np.float64),
+        np.asarray(right_bank_lst, dtype=np.float64)
+    ])
 
     river_voronoi = Voronoi(all_banks_points)
     logger.info(f"[SUCCESS] Voronoi diagram generated - {coord_type}")
     return river_voronoi
 
 
+def _voronoi_connections(
+        river_voronoi: Voronoi = None,
+        river_polygon: Polygon = None) -> [np.ndarray, np.ndarray]:
+    # Returns the unique positions of the Voronoi vertices (N, 2) and the connections (start, end) between them as (M, 2) indices into the positions
+    logger.info(
+        "[PROCESSING] Attempting to determine a valid centerline from Voronoi points, may take a few minutes..."
+    )
+    ridge_vertices = np.asarray(river_voronoi.ridge_vertices,
+                                dtype=np.intp).reshape(-1, 2)
+    vertices = np.asarray(river_voronoi.vertices, dtype=np.float64)
+
+    # Only include non-infinity vertex edges
+    ridge_vertices = ridge_vertices[(ridge_vertices >= 0).all(axis=1)]
+
+    # Check if each vertex is within the polygon (once per vertex), otherwise remove the connection pairs that use the vertex
+    vertex_in_polygon = shapely.contains_xy(river_polygon, vertices[:, 0],
+                                            vertices[:, 1])
+    ridge_vertices = ridge_vertices[vertex_in_polygon[ridge_vertices].all(
+        axis=1)]
+
+    # Vertices with the same position are the same point (start and end point are compared by position)
+    vertex_positions, vertex_ids = np.unique(vertices,
+                                             axis=0,
+                                             return_inverse=True)
+    vertex_ids = vertex_ids.reshape(-1)
+    connection_ids = vertex_ids[ridge_vertices]
+
+    # Remove repeated connections (start -> end), keeping the order of the first time a connection is found
+    _, first_connection_index = np.unique(connection_ids,
+                                          axis=0,
+                                          return_index=True)
+    first_connection_index.sort()
+    connection_ids = connection_ids[first_connection_index]
+
+    # Count the amount of connections for each point (a connection from a point to itself is counted once)
+    connections_count = np.bincount(
+        connection_ids[:, 0], minlength=len(vertex_positions)) + np.bincount(
+            connection_ids[:, 1], minlength=len(vertex_positions))
+    self_connections = connection_ids[:, 0] == connection_ids[:, 1]
+    connections_count -= np.bincount(connection_ids[self_connections, 0],
+                                     minlength=len(vertex_positions))
+
+    # Only plot points with at least two connections (removes any edges that are not connected to additional points)
+    connection_ids = connection_ids[(connections_count[connection_ids]
+                                     > 1).all(axis=1)]
+
+    return vertex_positions, connection_ids
+
+
 def _points_from_voronoi(river_voronoi: Voronoi = None,
                          river_polygon: Polygon = None) -> dict:
     # Returns a dictionary list of all the voronoi points: {start point : [list of end points]}
-    points_dict = {}
-    all_connections_start_to_end = []
-    logger.info(
-        "[PROCESSING] Attempting to determine a valid centerline from Voronoi points, may take a few minutes..."
-    )  # longest step, O(n^n)
-    for ridge_vertex_point in river_voronoi.ridge_vertices:
-        if ridge_vertex_point[0] >= 0 and ridge_vertex_point[
-                1] >= 0:  # Only include non-infinity vertex edges
-            v0 = river_voronoi.vertices[ridge_vertex_point[0]]
-            v1 = river_voronoi.vertices[ridge_vertex_point[1]]
-            # Check if start and end points are within the polygon, otherwise remove the connection pair
-            if river_polygon.contains(Point([v0[0], v0[1]
-                                             ])) and river_polygon.contains(
-                                                 Point([v1[0], v1[1]])):
-                start_point = tuple([v0[0], v0[1]])
-                end_point = tuple([v1[0], v1[1]])
-                start_to_end = [start_point, end_point]
-                if start_to_end not in all_connections_start_to_end:
-                    all_connections_start_to_end.append(start_to_end)
+    vertex_positions, connection_ids = _voronoi_connections(
+        river_voronoi, river_polygon)
 
     # Dictionary with connections that have at least one connection
-    connections_counter_start_to_end = Counter(
-        x for xs in all_connections_start_to_end
-        for x in set(xs))  # counter the amount of connections for each point
-    for connection in all_connections_start_to_end:
-        start_point = connection[0]
-        end_point = connection[1]
-        # Only plot points with at least two connections (removes any edges that are not connected to additional points)
-        if connections_counter_start_to_end[start_point] > 1:
-            if connections_counter_start_to_end[end_point] > 1:
-                if start_point not in points_dict.keys():
-                    points_dict[start_point] = []
-                points_dict[start_point].append(end_point)
+    points_dict = {}
+    vertex_points = list(map(tuple, vertex_positions.tolist()))
+    for start_index, end_index in connection_ids.tolist():
+        points_dict.setdefault(vertex_points[start_index],
+                               []).append(vertex_points[end_index])
 
     return points_dict
 
 
-def _interpolate_between_points(left_bank_coordinates: list = None,
-                                right_bank_coordinates: list = None,
-                                interpolate_n: int = 5) -> [list, list]:
+def _simplify_bank_coordinates(bank_coordinates: np.ndarray = None,
+                               first_point: list = None,
+                               simplify_tolerance_m: float = None,
+                               ellipsoid: str = "WGS84") -> np.ndarray:
+    # Remove bank points that are within simplify_tolerance_m meters of the simplified bank (Douglas-Peucker), returns the remaining (N, 2) points
+    bank_coordinates = np.asarray(bank_coordinates, dtype=np.float64)
+    if len(bank_coordinates) < 3:
+        return bank_coordinates
+    # simplify the relative positions (in meters) from the first point, the first/last point of the bank are always kept
+    # the index of each bank point is kept as the z value (simplified in 2D), the simplified points are an ordered subset of the bank points
+    bank_relative = centerline_width._relative_coordinates_array(
+        first_point, bank_coordinates, ellipsoid)
+    simplified_bank = shapely.simplify(LineString(
+        np.column_stack([bank_relative,
+                         np.arange(len(bank_relative))])),
+                                       simplify_tolerance_m,
+                                       preserve_topology=False)
+    kept_index = shapely.get_coordinates(simplified_bank,
+                                         include_z=True)[:, 2].astype(np.intp)
+    return bank_coordinates[kept_index]
+
+
+def _local_channel_width(bank_coordinates: np.ndarray = None,
+                         opposite_bank_coordinates: np.ndarray = None,
+                         ellipsoid: str = "WGS84") -> np.ndarray:
+    # Returns the local channel width (in meters) at each bank point: distance to the closest point on the opposite bank
+    bank_coordinates = np.asarray(bank_coordinates, dtype=np.float64)
+    opposite_bank_coordinates = np.asarray(opposite_bank_coordinates,
+                                           dtype=np.float64)
+    # find the closest point with longitude scaled by the latitude (close to equal distances), then measure along the geodesic
+    longitude_scale = np.cos(
+        np.radians(
+            np.mean(
+                np.concatenate([bank_coordinates,
+                                opposite_bank_coordinates])[:, 1])))
+    _, closest_index = cKDTree(opposite_bank_coordinates *
+                               [longitude_scale, 1]).query(
+                                   bank_coordinates * [longitude_scale, 1])
+    closest_coordinates = opposite_bank_coordinates[closest_index]
+    _, _, channel_width_m = Geod(ellps=ellipsoid).inv(
+        bank_coordinates[:, 0], bank_coordinates[:, 1],
+        closest_coordinates[:, 0], closest_coordinates[:, 1])
+    return channel_width_m
+
+
+def _interpolate_between_points(
+        left_bank_coordinates: np.ndarray = None,
+        right_bank_coordinates: np.ndarray = None,
+        interpolate_n: int = 5,
+        interpolate_spacing_m: float = None,
+        interpolate_width_ratio: float = None,
+        ellipsoid: str = "WGS84") -> [np.ndarray, np.ndarray]:
     # Interpolated between points at an even distance along the river banks to attempt to even out Voronoi diagrams
-    interpolate_n += 2  # adds two exta points, to ensure that interpolating is adding the points between the existing points
-
-    def interpolateList(lst):
-        # Add points to existing list to increase resolution
-        #haversine_distance_between = haversine((lat1, lon1), (lat2, lon2), unit=units)
-        bank_expanded = []
-        for i in range(len(lst)):
-            if i + 1 < len(lst):
-                lon1, lat1 = lst[i][0], lst[i][1]
-                lon2, lat2 = lst[i + 1][0], lst[i + 1][1]
-
-                x_expand = np.linspace(lon1, lon2, interpolate_n)
-                y_expand = np.linspace(lat1, lat2, interpolate_n)
-
-                for j in range(len(x_expand)):
-                    bank_expanded.append([x_expand[j], y_expand[j]])
-                bank_expanded.append(
-                    lst[i + 1]
-                )  # add end position (np.linspace excludes ending position)
-            else:
-                bank_expanded.append(lst[i])
-        return bank_expanded
-
-    right_interpolated_coordinates = interpolateList(right_bank_coordinates)
-    left_interpolated_coordinates = interpolateList(left_bank_coordinates)
+    # Adds interpolate_n points between each pair of points or, with interpolate_spacing_m, points every interpolate_spacing_m meters along the geodesic
+    # With interpolate_width_ratio, only adds points to segments longer than interpolate_width_ratio * the local channel width
+    geodesic = Geod(ellps=ellipsoid)
+
+    def removeRepeatedPoints(bank_coordinates):
+        # remove repeated points (segments without a length)
+        bank_coordinates = np.asarray(bank_coordinates, dtype=np.float64)
+        repeated_points = np.r_[False, (
+            bank_coordinates[1:] == bank_coordinates[:-1]).all(axis=1)]
+        return bank_coordinates[~repeated_points]
+
+    def interpolateList(bank_coordinates, opposite_bank_coordinates):
+        # Add points to existing bank coordinates to increase resolution, returns an (N, 2) array without repeated points
+        if len(bank_coordinates) < 2:
+            return bank_coordinates
+
+        segment_start = bank_coordinates[:-1]
+        segment_end = bank_coordinates[1:]
+        if interpolate_spacing_m is None and interpolate_width_ratio is None:
+            # interpolate_n points between the start/end of each segment, includes the start of the segment but not the end (start of the next segment)
+            bank_expanded = np.linspace(segment_start,
+                                        segment_end,
+                                        interpolate_n + 2,
+                                        axis=1)[:, :-1].reshape(-1, 2)
+            return np.concatenate([bank_expanded, bank_coordinates[-1:]])
+
+        forward_bearing, _, segment_length_m = geodesic.inv(
+            segment_start[:, 0], segment_start[:, 1], segment_end[:, 0],
+            segment_end[:, 1])
+        if interpolate_spacing_m is not None:
+            # points every interpolate_spacing_m meters along the geodesic between the start/end of each segment
+            segment_spacing_m = interpolate_spacing_m
+        else:
+            # points every interpolate_width_ratio * local channel width (narrowest width at the start/end of the segment)
+            channel_width_m = _local_channel_width(bank_coordinates,
+                                                   opposite_bank_coordinates,
+                                                   ellipsoid)
+            segment_spacing_m = interpolate_width_ratio * np.minimum(
+                channel_width_m[:-1], channel_width_m[1:])
+            # banks that touch (no channel width) are not interpolated
+            segment_spacing_m[segment_spacing_m == 0] = np.inf
+        # segments shorter than the spacing are kept as is (no additional points)
+        points_per_segment = np.maximum(
+            np.ceil(segment_length_m / segment_spacing_m), 1).astype(np.intp)
+        segment_index = np.repeat(np.arange(len(segment_start)),
+                                  points_per_segment)
+        segment_offset = np.arange(len(segment_index)) - np.repeat(
+            np.cumsum(points_per_segment) - points_per_segment,
+            points_per_segment)
+        lon_expanded, lat_expanded, _ = geodesic.fwd(
+            segment_start[segment_index,
+                          0], segment_start[segment_index,
+                                            1], forward_bearing[segment_index],
+            segment_offset / points_per_segment[segment_index] *
+            segment_length_m[segment_index])
+        bank_expanded = np.column_stack([lon_expanded, lat_expanded])
+        # start of each segment is kept as is
+        segment_starts = segment_offset == 0
+        bank_expanded[segment_starts] = segment_start[
+            segment_index[segment_starts]]
+        return np.concatenate([bank_expanded, bank_coordinates[-1:]])
+
+    left_bank_coordinates = removeRepeatedPoints(left_bank_coordinates)
+    right_bank_coordinates = removeRepeatedPoints(right_bank_coordinates)
+    right_interpolated_coordinates = interpolateList(right_bank_coordinates,
+                                                     left_bank_coordinates)
+    left_interpolated_coordinates = interpolateList(left_bank_coordinates,
+                                                    right_bank_coordinates)
 
     return right_interpolated_coordinates, left_interpolated_coordinates
@@ -0,0 +1,85 @@
+# Test Expected Error Messages from batchProcessing.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_errorBatchProcessing -xv
+
+import re
+
+# External Python libraries (installed via pip install)
+import pytest
+
+# Internal centerline-width reference to access functions, global variables, and error handling
+import centerline_width
+
+invalid_non_int_options = [("testing_string", "<class 'str'>"),
+                           (3.1415, "<class 'float'>"), ([], "<class 'list'>"),
+                           (False, "<class 'bool'>")]
+
+invalid_non_list_options = [(1961, "<class 'int'>"),
+                            (3.1415, "<class 'float'>"),
+                            ("testing_string", "<class 'str'>"),
+                            (False, "<class 'bool'>")]
+
+
+## process_many() ############################################################
+def test_processMany_pathsRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape("[paths]: Requires a list of csv file locations")):
+        centerline_width.process_many(paths=None)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_list_options)
+def test_processMany_pathsInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[paths]: Must be a list, current type = '{error_output}'")):
+        centerline_width.process_many(paths=invalid_input)
+
+
+def test_processMany_pathsInvalidListTypes():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[paths]: Must be a list of str, current type = '<class 'int'>'"
+            )):
+        centerline_width.process_many(paths=["csv_example.csv", 1961])
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_int_options)
+def test_processMany_workersInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[workers]: Must be a int, current type = '{error_output}'")):
+        centerline_width.process_many(paths=["csv_example.csv"],
+                                      workers=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_processMany_workersInvalidRange(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[workers]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.process_many(paths=["csv_example.csv"],
+                                      workers=invalid_input)
+
+
+def test_processMany_outputsInvalidOptions():
+    with pytest.raises(ValueError,
+                       match=re.escape("current option = 'width'")):
+        centerline_width.process_many(paths=["csv_example.csv"],
+                                      outputs=["area", "width"])
+
+
+## process_many_iter() #######################################################
+def test_processManyIter_pathsRequired():
+    # errors are raised when called (before iterating over the results)
+    with pytest.raises(
+            ValueError,
+            match=re.escape("[paths]: Requires a list of csv file locations")):
+        centerline_width.process_many_iter(paths=None)
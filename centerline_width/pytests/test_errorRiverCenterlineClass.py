@@ -6,6 +6,8 @@ from io import StringIO
 import re
 
 # External Python libraries (installed via pip install)
+import numpy as np
+import pandas as pd
 import pytest
 
 # Internal centerline-width reference to access functions, global variables, and error handling
@@ -84,6 +86,129 @@ def test_CenterlineWidth_interpolateNInvalidTypes(invalid_input, error_output):
                                          interpolate_n=invalid_input)
 
 
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_num_options)
+def test_CenterlineWidth_interpolateSpacingInvalidTypes(
+        invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[interpolate_spacing_m]: Must be a int or float, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_data=True,
+                                         interpolate_spacing_m=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_CenterlineWidth_interpolateSpacingInvalidRange(
+        invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[interpolate_spacing_m]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_data=True,
+                                         interpolate_spacing_m=invalid_input)
+
+
+def test_CenterlineWidth_interpolateSpacingWithoutInterpolateData():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[interpolate_spacing_m]: Requires interpolate_data=True to add points between the bank coordinates"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_spacing_m=1)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_num_options)
+def test_CenterlineWidth_interpolateWidthRatioInvalidTypes(
+        invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[interpolate_width_ratio]: Must be a int or float, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_data=True,
+                                         interpolate_width_ratio=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_CenterlineWidth_interpolateWidthRatioInvalidRange(
+        invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[interpolate_width_ratio]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_data=True,
+                                         interpolate_width_ratio=invalid_input)
+
+
+def test_CenterlineWidth_interpolateWidthRatioWithoutInterpolateData():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[interpolate_width_ratio]: Requires interpolate_data=True to add points between the bank coordinates"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_width_ratio=1)
+
+
+def test_CenterlineWidth_interpolateWidthRatioWithSpacing():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[interpolate_width_ratio]: Cannot be set with interpolate_spacing_m, only one spacing can be used to add points between the bank coordinates"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         interpolate_data=True,
+                                         interpolate_spacing_m=1,
+                                         interpolate_width_ratio=1)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_num_options)
+def test_CenterlineWidth_simplifyToleranceInvalidTypes(invalid_input,
+                                                       error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[simplify_tolerance_m]: Must be a int or float, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         simplify_tolerance_m=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_CenterlineWidth_simplifyToleranceInvalidRange(invalid_input,
+                                                       error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[simplify_tolerance_m]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         simplify_tolerance_m=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_bool_options)
+def test_CenterlineWidth_autoOrientInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[auto_orient]: Must be a bool, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         auto_orient=invalid_input)
+
+
 @pytest.mark.parametrize("invalid_input, error_output",
                          invalid_non_int_options)
 def test_CenterlineWidth_interpolateNCenterpointsInvalidTypes(
@@ -153,3 +278,480 @@ def test_CenterlineWidth_ellipsoidInvalidOptions():
             )):
         centerline_width.CenterlineWidth(csv_data="csv_example.csv",
                                          ellipsoid="invalid")
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_int_options)
+def test_CenterlineWidth_tileSizeInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[tile_size]: Must be a int, current type = '{error_output}'")
+    ):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_size=invalid_input)
+
+
+def test_CenterlineWidth_tileSizeInvalidRange():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[tile_size]: Must be greater than 9, currently = '5'")):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_size=5)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_int_options)
+def test_CenterlineWidth_tileOverlapInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[tile_overlap]: Must be a int, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_size=100,
+                                         tile_overlap=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_CenterlineWidth_tileOverlapInvalidRange(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[tile_overlap]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_size=100,
+                                         tile_overlap=invalid_input)
+
+
+def test_CenterlineWidth_tileOverlapRequiresTileSize():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[tile_overlap]: Requires tile_size to split the river into tiles"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_overlap=10)
+
+
+def test_CenterlineWidth_tileOverlapLargerThanTileSize():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[tile_overlap]: Must be less than tile_size, currently = '100' >= '100'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_size=100,
+                                         tile_overlap=100)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_CenterlineWidth_centerlineEngineInvalidTypes(invalid_input,
+                                                      error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[centerline_engine]: Must be a str, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         centerline_engine=invalid_input)
+
+
+def test_CenterlineWidth_centerlineEngineInvalidOptions():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[centerline_engine]: Must be an available option in ['voronoi', 'delaunay', 'raster', 'bank_pairing', 'segment_voronoi'], current option = 'medial'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         centerline_engine="medial")
+
+
+def test_CenterlineWidth_centerlineEngineWithTiles():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[centerline_engine]: tile_size is only available with centerline_engine='voronoi', current option = 'delaunay'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         tile_size=100,
+                                         centerline_engine="delaunay")
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_num_options)
+def test_CenterlineWidth_rasterResolutionInvalidTypes(invalid_input,
+                                                      error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[raster_resolution_m]: Must be a int or float, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         centerline_engine="raster",
+                                         raster_resolution_m=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_CenterlineWidth_rasterResolutionInvalidRange(invalid_input,
+                                                      error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[raster_resolution_m]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         centerline_engine="raster",
+                                         raster_resolution_m=invalid_input)
+
+
+def test_CenterlineWidth_rasterResolutionRequiresRasterEngine():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[raster_resolution_m]: Requires centerline_engine='raster' to rasterize the polygon"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         raster_resolution_m=1)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_CenterlineWidth_graphBackendInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[graph_backend]: Must be a str, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         graph_backend=invalid_input)
+
+
+def test_CenterlineWidth_graphBackendInvalidOptions():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[graph_backend]: Must be an available option in ['networkx', 'csgraph'], current option = 'igraph'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         graph_backend="igraph")
+
+
+def test_CenterlineWidth_graphBackendRequiresVoronoiEngine():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[graph_backend]: Requires centerline_engine='voronoi' to search the Voronoi graph, current option = 'delaunay'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         centerline_engine="delaunay",
+                                         graph_backend="csgraph")
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_CenterlineWidth_pathSearchInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[path_search]: Must be a str, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         path_search=invalid_input)
+
+
+def test_CenterlineWidth_pathSearchInvalidOptions():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[path_search]: Must be an available option in ['breadth_first', 'astar'], current option = 'dijkstra'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         path_search="dijkstra")
+
+
+def test_CenterlineWidth_pathSearchRequiresVoronoiEngine():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[path_search]: Requires centerline_engine='voronoi' to search the Voronoi graph, current option = 'raster'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         centerline_engine="raster",
+                                         path_search="astar")
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_CenterlineWidth_cacheDirInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[cache_dir]: Must be a str, current type = '{error_output}'")
+    ):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         cache_dir=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_int_options)
+def test_CenterlineWidth_cacheMaxMbInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[cache_max_mb]: Must be a int, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         cache_max_mb=invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(-1, -1), (0, 0)])
+def test_CenterlineWidth_cacheMaxMbInvalidRange(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[cache_max_mb]: Must be a positive value, greater than 0, currently = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         cache_max_mb=invalid_input)
+
+
+invalid_non_list_options = [(1961, "<class 'int'>"),
+                            (3.1415, "<class 'float'>"),
+                            ("testing_string", "<class 'str'>"),
+                            (False, "<class 'bool'>")]
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_list_options)
+def test_CenterlineWidth_outputsInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[outputs]: Must be a list, current type = '{error_output}'")
+    ):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         outputs=invalid_input)
+
+
+def test_CenterlineWidth_outputsInvalidOptions():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[outputs]: Must be an available option in ['_left_bank_array', '_right_bank_array', 'left_bank_coordinates', 'right_bank_coordinates', 'bank_polygon', 'top_bank', 'bottom_bank', 'bank_voronoi', '_voronoi_points_dict', '_voronoi_nx_graph', '_largest_subgraph_nodes', 'starting_node', 'ending_node', 'x_voronoi_ridge_point', 'y_voronoi_ridge_point', 'centerline_voronoi', 'centerline_equal_distance', 'centerline_evenly_spaced', 'centerline_smoothed', 'left_bank_relative_coordinates', 'right_bank_relative_coordinates', 'bank_polygon_relative', 'top_bank_relative', 'bottom_bank_relative', 'bank_voronoi_relative', 'starting_node_relative', 'ending_node_relative', 'x_voronoi_ridge_point_relative', 'y_voronoi_ridge_point_relative', 'centerline_voronoi_relative', 'centerline_equal_distance_relative', 'centerline_evenly_spaced_relative', 'centerline_smoothed_relative', 'right_bank_length', 'left_bank_length', 'area', 'centerline_length', 'sinuosity'], current option = 'width'"
+            )):
+        centerline_width.CenterlineWidth(csv_data="csv_example.csv",
+                                         outputs=["area", "width"])
+
+
+def river_class_object():
+    csv_example = StringIO()
+    csv_example.write("llat,llon,rlat,rlon\n")
+    csv_example.write(
+        "30.03758064742554,-92.86856870164003,30.03744106431763,-92.867475846432\n"
+    )
+    csv_example.write(
+        "30.03761289873068,-92.86854932864129,30.03744779451432,-92.86747357248917\n"
+    )
+    csv_example.write(
+        "30.03764767910492,-92.86854615646305,30.03748158510661,-92.86744912321454\n"
+    )
+    csv_example.write(
+        "30.03767440933011,-92.86853555132092,30.03750644719021,-92.86743200196584\n"
+    )
+    csv_example.seek(0)
+    return centerline_width.CenterlineWidth(csv_data=csv_example)
+
+
+## CenterlineWidth.run_stage() #####################################################
+def test_runStage_stageNameRequired():
+    with pytest.raises(ValueError,
+                       match=re.escape("[stage_name]: Requires a stage name")):
+        river_class_object().run_stage(stage_name=None)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_runStage_stageNameInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[stage_name]: Must be a str, current type = '{error_output}'"
+            )):
+        river_class_object().run_stage(stage_name=invalid_input)
+
+
+def test_runStage_stageNameInvalidOptions():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[stage_name]: Must be an available option in ['banks', 'polygon', 'voronoi', 'graph', 'centerline', 'resample', 'relative', 'features'], current option = 'width'"
+            )):
+        river_class_object().run_stage(stage_name="width")
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_runStage_stageFunctionInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[stage_function]: Must be a function, current type = '{error_output}'"
+            )):
+        river_class_object().run_stage(stage_name="polygon",
+                                       stage_function=invalid_input)
+
+
+def test_runStage_stageFunctionMissingOutputs():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[stage_function]: Must return all the attributes generated by the 'polygon' stage, missing = ['top_bank', 'bottom_bank']"
+            )):
+        river_class_object().run_stage(
+            stage_name="polygon",
+            stage_function=lambda river_object: {"bank_polygon": None})
+
+
+## CenterlineWidth.from_dataframe() #####################################################
+def test_fromDataframe_dataframeRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape("[dataframe]: Requires a pandas DataFrame")):
+        centerline_width.CenterlineWidth.from_dataframe(dataframe=None)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_fromDataframe_dataframeInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[dataframe]: Must be a pandas DataFrame, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth.from_dataframe(
+            dataframe=invalid_input)
+
+
+def test_fromDataframe_dataframeMissingColumns():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[dataframe]: Must contain the columns ['llat', 'llon', 'rlat', 'rlon'], missing = ['rlat', 'rlon']"
+            )):
+        centerline_width.CenterlineWidth.from_dataframe(
+            dataframe=pd.DataFrame({
+                "llat": [30.0],
+                "llon": [-92.8]
+            }))
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_fromDataframe_riverNameInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[river_name]: Must be a str, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth.from_dataframe(
+            dataframe=pd.DataFrame(columns=["llat", "llon", "rlat", "rlon"]),
+            river_name=invalid_input)
+
+
+## CenterlineWidth.from_arrays() #####################################################
+def test_fromArrays_leftBankRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[left_bank_coordinates]: Requires an array of [longitude, latitude] coordinates"
+            )):
+        centerline_width.CenterlineWidth.from_arrays(
+            left_bank_coordinates=None,
+            right_bank_coordinates=np.zeros((3, 2)))
+
+
+def test_fromArrays_rightBankRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[right_bank_coordinates]: Requires an array of [longitude, latitude] coordinates"
+            )):
+        centerline_width.CenterlineWidth.from_arrays(
+            left_bank_coordinates=np.zeros((3, 2)),
+            right_bank_coordinates=None)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         [(1961, "<class 'int'>"), (3.1415, "<class 'float'>"),
+                          ("testing_string", "<class 'str'>"),
+                          (False, "<class 'bool'>")])
+def test_fromArrays_leftBankInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[left_bank_coordinates]: Must be a numpy array, current type = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth.from_arrays(
+            left_bank_coordinates=invalid_input,
+            right_bank_coordinates=np.zeros((3, 2)))
+
+
+@pytest.mark.parametrize("invalid_input, error_output", [(np.zeros(
+    (3, 3)), "(3, 3)"), (np.zeros(3), "(3,)"), ([], "(0,)")])
+def test_fromArrays_rightBankInvalidShape(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[right_bank_coordinates]: Must be an array with the shape (N, 2), current shape = '{error_output}'"
+            )):
+        centerline_width.CenterlineWidth.from_arrays(
+            left_bank_coordinates=np.zeros((3, 2)),
+            right_bank_coordinates=invalid_input)
+
+
+## CenterlineWidth.save() and CenterlineWidth.load() #########################
+def test_save_pathRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape("CRITICAL ERROR, [path]: Requires npz filename")):
+        river_class_object().save(path=None)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_save_pathInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[path]: Must be a str, current type = '{error_output}'")):
+        river_class_object().save(path=invalid_input)
+
+
+def test_save_pathInvalidExtension():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[path]: Extension must be a .npz file, current extension = '.csv'"
+            )):
+        river_class_object().save(path="river.csv")
+
+
+def test_load_pathRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape("CRITICAL ERROR, [path]: Requires npz filename")):
+        centerline_width.CenterlineWidth.load(path=None)
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         invalid_non_str_options)
+def test_load_pathInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[path]: Must be a str, current type = '{error_output}'")):
+        centerline_width.CenterlineWidth.load(path=invalid_input)
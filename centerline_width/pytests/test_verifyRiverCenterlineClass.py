@@ -3,10 +3,15 @@
 # python -m pytest -k test_verifyRiverCenterlineClass.py -xv
 
 # Pytests to Compare and Verify Expected Outputs
+import os
 import re
 from io import StringIO
+import tracemalloc
 
 # External Python libraries (installed via pip install)
+import numpy as np
+import pandas as pd
+from pyproj import Geod
 import pytest
 
 # Internal centerline-width reference to access functions, global variables, and error handling
@@ -1249,6 +1254,434 @@ def test_CenterlineWidth_futureWarning_variableName():
     assert river_class_example.sinuosity == pytest.approx(1.0008911599991046)
 
 
+@pytest.mark.parametrize(
+    "deprecated_name, replacement_name",
+    [("rightBankLength", "right_bank_length"),
+     ("leftBankLength", "left_bank_length"),
+     ("centerlineVoronoi", "centerline_voronoi"),
+     ("centerlineLength", "centerline_length"),
+     ("centerlineEqualDistance", "centerline_equal_distance"),
+     ("centerlineEvenlySpaced", "centerline_evenly_spaced"),
+     ("centerlineSmoothed", "centerline_smoothed"),
+     ("centerlineVoronoiRelative", "centerline_voronoi_relative"),
+     ("centerlineEqualDistanceRelative", "centerline_equal_distance_relative"),
+     ("centerlineEvenlySpacedRelative", "centerline_evenly_spaced_relative"),
+     ("centerlineSmoothedRelative", "centerline_smoothed_relative")])
+def test_CenterlineWidth_futureWarning_attributeName(deprecated_name,
+                                                     replacement_name):
+    # Pending Deprecation: TO BE REMOVED
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    with pytest.warns(
+            FutureWarning,
+            match=re.escape(
+                f"{deprecated_name} has been replaced with {replacement_name} and will be removed in the future"
+            )):
+        deprecated_value = getattr(river_class_example, deprecated_name)
+    # alias returns the same (single) result as the replacement attribute
+    assert deprecated_value is getattr(river_class_example, replacement_name)
+    assert deprecated_name not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_positionalArguments():
+    # baseline positional order: csv_data, cutoff, optional_cutoff, interpolate_data, interpolate_n, interpolate_n_centerpoints, equal_distance, ellipsoid
+    river_positional = centerline_width.CenterlineWidth(
+        csv_data(), None, None, False, 5, 20, 5, "sphere")
+    assert river_positional.interpolate_n_centerpoints == 20
+    assert river_positional.equal_distance == 5
+    assert river_positional.ellipsoid == "sphere"
+    assert river_positional.interpolate_spacing_m is None
+    assert river_positional.interpolate_width_ratio is None
+    assert river_positional.simplify_tolerance_m is None
+    assert river_positional.auto_orient is False
+    river_keyword = centerline_width.CenterlineWidth(
+        csv_data=csv_data(),
+        interpolate_n_centerpoints=20,
+        equal_distance=5,
+        ellipsoid="sphere")
+    assert river_positional.centerline_evenly_spaced == river_keyword.centerline_evenly_spaced
+    # interpolated banks with the same positional arguments
+    river_interpolated = centerline_width.CenterlineWidth(
+        csv_data(), None, None, True, 5, 20)
+    assert river_interpolated.interpolate_n_centerpoints == 20
+    assert river_interpolated.interpolate_spacing_m is None
+
+
+def test_CenterlineWidth_lazyAttributes():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    # attributes are only computed when first accessed
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert "centerline_voronoi" not in river_class_example.__dict__
+    assert "centerline_smoothed" not in river_class_example.__dict__
+    assert river_class_example.area == pytest.approx(11403.0195647527)
+    assert "area" in river_class_example.__dict__
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert river_class_example.centerline_voronoi[0] == pytest.approx(
+        (-92.86781887353752, 30.03824341873465))
+    assert "bank_voronoi" in river_class_example.__dict__
+    assert "centerline_smoothed" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_bankArrays():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    # bank coordinates are stored as contiguous (N, 2) float64 arrays used by the rest of the stages
+    for bank_array, bank_coordinates in [
+        (river_class_example._left_bank_array,
+         river_class_example.left_bank_coordinates),
+        (river_class_example._right_bank_array,
+         river_class_example.right_bank_coordinates)
+    ]:
+        assert bank_array.dtype == np.float64
+        assert bank_array.shape == (len(bank_coordinates), 2)
+        assert bank_array.flags["C_CONTIGUOUS"]
+        assert bank_array.tolist() == bank_coordinates
+
+
+def test_CenterlineWidth_bankVoronoiRelative():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    bank_voronoi = river_class_example.bank_voronoi
+    bank_voronoi_relative = river_class_example.bank_voronoi_relative
+    # same ridges and regions as the Decimal Degree Voronoi diagram, points and vertices in Relative Distance
+    assert bank_voronoi_relative.points.tolist() == [
+        list(point)
+        for point in river_class_example.left_bank_relative_coordinates +
+        river_class_example.right_bank_relative_coordinates
+    ]
+    assert bank_voronoi_relative.vertices.shape == bank_voronoi.vertices.shape
+    assert bank_voronoi_relative.vertices.tolist() == [
+        list(vertex)
+        for vertex in centerline_width._relative_coordinates_array(
+            river_class_example._left_bank_array[0], bank_voronoi.vertices)
+    ]
+    assert bank_voronoi_relative.ridge_vertices == bank_voronoi.ridge_vertices
+    assert bank_voronoi_relative.ridge_points.tolist(
+    ) == bank_voronoi.ridge_points.tolist()
+    assert bank_voronoi_relative.regions == bank_voronoi.regions
+    assert bank_voronoi_relative.min_bound.tolist(
+    ) == bank_voronoi_relative.points.min(axis=0).tolist()
+    assert bank_voronoi_relative.max_bound.tolist(
+    ) == bank_voronoi_relative.points.max(axis=0).tolist()
+    # the Decimal Degree Voronoi diagram is not changed
+    assert bank_voronoi.points.tolist() == np.concatenate([
+        river_class_example._left_bank_array,
+        river_class_example._right_bank_array
+    ]).tolist()
+
+
+def test_CenterlineWidth_outputs():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), outputs=["area", "right_bank_length"])
+    # only the requested outputs (and the stages they use) are computed
+    assert river_class_example.__dict__["area"] == pytest.approx(
+        11403.0195647527)
+    assert "right_bank_length" in river_class_example.__dict__
+    assert "bank_polygon" in river_class_example.__dict__
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert "left_bank_length" in river_class_example.__dict__
+    assert "centerline_voronoi" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_runStage():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    centerline_outputs = river_class_example.run_stage("centerline")
+    assert list(centerline_outputs.keys()) == [
+        "starting_node", "ending_node", "x_voronoi_ridge_point",
+        "y_voronoi_ridge_point", "centerline_voronoi"
+    ]
+    assert centerline_outputs[
+        "centerline_voronoi"] is river_class_example.centerline_voronoi
+    # stages the centerline depends on have been run
+    for output_name in ["bank_polygon", "bank_voronoi", "_voronoi_nx_graph"]:
+        assert output_name in river_class_example.__dict__
+    assert "centerline_evenly_spaced" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_runStage_stageFunction():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    assert river_class_example.centerline_length == pytest.approx(
+        0.08284102060354828)
+    straight_centerline = [
+        river_class_example.centerline_voronoi[0],
+        river_class_example.centerline_voronoi[-1]
+    ]
+
+    def straight_centerline_stage(river_object):
+        return {
+            "starting_node": straight_centerline[0],
+            "ending_node": straight_centerline[-1],
+            "x_voronoi_ridge_point": [],
+            "y_voronoi_ridge_point": [],
+            "centerline_voronoi": straight_centerline
+        }
+
+    river_class_example.run_stage("centerline",
+                                  stage_function=straight_centerline_stage)
+    assert river_class_example.centerline_voronoi == straight_centerline
+    # attributes that depend on the replaced stage are recomputed
+    assert river_class_example.centerline_length == pytest.approx(
+        centerline_width._centerline_length(straight_centerline))
+
+
+def test_CenterlineWidth_fromDataframe():
+    river_from_csv = centerline_width.CenterlineWidth(csv_data=csv_data())
+    river_from_dataframe = centerline_width.CenterlineWidth.from_dataframe(
+        dataframe=pd.read_csv(csv_data()), river_name="dataframe river")
+    assert river_from_dataframe.river_name == "dataframe river"
+    assert river_from_dataframe.df_len == 29
+    assert river_from_dataframe.interpolate_n_centerpoints == 29
+    assert river_from_dataframe.left_bank_coordinates == river_from_csv.left_bank_coordinates
+    assert river_from_dataframe.right_bank_coordinates == river_from_csv.right_bank_coordinates
+    assert river_from_dataframe.centerline_voronoi == river_from_csv.centerline_voronoi
+    assert river_from_dataframe.area == pytest.approx(river_from_csv.area)
+
+
+def test_CenterlineWidth_fromArrays():
+    river_from_csv = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                      cutoff=20)
+    df = pd.read_csv(csv_data())
+    left_bank = df[["llon", "llat"]].to_numpy(dtype=np.float64)
+    right_bank = df[["rlon", "rlat"]].to_numpy(dtype=np.float64)
+    river_from_arrays = centerline_width.CenterlineWidth.from_arrays(
+        left_bank_coordinates=left_bank,
+        right_bank_coordinates=right_bank,
+        cutoff=20)
+    assert river_from_arrays.river_name is None
+    assert river_from_arrays.df_len == 20
+    assert river_from_arrays.left_bank_coordinates == river_from_csv.left_bank_coordinates
+    assert river_from_arrays.right_bank_coordinates == river_from_csv.right_bank_coordinates
+    assert river_from_arrays.centerline_voronoi == river_from_csv.centerline_voronoi
+    assert river_from_arrays.sinuosity == pytest.approx(
+        river_from_csv.sinuosity)
+    # float64 arrays are not copied
+    assert np.shares_memory(river_from_arrays._left_bank_input, left_bank)
+
+
+def test_CenterlineWidth_fromArrays_nanCoordinates():
+    df = pd.read_csv(csv_data())
+    left_bank = df[["llon", "llat"]].to_numpy(dtype=np.float64)
+    right_bank = df[["rlon", "rlat"]].to_numpy(dtype=np.float64)
+    right_bank[-3:] = np.nan
+    river_from_arrays = centerline_width.CenterlineWidth.from_arrays(
+        left_bank_coordinates=left_bank, right_bank_coordinates=right_bank)
+    assert river_from_arrays.df_len == 29
+    assert len(river_from_arrays.left_bank_coordinates) == 29
+    assert len(river_from_arrays.right_bank_coordinates) == 26
+
+
+def test_CenterlineWidth_cacheDir(tmpdir):
+    cache_dir = str(tmpdir.join("river_cache"))
+    river_computed = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                      cache_dir=cache_dir)
+    assert river_computed.centerline_length == pytest.approx(
+        0.08284102060354828)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # same bank coordinates and parameters: outputs are loaded from the cache without recomputing the Voronoi
+    river_cached = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                    cache_dir=cache_dir)
+    assert "centerline_length" in river_cached.__dict__
+    assert "centerline_voronoi" in river_cached.__dict__
+    assert "bank_voronoi" not in river_cached.__dict__
+    assert river_cached.centerline_length == river_computed.centerline_length
+    assert river_cached.centerline_voronoi == river_computed.centerline_voronoi
+    assert river_cached.starting_node == river_computed.starting_node
+
+    # different parameters are saved separately
+    river_other = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                   equal_distance=5,
+                                                   cache_dir=cache_dir)
+    assert "centerline_voronoi" not in river_other.__dict__
+    river_other.centerline_equal_distance
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_CenterlineWidth_cacheEviction(tmpdir):
+    cache_dir = str(tmpdir.join("river_cache"))
+    os.makedirs(cache_dir)
+    # least recently used file that fills the cache
+    old_cache_file = os.path.join(cache_dir, "old.npz")
+    np.savez(old_cache_file, values=np.zeros(200000))
+    os.utime(old_cache_file, (0, 0))
+
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                           cache_dir=cache_dir,
+                                                           cache_max_mb=1)
+    river_class_example.centerline_voronoi
+    assert not os.path.exists(old_cache_file)
+    assert os.path.exists(river_class_example._cache_path)
+
+
+def test_CenterlineWidth_cacheSavedOncePerAccess(tmpdir, monkeypatch):
+    saved_caches = []
+    save_cached_outputs = centerline_width._save_cached_outputs
+
+    def save_cached_outputs_counted(river_object):
+        saved_caches.append(river_object._cache_path)
+        save_cached_outputs(river_object)
+
+    monkeypatch.setattr(centerline_width, "_save_cached_outputs",
+                        save_cached_outputs_counted)
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), cache_dir=str(tmpdir.join("river_cache")))
+    # the banks, centerline, and resampled centerline are saved together
+    river_class_example.centerline_length
+    assert len(saved_caches) == 1
+    river_class_example.centerline_length
+    assert len(saved_caches) == 1
+    river_class_example.run_stage("relative")
+    assert len(saved_caches) == 2
+
+
+def test_CenterlineWidth_cacheWriteFailure(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir.join("river_cache"))
+
+    def savez_failure(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                           cache_dir=cache_dir)
+    monkeypatch.setattr(np, "savez", savez_failure)
+    with pytest.raises(OSError, match="No space left on device"):
+        river_class_example.centerline_voronoi
+    # the temporary file is removed
+    assert os.listdir(cache_dir) == []
+
+
+def test_CenterlineWidth_saveLoad(tmpdir):
+    river_path = str(tmpdir.join("river.npz"))
+    river_saved = centerline_width.CenterlineWidth(
+        csv_data=csv_data(),
+        interpolate_data=True,
+        outputs=["centerline_length", "centerline_smoothed_relative"])
+    river_saved.save(river_path)
+
+    river_loaded = centerline_width.CenterlineWidth.load(river_path)
+    assert river_loaded.interpolate_data is True
+    assert river_loaded.df_len == river_saved.df_len
+    assert river_loaded.left_bank_coordinates == river_saved.left_bank_coordinates
+    # computed outputs are loaded, geometries are rebuilt when accessed
+    assert "centerline_voronoi" in river_loaded.__dict__
+    assert "bank_voronoi" not in river_loaded.__dict__
+    assert river_loaded.centerline_length == river_saved.centerline_length
+    assert river_loaded.centerline_voronoi == river_saved.centerline_voronoi
+    assert river_loaded.centerline_smoothed_relative == river_saved.centerline_smoothed_relative
+    assert river_loaded.starting_node == river_saved.starting_node
+    assert river_loaded.area == pytest.approx(river_saved.area)
+    assert river_loaded.bank_polygon.equals(river_saved.bank_polygon)
+
+
+def test_CenterlineWidth_tiles():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    river_tiled = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                   tile_size=20,
+                                                   tile_overlap=8)
+    assert river_tiled.centerline_voronoi[
+        0] == river_class_example.centerline_voronoi[0]
+    assert river_tiled.centerline_voronoi[
+        -1] == river_class_example.centerline_voronoi[-1]
+    assert river_tiled.centerline_length == pytest.approx(
+        river_class_example.centerline_length, rel=1e-4)
+    # centerline is stitched from each tile without generating a graph for the whole river
+    assert "_voronoi_nx_graph" not in river_tiled.__dict__
+    river_tiled.run_stage("centerline")
+    assert "_voronoi_nx_graph" not in river_tiled.__dict__
+
+
+def test_CenterlineWidth_tilesDefaultOverlap():
+    river_tiled = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                   tile_size=20)
+    assert river_tiled.tile_overlap == 5
+
+
+def test_bankTiles():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    bank_tiles, overlap_lines = centerline_width._bank_tiles(
+        river_class_example._left_bank_array,
+        river_class_example._right_bank_array,
+        tile_size=12,
+        tile_overlap=4)
+    assert len(bank_tiles) == 4
+    assert len(overlap_lines) == 3
+    # first tile starts and last tile ends with the banks
+    assert bank_tiles[0][0][0].tolist(
+    ) == river_class_example.left_bank_coordinates[0]
+    assert bank_tiles[-1][0][-1].tolist(
+    ) == river_class_example.left_bank_coordinates[-1]
+    assert bank_tiles[-1][1][-1].tolist(
+    ) == river_class_example.right_bank_coordinates[-1]
+    # neighboring tiles overlap
+    for tile_number in range(len(bank_tiles) - 1):
+        for bank_side in [0, 1]:
+            assert bank_tiles[tile_number + 1][bank_side][0].tolist(
+            ) in bank_tiles[tile_number][bank_side].tolist()
+
+
+def test_CenterlineWidth_profile():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    assert list(river_class_example.profile.keys()) == [
+        "bank load", "bank interpolation"
+    ]
+    river_class_example.centerline_length
+    for stage_label in [
+            "polygon", "voronoi", "ridge filtering", "graph build",
+            "shortest path", "river features"
+    ]:
+        assert stage_label in river_class_example.profile
+        assert river_class_example.profile[stage_label]["calls"] == 1
+        assert river_class_example.profile[stage_label]["wall_time_s"] >= 0
+    assert river_class_example.profile["bank load"]["left_bank_points"] == len(
+        river_class_example.left_bank_coordinates)
+    assert river_class_example.profile["graph build"][
+        "graph_nodes"] == river_class_example._voronoi_nx_graph.number_of_nodes(
+        )
+    assert river_class_example.profile["shortest path"]["coordinates"] == len(
+        river_class_example.centerline_voronoi)
+
+    # stages run by width() are added to the profile
+    river_class_example.width(apply_smoothing=False)
+    assert "evenly spaced resampling" in river_class_example.profile
+    assert "smoothed resampling" not in river_class_example.profile
+    assert river_class_example.profile["width transects"]["calls"] == 1
+    assert river_class_example.profile["width transects"][
+        "width_lines"] >= river_class_example.profile["width transects"][
+            "removed_lines"]
+    river_class_example.width(apply_smoothing=True)
+    assert river_class_example.profile["width transects"]["calls"] == 2
+    assert river_class_example.profile["smoothed resampling"]["calls"] == 1
+
+
+def test_CenterlineWidth_profile_peakMemory():
+    tracemalloc.start()
+    try:
+        river_class_example = centerline_width.CenterlineWidth(
+            csv_data=csv_data())
+        river_class_example.centerline_voronoi
+    finally:
+        tracemalloc.stop()
+    assert river_class_example.profile["voronoi"]["peak_memory_mb"] > 0
+
+
+def test_CenterlineWidth_relativeVoronoi():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    # Relative Distance Voronoi is converted from the Decimal Degrees Voronoi (same ridges and regions)
+    bank_voronoi = river_class_example.bank_voronoi
+    bank_voronoi_relative = river_class_example.bank_voronoi_relative
+    assert bank_voronoi_relative.ridge_vertices == bank_voronoi.ridge_vertices
+    assert bank_voronoi_relative.vertices.shape == bank_voronoi.vertices.shape
+    assert bank_voronoi_relative.points.tolist() == [
+        list(point)
+        for point in river_class_example.left_bank_relative_coordinates +
+        river_class_example.right_bank_relative_coordinates
+    ]
+    assert bank_voronoi_relative.vertices[0].tolist() == list(
+        centerline_width._relative_single_coordinate(
+            river_class_example.left_bank_coordinates[0],
+            bank_voronoi.vertices[0]))
+    # Decimal Degrees Voronoi is unchanged
+    assert bank_voronoi.points.tolist() == (
+        river_class_example.left_bank_coordinates +
+        river_class_example.right_bank_coordinates)
+
+
 def test_CenterlineWidth_default_incrementalSinuosity():
     river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
     assert river_class_example.incremental_sinuosity() == {
@@ -1319,223 +1752,167 @@ def test_CenterlineWidth_interpolateTrue():
         pytest.approx([-92.86855578630754, 30.037602148295633]),
         pytest.approx([-92.8685525574744, 30.037607523513156]),
         pytest.approx([-92.86854932864128, 30.03761289873068]),
-        pytest.approx([-92.86854932864128, 30.03761289873068]),
-        pytest.approx([-92.86854932864128, 30.03761289873068]),
         pytest.approx([-92.8685487999449, 30.03761869545972]),
         pytest.approx([-92.86854827124853, 30.03762449218876]),
         pytest.approx([-92.86854774255215, 30.0376302889178]),
         pytest.approx([-92.86854721385579, 30.03763608564684]),
         pytest.approx([-92.86854668515942, 30.03764188237588]),
         pytest.approx([-92.86854615646304, 30.03764767910492]),
-        pytest.approx([-92.86854615646304, 30.03764767910492]),
-        pytest.approx([-92.86854615646304, 30.03764767910492]),
         pytest.approx([-92.86854438893936, 30.03765213414245]),
         pytest.approx([-92.86854262141567, 30.037656589179985]),
         pytest.approx([-92.86854085389197, 30.037661044217515]),
         pytest.approx([-92.86853908636829, 30.037665499255045]),
         pytest.approx([-92.8685373188446, 30.03766995429258]),
         pytest.approx([-92.86853555132092, 30.03767440933011]),
-        pytest.approx([-92.86853555132092, 30.03767440933011]),
-        pytest.approx([-92.86853555132092, 30.03767440933011]),
         pytest.approx([-92.86853511865802, 30.037679068239495]),
         pytest.approx([-92.86853468599512, 30.037683727148877]),
         pytest.approx([-92.8685342533322, 30.037688386058264]),
         pytest.approx([-92.8685338206693, 30.03769304496765]),
         pytest.approx([-92.8685333880064, 30.037697703877033]),
         pytest.approx([-92.8685329553435, 30.03770236278642]),
-        pytest.approx([-92.8685329553435, 30.03770236278642]),
-        pytest.approx([-92.8685329553435, 30.03770236278642]),
         pytest.approx([-92.86853117114028, 30.037706834574582]),
         pytest.approx([-92.86852938693704, 30.03771130636274]),
         pytest.approx([-92.86852760273382, 30.037715778150904]),
         pytest.approx([-92.8685258185306, 30.037720249939067]),
         pytest.approx([-92.86852403432736, 30.037724721727226]),
         pytest.approx([-92.86852225012414, 30.03772919351539]),
-        pytest.approx([-92.86852225012414, 30.03772919351539]),
-        pytest.approx([-92.86852225012414, 30.03772919351539]),
         pytest.approx([-92.86852056838237, 30.037732503758857]),
         pytest.approx([-92.86851888664059, 30.037735814002325]),
         pytest.approx([-92.86851720489881, 30.037739124245796]),
         pytest.approx([-92.86851552315701, 30.037742434489264]),
         pytest.approx([-92.86851384141524, 30.03774574473273]),
         pytest.approx([-92.86851215967346, 30.0377490549762]),
-        pytest.approx([-92.86851215967346, 30.0377490549762]),
-        pytest.approx([-92.86851215967346, 30.0377490549762]),
         pytest.approx([-92.86851025028848, 30.03775471494785]),
         pytest.approx([-92.86850834090349, 30.037760374919507]),
         pytest.approx([-92.86850643151851, 30.03776603489116]),
         pytest.approx([-92.86850452213353, 30.037771694862812]),
         pytest.approx([-92.86850261274854, 30.037777354834468]),
         pytest.approx([-92.86850070336357, 30.03778301480612]),
-        pytest.approx([-92.86850070336357, 30.03778301480612]),
-        pytest.approx([-92.86850070336357, 30.03778301480612]),
         pytest.approx([-92.86849746692211, 30.03778851552274]),
         pytest.approx([-92.86849423048066, 30.03779401623936]),
         pytest.approx([-92.8684909940392, 30.037799516955978]),
         pytest.approx([-92.86848775759775, 30.0378050176726]),
         pytest.approx([-92.8684845211563, 30.03781051838922]),
         pytest.approx([-92.86848128471485, 30.03781601910584]),
-        pytest.approx([-92.86848128471485, 30.03781601910584]),
-        pytest.approx([-92.86848128471485, 30.03781601910584]),
         pytest.approx([-92.8684794929811, 30.037820545711455]),
         pytest.approx([-92.86847770124736, 30.03782507231707]),
         pytest.approx([-92.8684759095136, 30.037829598922684]),
         pytest.approx([-92.86847411777985, 30.0378341255283]),
         pytest.approx([-92.86847232604612, 30.037838652133914]),
         pytest.approx([-92.86847053431237, 30.03784317873953]),
-        pytest.approx([-92.86847053431237, 30.03784317873953]),
-        pytest.approx([-92.86847053431237, 30.03784317873953]),
         pytest.approx([-92.86846873645375, 30.037847715826146]),
         pytest.approx([-92.86846693859515, 30.037852252912767]),
         pytest.approx([-92.86846514073653, 30.037856789999385]),
         pytest.approx([-92.86846334287792, 30.037861327086002]),
         pytest.approx([-92.86846154501931, 30.037865864172623]),
         pytest.approx([-92.8684597471607, 30.03787040125924]),
-        pytest.approx([-92.8684597471607, 30.03787040125924]),
-        pytest.approx([-92.8684597471607, 30.03787040125924]),
         pytest.approx([-92.86845919046314, 30.03787633453656]),
         pytest.approx([-92.8684586337656, 30.037882267813877]),
         pytest.approx([-92.86845807706804, 30.037888201091196]),
         pytest.approx([-92.86845752037048, 30.037894134368514]),
         pytest.approx([-92.86845696367294, 30.037900067645833]),
         pytest.approx([-92.86845640697538, 30.03790600092315]),
-        pytest.approx([-92.86845640697538, 30.03790600092315]),
-        pytest.approx([-92.86845640697538, 30.03790600092315]),
         pytest.approx([-92.86845448146546, 30.037911750634358]),
         pytest.approx([-92.86845255595554, 30.037917500345568]),
         pytest.approx([-92.86845063044564, 30.037923250056778]),
         pytest.approx([-92.86844870493572, 30.037928999767985]),
         pytest.approx([-92.8684467794258, 30.03793474947919]),
         pytest.approx([-92.86844485391588, 30.0379404991904]),
-        pytest.approx([-92.86844485391588, 30.0379404991904]),
-        pytest.approx([-92.86844485391588, 30.0379404991904]),
         pytest.approx([-92.8684445167435, 30.0379440789174]),
         pytest.approx([-92.86844417957113, 30.037947658644395]),
         pytest.approx([-92.86844384239876, 30.03795123837139]),
         pytest.approx([-92.86844350522638, 30.037954818098388]),
         pytest.approx([-92.868443168054, 30.037958397825385]),
         pytest.approx([-92.86844283088163, 30.03796197755238]),
-        pytest.approx([-92.86844283088163, 30.03796197755238]),
-        pytest.approx([-92.86844283088163, 30.03796197755238]),
         pytest.approx([-92.8684405565929, 30.03797135365163]),
         pytest.approx([-92.86843828230417, 30.03798072975088]),
         pytest.approx([-92.86843600801544, 30.03799010585013]),
         pytest.approx([-92.8684337337267, 30.03799948194938]),
         pytest.approx([-92.86843145943797, 30.03800885804863]),
         pytest.approx([-92.86842918514924, 30.03801823414788]),
-        pytest.approx([-92.86842918514924, 30.03801823414788]),
-        pytest.approx([-92.86842918514924, 30.03801823414788]),
         pytest.approx([-92.86842873075413, 30.038023041123438]),
         pytest.approx([-92.86842827635903, 30.038027848098995]),
         pytest.approx([-92.86842782196392, 30.038032655074552]),
         pytest.approx([-92.86842736756881, 30.038037462050106]),
         pytest.approx([-92.8684269131737, 30.038042269025663]),
         pytest.approx([-92.8684264587786, 30.03804707600122]),
-        pytest.approx([-92.8684264587786, 30.03804707600122]),
-        pytest.approx([-92.8684264587786, 30.03804707600122]),
         pytest.approx([-92.86842737826954, 30.038052098286574]),
         pytest.approx([-92.86842829776049, 30.038057120571928]),
         pytest.approx([-92.86842921725145, 30.038062142857278]),
         pytest.approx([-92.86843013674239, 30.038067165142632]),
         pytest.approx([-92.86843105623333, 30.038072187427986]),
         pytest.approx([-92.86843197572428, 30.03807720971334]),
-        pytest.approx([-92.86843197572428, 30.03807720971334]),
-        pytest.approx([-92.86843197572428, 30.03807720971334]),
         pytest.approx([-92.86843278404066, 30.03808345444137]),
         pytest.approx([-92.86843359235706, 30.038089699169404]),
         pytest.approx([-92.86843440067346, 30.038095943897435]),
         pytest.approx([-92.86843520898985, 30.038102188625466]),
         pytest.approx([-92.86843601730624, 30.0381084333535]),
         pytest.approx([-92.86843682562264, 30.03811467808153]),
-        pytest.approx([-92.86843682562264, 30.03811467808153]),
-        pytest.approx([-92.86843682562264, 30.03811467808153]),
         pytest.approx([-92.86843774985314, 30.038119728690845]),
         pytest.approx([-92.86843867408366, 30.038124779300162]),
         pytest.approx([-92.86843959831418, 30.038129829909476]),
         pytest.approx([-92.86844052254469, 30.03813488051879]),
         pytest.approx([-92.8684414467752, 30.038139931128107]),
         pytest.approx([-92.86844237100571, 30.03814498173742]),
-        pytest.approx([-92.86844237100571, 30.03814498173742]),
-        pytest.approx([-92.86844237100571, 30.03814498173742]),
         pytest.approx([-92.86844329757297, 30.038150045027173]),
         pytest.approx([-92.8684442241402, 30.038155108316925]),
         pytest.approx([-92.86844515070746, 30.038160171606677]),
         pytest.approx([-92.86844607727471, 30.038165234896425]),
         pytest.approx([-92.86844700384195, 30.038170298186177]),
         pytest.approx([-92.8684479304092, 30.03817536147593]),
-        pytest.approx([-92.8684479304092, 30.03817536147593]),
-        pytest.approx([-92.8684479304092, 30.03817536147593]),
         pytest.approx([-92.8684487461428, 30.038181657403744]),
         pytest.approx([-92.86844956187639, 30.03818795333156]),
         pytest.approx([-92.86845037760997, 30.038194249259377]),
         pytest.approx([-92.86845119334357, 30.03820054518719]),
         pytest.approx([-92.86845200907717, 30.038206841115006]),
         pytest.approx([-92.86845282481076, 30.03821313704282]),
-        pytest.approx([-92.86845282481076, 30.03821313704282]),
-        pytest.approx([-92.86845282481076, 30.03821313704282]),
         pytest.approx([-92.86845640091498, 30.03821985247896]),
         pytest.approx([-92.8684599770192, 30.038226567915103]),
         pytest.approx([-92.86846355312342, 30.038233283351246]),
         pytest.approx([-92.86846712922764, 30.038239998787386]),
         pytest.approx([-92.86847070533186, 30.038246714223526]),
         pytest.approx([-92.86847428143608, 30.03825342965967]),
-        pytest.approx([-92.86847428143608, 30.03825342965967]),
-        pytest.approx([-92.86847428143608, 30.03825342965967]),
         pytest.approx([-92.86847532420708, 30.038257303314634]),
         pytest.approx([-92.86847636697809, 30.0382611769696]),
         pytest.approx([-92.86847740974909, 30.038265050624567]),
         pytest.approx([-92.8684784525201, 30.03826892427953]),
         pytest.approx([-92.8684794952911, 30.038272797934496]),
         pytest.approx([-92.8684805380621, 30.03827667158946]),
-        pytest.approx([-92.8684805380621, 30.03827667158946]),
-        pytest.approx([-92.8684805380621, 30.03827667158946]),
         pytest.approx([-92.86848275913039, 30.03828323310182]),
         pytest.approx([-92.86848498019869, 30.038289794614176]),
         pytest.approx([-92.86848720126697, 30.038296356126537]),
         pytest.approx([-92.86848942233526, 30.038302917638894]),
         pytest.approx([-92.86849164340356, 30.038309479151252]),
         pytest.approx([-92.86849386447184, 30.03831604066361]),
-        pytest.approx([-92.86849386447184, 30.03831604066361]),
-        pytest.approx([-92.86849386447184, 30.03831604066361]),
         pytest.approx([-92.86849619729425, 30.038321375929556]),
         pytest.approx([-92.86849853011667, 30.038326711195502]),
         pytest.approx([-92.86850086293907, 30.03833204646145]),
         pytest.approx([-92.86850319576148, 30.0383373817274]),
         pytest.approx([-92.8685055285839, 30.038342716993345]),
         pytest.approx([-92.8685078614063, 30.03834805225929]),
-        pytest.approx([-92.8685078614063, 30.03834805225929]),
-        pytest.approx([-92.8685078614063, 30.03834805225929]),
         pytest.approx([-92.86850860176705, 30.03835568805697]),
         pytest.approx([-92.8685093421278, 30.03836332385465]),
         pytest.approx([-92.86851008248854, 30.038370959652333]),
         pytest.approx([-92.8685108228493, 30.038378595450013]),
         pytest.approx([-92.86851156321005, 30.038386231247692]),
         pytest.approx([-92.8685123035708, 30.03839386704537]),
-        pytest.approx([-92.8685123035708, 30.03839386704537]),
-        pytest.approx([-92.8685123035708, 30.03839386704537]),
         pytest.approx([-92.86851615271567, 30.03839820406249]),
         pytest.approx([-92.86852000186055, 30.03840254107961]),
         pytest.approx([-92.86852385100542, 30.038406878096726]),
         pytest.approx([-92.86852770015031, 30.038411215113843]),
         pytest.approx([-92.86853154929518, 30.038415552130964]),
         pytest.approx([-92.86853539844006, 30.03841988914808]),
-        pytest.approx([-92.86853539844006, 30.03841988914808]),
-        pytest.approx([-92.86853539844006, 30.03841988914808]),
         pytest.approx([-92.86853775408554, 30.038425275689377]),
         pytest.approx([-92.86854010973101, 30.038430662230677]),
         pytest.approx([-92.86854246537649, 30.038436048771977]),
         pytest.approx([-92.86854482102197, 30.038441435313274]),
         pytest.approx([-92.86854717666745, 30.03844682185457]),
         pytest.approx([-92.86854953231293, 30.03845220839587]),
-        pytest.approx([-92.86854953231293, 30.03845220839587]),
-        pytest.approx([-92.86854953231293, 30.03845220839587]),
         pytest.approx([-92.86855178241791, 30.038458854353543]),
         pytest.approx([-92.86855403252291, 30.03846550031122]),
         pytest.approx([-92.8685562826279, 30.03847214626889]),
         pytest.approx([-92.86855853273289, 30.038478792226563]),
         pytest.approx([-92.86856078283787, 30.03848543818424]),
-        pytest.approx([-92.86856303294287, 30.03849208414191]),
-        pytest.approx([-92.86856303294287, 30.03849208414191]),
         pytest.approx([-92.86856303294287, 30.03849208414191])
     ]
     assert river_class_example.right_bank_coordinates == [
@@ -1546,223 +1923,167 @@ def test_CenterlineWidth_interpolateTrue():
         pytest.approx([-92.8674743304701, 30.037445551115425]),
         pytest.approx([-92.86747395147964, 30.037446672814873]),
         pytest.approx([-92.86747357248916, 30.03744779451432]),
-        pytest.approx([-92.86747357248916, 30.03744779451432]),
-        pytest.approx([-92.86747357248916, 30.03744779451432]),
         pytest.approx([-92.86746949761006, 30.037453426279704]),
         pytest.approx([-92.86746542273096, 30.037459058045084]),
         pytest.approx([-92.86746134785184, 30.037464689810466]),
         pytest.approx([-92.86745727297274, 30.03747032157585]),
         pytest.approx([-92.86745319809364, 30.03747595334123]),
         pytest.approx([-92.86744912321454, 30.03748158510661]),
-        pytest.approx([-92.86744912321454, 30.03748158510661]),
-        pytest.approx([-92.86744912321454, 30.03748158510661]),
         pytest.approx([-92.8674462696731, 30.03748572878721]),
         pytest.approx([-92.86744341613164, 30.037489872467813]),
         pytest.approx([-92.86744056259019, 30.03749401614841]),
         pytest.approx([-92.86743770904874, 30.03749815982901]),
         pytest.approx([-92.86743485550728, 30.037502303509612]),
         pytest.approx([-92.86743200196584, 30.03750644719021]),
-        pytest.approx([-92.86743200196584, 30.03750644719021]),
-        pytest.approx([-92.86743200196584, 30.03750644719021]),
         pytest.approx([-92.8674317014251, 30.037509464189085]),
         pytest.approx([-92.86743140088437, 30.037512481187964]),
         pytest.approx([-92.86743110034364, 30.037515498186842]),
         pytest.approx([-92.8674307998029, 30.037518515185717]),
         pytest.approx([-92.86743049926217, 30.03752153218459]),
         pytest.approx([-92.86743019872144, 30.03752454918347]),
-        pytest.approx([-92.86743019872144, 30.03752454918347]),
-        pytest.approx([-92.86743019872144, 30.03752454918347]),
         pytest.approx([-92.867427702586, 30.037527557737157]),
         pytest.approx([-92.86742520645056, 30.037530566290847]),
         pytest.approx([-92.86742271031511, 30.037533574844534]),
         pytest.approx([-92.86742021417967, 30.03753658339822]),
         pytest.approx([-92.86741771804424, 30.037539591951912]),
         pytest.approx([-92.8674152219088, 30.0375426005056]),
-        pytest.approx([-92.8674152219088, 30.0375426005056]),
-        pytest.approx([-92.8674152219088, 30.0375426005056]),
         pytest.approx([-92.86741281112754, 30.0375475269316]),
         pytest.approx([-92.86741040034627, 30.0375524533576]),
         pytest.approx([-92.86740798956501, 30.0375573797836]),
         pytest.approx([-92.86740557878373, 30.0375623062096]),
         pytest.approx([-92.86740316800247, 30.0375672326356]),
         pytest.approx([-92.8674007572212, 30.0375721590616]),
-        pytest.approx([-92.8674007572212, 30.0375721590616]),
-        pytest.approx([-92.8674007572212, 30.0375721590616]),
         pytest.approx([-92.86739796410696, 30.03757827508324]),
         pytest.approx([-92.86739517099272, 30.03758439110488]),
         pytest.approx([-92.86739237787847, 30.03759050712652]),
         pytest.approx([-92.86738958476423, 30.03759662314816]),
         pytest.approx([-92.86738679164999, 30.0376027391698]),
         pytest.approx([-92.86738399853574, 30.03760885519144]),
-        pytest.approx([-92.86738399853574, 30.03760885519144]),
-        pytest.approx([-92.86738399853574, 30.03760885519144]),
         pytest.approx([-92.86738025301463, 30.037613458024495]),
         pytest.approx([-92.86737650749352, 30.03761806085755]),
         pytest.approx([-92.8673727619724, 30.037622663690605]),
         pytest.approx([-92.8673690164513, 30.03762726652366]),
         pytest.approx([-92.8673652709302, 30.037631869356716]),
         pytest.approx([-92.86736152540908, 30.03763647218977]),
-        pytest.approx([-92.86736152540908, 30.03763647218977]),
-        pytest.approx([-92.86736152540908, 30.03763647218977]),
         pytest.approx([-92.86735736920825, 30.03764223915101]),
         pytest.approx([-92.86735321300742, 30.037648006112246]),
         pytest.approx([-92.86734905680657, 30.037653773073487]),
         pytest.approx([-92.86734490060574, 30.037659540034724]),
         pytest.approx([-92.86734074440491, 30.03766530699596]),
         pytest.approx([-92.86733658820408, 30.0376710739572]),
-        pytest.approx([-92.86733658820408, 30.0376710739572]),
-        pytest.approx([-92.86733658820408, 30.0376710739572]),
         pytest.approx([-92.86733068291373, 30.037677622219423]),
         pytest.approx([-92.86732477762338, 30.037684170481647]),
         pytest.approx([-92.86731887233302, 30.037690718743868]),
         pytest.approx([-92.86731296704266, 30.03769726700609]),
         pytest.approx([-92.86730706175231, 30.037703815268316]),
         pytest.approx([-92.86730115646196, 30.03771036353054]),
-        pytest.approx([-92.86730115646196, 30.03771036353054]),
-        pytest.approx([-92.86730115646196, 30.03771036353054]),
         pytest.approx([-92.86729828713375, 30.0377165682981]),
         pytest.approx([-92.86729541780554, 30.03772277306566]),
         pytest.approx([-92.86729254847732, 30.03772897783322]),
         pytest.approx([-92.86728967914911, 30.03773518260078]),
         pytest.approx([-92.8672868098209, 30.037741387368342]),
         pytest.approx([-92.86728394049268, 30.0377475921359]),
-        pytest.approx([-92.86728394049268, 30.0377475921359]),
-        pytest.approx([-92.86728394049268, 30.0377475921359]),
         pytest.approx([-92.86728059346734, 30.037753039397053]),
         pytest.approx([-92.867277246442, 30.037758486658205]),
         pytest.approx([-92.86727389941666, 30.037763933919358]),
         pytest.approx([-92.86727055239132, 30.037769381180507]),
         pytest.approx([-92.86726720536598, 30.03777482844166]),
         pytest.approx([-92.86726385834064, 30.03778027570281]),
-        pytest.approx([-92.86726385834064, 30.03778027570281]),
-        pytest.approx([-92.86726385834064, 30.03778027570281]),
         pytest.approx([-92.86726171450707, 30.037782212822886]),
         pytest.approx([-92.8672595706735, 30.037784149942965]),
         pytest.approx([-92.86725742683993, 30.03778608706304]),
         pytest.approx([-92.86725528300634, 30.037788024183115]),
         pytest.approx([-92.86725313917277, 30.037789961303194]),
         pytest.approx([-92.8672509953392, 30.03779189842327]),
-        pytest.approx([-92.8672509953392, 30.03779189842327]),
-        pytest.approx([-92.8672509953392, 30.03779189842327]),
         pytest.approx([-92.86724848770159, 30.03779696732985]),
         pytest.approx([-92.86724598006397, 30.037802036236428]),
         pytest.approx([-92.86724347242634, 30.03780710514301]),
         pytest.approx([-92.86724096478872, 30.03781217404959]),
         pytest.approx([-92.8672384571511, 30.03781724295617]),
         pytest.approx([-92.86723594951349, 30.03782231186275]),
-        pytest.approx([-92.86723594951349, 30.03782231186275]),
-        pytest.approx([-92.86723594951349, 30.03782231186275]),
         pytest.approx([-92.86723302045618, 30.037828580683524]),
         pytest.approx([-92.86723009139888, 30.037834849504296]),
         pytest.approx([-92.86722716234158, 30.03784111832507]),
         pytest.approx([-92.86722423328429, 30.037847387145845]),
         pytest.approx([-92.86722130422699, 30.037853655966618]),
         pytest.approx([-92.86721837516968, 30.03785992478739]),
-        pytest.approx([-92.86721837516968, 30.03785992478739]),
-        pytest.approx([-92.86721837516968, 30.03785992478739]),
         pytest.approx([-92.86721801446811, 30.037863094343276]),
         pytest.approx([-92.86721765376652, 30.03786626389916]),
         pytest.approx([-92.86721729306494, 30.037869433455043]),
         pytest.approx([-92.86721693236336, 30.03787260301093]),
         pytest.approx([-92.86721657166177, 30.037875772566814]),
         pytest.approx([-92.8672162109602, 30.0378789421227]),
-        pytest.approx([-92.8672162109602, 30.0378789421227]),
-        pytest.approx([-92.8672162109602, 30.0378789421227]),
         pytest.approx([-92.86721502112471, 30.037884498901427]),
         pytest.approx([-92.86721383128922, 30.037890055680155]),
         pytest.approx([-92.86721264145373, 30.037895612458883]),
         pytest.approx([-92.86721145161826, 30.037901169237614]),
         pytest.approx([-92.86721026178277, 30.03790672601634]),
         pytest.approx([-92.86720907194729, 30.03791228279507]),
-        pytest.approx([-92.86720907194729, 30.03791228279507]),
-        pytest.approx([-92.86720907194729, 30.03791228279507]),
         pytest.approx([-92.86720789369836, 30.03791790343125]),
         pytest.approx([-92.86720671544944, 30.037923524067427]),
         pytest.approx([-92.8672055372005, 30.037929144703604]),
         pytest.approx([-92.86720435895158, 30.037934765339784]),
         pytest.approx([-92.86720318070266, 30.037940385975965]),
         pytest.approx([-92.86720200245374, 30.03794600661214]),
-        pytest.approx([-92.86720200245374, 30.03794600661214]),
-        pytest.approx([-92.86720200245374, 30.03794600661214]),
         pytest.approx([-92.86720129380726, 30.037952497376427]),
         pytest.approx([-92.86720058516079, 30.037958988140716]),
         pytest.approx([-92.8671998765143, 30.037965478905]),
         pytest.approx([-92.86719916786782, 30.037971969669286]),
         pytest.approx([-92.86719845922136, 30.037978460433575]),
         pytest.approx([-92.86719775057487, 30.03798495119786]),
-        pytest.approx([-92.86719775057487, 30.03798495119786]),
-        pytest.approx([-92.86719775057487, 30.03798495119786]),
         pytest.approx([-92.86719650549155, 30.03798858765275]),
         pytest.approx([-92.86719526040822, 30.037992224107644]),
         pytest.approx([-92.86719401532491, 30.037995860562535]),
         pytest.approx([-92.86719277024159, 30.037999497017427]),
         pytest.approx([-92.86719152515826, 30.03800313347232]),
         pytest.approx([-92.86719028007494, 30.03800676992721]),
-        pytest.approx([-92.86719028007494, 30.03800676992721]),
-        pytest.approx([-92.86719028007494, 30.03800676992721]),
         pytest.approx([-92.86718995620521, 30.038012052526987]),
         pytest.approx([-92.8671896323355, 30.03801733512676]),
         pytest.approx([-92.86718930846577, 30.038022617726536]),
         pytest.approx([-92.86718898459604, 30.038027900326313]),
         pytest.approx([-92.86718866072633, 30.038033182926085]),
         pytest.approx([-92.8671883368566, 30.03803846552586]),
-        pytest.approx([-92.8671883368566, 30.03803846552586]),
-        pytest.approx([-92.8671883368566, 30.03803846552586]),
         pytest.approx([-92.86718801217008, 30.038043777321885]),
         pytest.approx([-92.86718768748354, 30.03804908911791]),
         pytest.approx([-92.86718736279701, 30.03805440091393]),
         pytest.approx([-92.86718703811049, 30.038059712709952]),
         pytest.approx([-92.86718671342395, 30.038065024505975]),
         pytest.approx([-92.86718638873742, 30.038070336302]),
-        pytest.approx([-92.86718638873742, 30.038070336302]),
-        pytest.approx([-92.86718638873742, 30.038070336302]),
         pytest.approx([-92.86718606244993, 30.038075675238268]),
         pytest.approx([-92.86718573616245, 30.038081014174537]),
         pytest.approx([-92.86718540987496, 30.038086353110806]),
         pytest.approx([-92.86718508358747, 30.03809169204707]),
         pytest.approx([-92.8671847573, 30.03809703098334]),
         pytest.approx([-92.8671844310125, 30.03810236991961]),
-        pytest.approx([-92.8671844310125, 30.03810236991961]),
-        pytest.approx([-92.8671844310125, 30.03810236991961]),
         pytest.approx([-92.86718405645115, 30.038105665180073]),
         pytest.approx([-92.86718368188978, 30.038108960440535]),
         pytest.approx([-92.86718330732843, 30.038112255701]),
         pytest.approx([-92.86718293276708, 30.038115550961464]),
         pytest.approx([-92.86718255820571, 30.038118846221927]),
         pytest.approx([-92.86718218364436, 30.03812214148239]),
-        pytest.approx([-92.86718218364436, 30.03812214148239]),
-        pytest.approx([-92.86718218364436, 30.03812214148239]),
         pytest.approx([-92.86718142576878, 30.03812874986609]),
         pytest.approx([-92.8671806678932, 30.03813535824979]),
         pytest.approx([-92.86717991001763, 30.03814196663349]),
         pytest.approx([-92.86717915214204, 30.03814857501719]),
         pytest.approx([-92.86717839426646, 30.03815518340089]),
         pytest.approx([-92.86717763639088, 30.03816179178459]),
-        pytest.approx([-92.86717763639088, 30.03816179178459]),
-        pytest.approx([-92.86717763639088, 30.03816179178459]),
         pytest.approx([-92.86717772375417, 30.03816595290079]),
         pytest.approx([-92.86717781111746, 30.038170114016996]),
         pytest.approx([-92.86717789848075, 30.0381742751332]),
         pytest.approx([-92.86717798584404, 30.038178436249403]),
         pytest.approx([-92.86717807320733, 30.038182597365605]),
         pytest.approx([-92.86717816057062, 30.03818675848181]),
-        pytest.approx([-92.86717816057062, 30.03818675848181]),
-        pytest.approx([-92.86717816057062, 30.03818675848181]),
         pytest.approx([-92.86717914552462, 30.038190542027408]),
         pytest.approx([-92.86718013047863, 30.038194325573006]),
         pytest.approx([-92.86718111543263, 30.038198109118603]),
         pytest.approx([-92.86718210038663, 30.038201892664205]),
         pytest.approx([-92.86718308534064, 30.038205676209802]),
         pytest.approx([-92.86718407029464, 30.0382094597554]),
-        pytest.approx([-92.86718407029464, 30.0382094597554]),
-        pytest.approx([-92.86718407029464, 30.0382094597554]),
         pytest.approx([-92.86718467806696, 30.03821661281349]),
         pytest.approx([-92.8671852858393, 30.038223765871578]),
         pytest.approx([-92.86718589361162, 30.038230918929663]),
         pytest.approx([-92.86718650138394, 30.038238071987752]),
         pytest.approx([-92.86718710915628, 30.03824522504584]),
-        pytest.approx([-92.8671877169286, 30.03825237810393]),
-        pytest.approx([-92.8671877169286, 30.03825237810393]),
         pytest.approx([-92.8671877169286, 30.03825237810393])
     ]
     assert river_class_example.left_bank_relative_coordinates == [
@@ -1773,223 +2094,167 @@ def test_CenterlineWidth_interpolateTrue():
         pytest.approx((2.3834376626360245, 1.2456823255070897)),
         pytest.approx((2.979297102667366, 1.5571028244551266)),
         pytest.approx((3.5751565498267706, 1.8685232872800528)),
-        pytest.approx((3.5751565498267706, 1.8685232872800528)),
-        pytest.approx((3.5751565498267706, 1.8685232872800528)),
         pytest.approx((4.217741808735303, 1.9195158746749756)),
         pytest.approx((4.8603270662057145, 1.9705084555810082)),
         pytest.approx((5.502912325614963, 2.021501030621728)),
         pytest.approx((6.145497585250614, 2.0724935985438995)),
         pytest.approx((6.788082846124377, 2.123486161810862)),
         pytest.approx((7.430668106736567, 2.1744787187346564)),
-        pytest.approx((7.430668106736567, 2.1744787187346564)),
-        pytest.approx((7.430668106736567, 2.1744787187346564)),
         pytest.approx((7.924522761051739, 2.344955990853755)),
         pytest.approx((8.418377419677668, 2.5154332477688195)),
         pytest.approx((8.912232080115817, 2.685910490524039)),
         pytest.approx((9.4060867440788, 2.856387717105856)),
         pytest.approx((9.899941410369026, 3.026864927988388)),
         pytest.approx((10.393796078619014, 3.1973421235928603)),
-        pytest.approx((10.393796078619014, 3.1973421235928603)),
-        pytest.approx((10.393796078619014, 3.1973421235928603)),
         pytest.approx((10.910250536390393, 3.239072228836324)),
         pytest.approx((11.426704992370269, 3.280802329661612)),
         pytest.approx((11.943159449558351, 3.322532428126006)),
         pytest.approx((12.459613907938564, 3.364262521563537)),
         pytest.approx((12.976068365373013, 3.405992610670147)),
         pytest.approx((13.492522825788607, 3.447722696303108)),
-        pytest.approx((13.492522825788607, 3.447722696303108)),
-        pytest.approx((13.492522825788607, 3.447722696303108)),
         pytest.approx((13.98823436325113, 3.619808554795918)),
         pytest.approx((14.483945903763436, 3.7918943991797374)),
         pytest.approx((14.979657447589368, 3.9639802264084287)),
         pytest.approx((15.475368994166264, 4.136066038636282)),
         pytest.approx((15.971080544961456, 4.30815183688106)),
         pytest.approx((16.46679209719587, 4.4802376180320564)),
-        pytest.approx((16.46679209719587, 4.4802376180320564)),
-        pytest.approx((16.46679209719587, 4.4802376180320564)),
         pytest.approx((16.833742843189416, 4.642441056674326)),
         pytest.approx((17.20069359174259, 4.804644484366227)),
         pytest.approx((17.567644344216856, 4.966847901686479)),
         pytest.approx((17.93459509831178, 5.129051309463627)),
         pytest.approx((18.301545855017554, 5.291254705033813)),
         pytest.approx((18.668496614410742, 5.4534580897883)),
-        pytest.approx((18.668496614410742, 5.4534580897883)),
-        pytest.approx((18.668496614410742, 5.4534580897883)),
         pytest.approx((19.295921991723844, 5.637617457829438)),
         pytest.approx((19.923347373016306, 5.821776806417614)),
         pytest.approx((20.550772757515055, 6.00593613258566)),
         pytest.approx((21.17819814537155, 6.190095437748431)),
         pytest.approx((21.805623537427056, 6.374254723625687)),
         pytest.approx((22.433048932416597, 6.5584139868999225)),
-        pytest.approx((22.433048932416597, 6.5584139868999225)),
-        pytest.approx((22.433048932416597, 6.5584139868999225)),
         pytest.approx((23.042820500002314, 6.870567444779401)),
         pytest.approx((23.652592075547542, 7.182720866603648)),
         pytest.approx((24.26236366029314, 7.494874255049636)),
         pytest.approx((24.872135255785214, 7.807027609441057)),
         pytest.approx((25.48190685939749, 8.119180927478507)),
         pytest.approx((26.09167847287943, 8.431334212903316)),
-        pytest.approx((26.09167847287943, 8.431334212903316)),
-        pytest.approx((26.09167847287943, 8.431334212903316)),
         pytest.approx((26.593466781241958, 8.604145963971002)),
         pytest.approx((27.095255093269465, 8.776957697546152)),
         pytest.approx((27.59704340779726, 8.949769417136194)),
         pytest.approx((28.098831724192813, 9.122581120478369)),
         pytest.approx((28.60062004519969, 9.295392807436315)),
         pytest.approx((29.102408368196336, 9.468204479555887)),
-        pytest.approx((29.102408368196336, 9.468204479555887)),
-        pytest.approx((29.102408368196336, 9.468204479555887)),
         pytest.approx((29.605358546716065, 9.64160687603674)),
         pytest.approx((30.108308727897956, 9.815009255289164)),
         pytest.approx((30.611258912696254, 9.988411620250389)),
         pytest.approx((31.114209100708837, 10.161813969534169)),
         pytest.approx((31.6171592918447, 10.335216301394123)),
         pytest.approx((32.12010948457965, 10.50861861876543)),
-        pytest.approx((32.12010948457965, 10.50861861876543)),
-        pytest.approx((32.12010948457965, 10.50861861876543)),
         pytest.approx((32.777831608835875, 10.562311260029698)),
         pytest.approx((33.43555373194309, 10.61600389334576)),
         pytest.approx((34.09327585564672, 10.669696521566816)),
         pytest.approx((34.750997980257885, 10.72338914331209)),
         pytest.approx((35.408720106154576, 10.777081757544142)),
         pytest.approx((36.06644223407064, 10.830774366577998)),
-        pytest.approx((36.06644223407064, 10.830774366577998)),
-        pytest.approx((36.06644223407064, 10.830774366577998)),
         pytest.approx((36.70381562375015, 11.016488373137124)),
         pytest.approx((37.34118901605047, 11.202202357726888)),
         pytest.approx((37.978562413889456, 11.387916319746456)),
         pytest.approx((38.61593581473192, 11.573630262023695)),
         pytest.approx((39.2533092188108, 11.759344182516681)),
         pytest.approx((39.89068262749516, 11.945058081635835)),
-        pytest.approx((39.89068262749516, 11.945058081635835)),
-        pytest.approx((39.89068262749516, 11.945058081635835)),
         pytest.approx((40.287506433352874, 11.977577777840162)),
         pytest.approx((40.684330239995184, 12.010097470099144)),
         pytest.approx((41.08115404659825, 12.042617160064514)),
         pytest.approx((41.477977854259166, 12.075136849322556)),
         pytest.approx((41.87480166189903, 12.10765653618537)),
         pytest.approx((42.27162546939962, 12.14017621904668)),
-        pytest.approx((42.27162546939962, 12.14017621904668)),
-        pytest.approx((42.27162546939962, 12.14017621904668)),
         pytest.approx((43.310995217266935, 12.359529147868367)),
         pytest.approx((44.35036497135013, 12.578882035372455)),
         pytest.approx((45.38973473089535, 12.79823488174488)),
         pytest.approx((46.429104496540006, 13.017587686567271)),
         pytest.approx((47.46847426748293, 13.236940450309634)),
         pytest.approx((48.50784404514664, 13.456293172677196)),
-        pytest.approx((48.50784404514664, 13.456293172677196)),
-        pytest.approx((48.50784404514664, 13.456293172677196)),
         pytest.approx((49.040712160145816, 13.50011869312478)),
         pytest.approx((49.57358027802741, 13.543944209856585)),
         pytest.approx((50.10644839665948, 13.587769722187195)),
         pytest.approx((50.639316513435546, 13.631595229989147)),
         pytest.approx((51.172184632253355, 13.67542073393306)),
         pytest.approx((51.70505275212234, 13.719246233466942)),
-        pytest.approx((51.70505275212234, 13.719246233466942)),
-        pytest.approx((51.70505275212234, 13.719246233466942)),
         pytest.approx((52.261788461593994, 13.630561147244478)),
         pytest.approx((52.81852417367916, 13.5418760696901)),
         pytest.approx((53.37525988481293, 13.453190999883855)),
         pytest.approx((53.93199559972811, 13.364505940505916)),
         pytest.approx((54.488731313507664, 13.275820889756377)),
         pytest.approx((55.04546703090195, 13.18713584845065)),
-        pytest.approx((55.04546703090195, 13.18713584845065)),
-        pytest.approx((55.04546703090195, 13.18713584845065)),
         pytest.approx((55.73771430124403, 13.109173376185243)),
         pytest.approx((56.42996157418882, 13.03121091259442)),
         pytest.approx((57.12220884848127, 12.953248458669778)),
         pytest.approx((57.81445612217067, 12.875286015982658)),
         pytest.approx((58.50670339967475, 12.797323583197)),
         pytest.approx((59.19895067717646, 12.719361158722453)),
-        pytest.approx((59.19895067717646, 12.719361158722453)),
-        pytest.approx((59.19895067717646, 12.719361158722453)),
         pytest.approx((59.75882619863287, 12.630219051383147)),
         pytest.approx((60.318701722862194, 12.541076952120124)),
         pytest.approx((60.87857724652153, 12.451934861745176)),
         pytest.approx((61.43845277228049, 12.362792781818142)),
         pytest.approx((61.99832830053391, 12.273650710974936)),
         pytest.approx((62.55820382679903, 12.18450864758881)),
-        pytest.approx((62.55820382679903, 12.18450864758881)),
-        pytest.approx((62.55820382679903, 12.18450864758881)),
         pytest.approx((63.119485020441, 12.095141215351674)),
         pytest.approx((63.68076621681113, 12.005773793791898)),
         pytest.approx((64.24204741286566, 11.91640637972407)),
         pytest.approx((64.8033286103901, 11.827038974855428)),
         pytest.approx((65.36460981020106, 11.737671580507628)),
         pytest.approx((65.9258910092195, 11.64830419357952)),
-        pytest.approx((65.9258910092195, 11.64830419357952)),
-        pytest.approx((65.9258910092195, 11.64830419357952)),
         pytest.approx((66.62381395542236, 11.569626503758197)),
         pytest.approx((67.32173690286675, 11.490948825150353)),
         pytest.approx((68.0196598508889, 11.412271156575583)),
         pytest.approx((68.71758280082696, 11.333593496530163)),
         pytest.approx((69.41550575199011, 11.254915846446886)),
         pytest.approx((70.11342870355031, 11.176238207507378)),
-        pytest.approx((70.11342870355031, 11.176238207507378)),
-        pytest.approx((70.11342870355031, 11.176238207507378)),
         pytest.approx((70.85785518513035, 10.831324755235775)),
         pytest.approx((71.60228167774052, 10.4864113491013)),
         pytest.approx((72.34670818329857, 10.141497989667403)),
         pytest.approx((73.0911347000199, 9.79658467681413)),
         pytest.approx((73.8355612277462, 9.451671410376873)),
         pytest.approx((74.57998776812849, 9.10675819057038)),
-        pytest.approx((74.57998776812849, 9.10675819057038)),
-        pytest.approx((74.57998776812849, 9.10675819057038)),
         pytest.approx((75.00939429767489, 9.006183355246295)),
         pytest.approx((75.43880082935434, 8.905608527924771)),
         pytest.approx((75.86820736206936, 8.805033708305562)),
         pytest.approx((76.29761389504472, 8.704458896507777)),
         pytest.approx((76.7270204304776, 8.603884092579976)),
         pytest.approx((77.15642696611492, 8.503309296466142)),
-        pytest.approx((77.15642696611492, 8.503309296466142)),
-        pytest.approx((77.15642696611492, 8.503309296466142)),
         pytest.approx((77.88379070939534, 8.28908842208834)),
         pytest.approx((78.61115445747633, 8.074867574648264)),
         pytest.approx((79.33851821126807, 7.860646756829086)),
         pytest.approx((80.06588196935814, 7.6464259671901464)),
         pytest.approx((80.79324573120509, 7.432205204348428)),
         pytest.approx((81.5206094980124, 7.217984471064627)),
-        pytest.approx((81.5206094980124, 7.217984471064627)),
-        pytest.approx((81.5206094980124, 7.217984471064627)),
         pytest.approx((82.11204006231411, 6.992985258393682)),
         pytest.approx((82.70347063093406, 6.767986068421244)),
         pytest.approx((83.29490120466869, 6.54298690392768)),
         pytest.approx((83.88633178202701, 6.317987763456549)),
         pytest.approx((84.47776236607896, 6.092988645818473)),
         pytest.approx((85.06919295505024, 5.867989553620479)),
-        pytest.approx((85.06919295505024, 5.867989553620479)),
-        pytest.approx((85.06919295505024, 5.867989553620479)),
         pytest.approx((85.91564467845026, 5.796581935673351)),
         pytest.approx((86.7620964026888, 5.72517432863117)),
         pytest.approx((87.60854812918856, 5.653766732543086)),
         pytest.approx((88.45499985701416, 5.582359146068345)),
         pytest.approx((89.30145158472173, 5.510951571835058)),
         pytest.approx((90.14790331392047, 5.439544008596247)),
-        pytest.approx((90.14790331392047, 5.439544008596247)),
-        pytest.approx((90.14790331392047, 5.439544008596247)),
         pytest.approx((90.62867488570063, 5.0682971614906345)),
         pytest.approx((91.10944647082998, 4.697050346742778)),
         pytest.approx((91.59021806842887, 4.325803564355905)),
         pytest.approx((92.07098967767374, 3.954556812886206)),
         pytest.approx((92.55176130102095, 3.583310095113783)),
         pytest.approx((93.0325329360723, 3.2120634096859426)),
-        pytest.approx((93.0325329360723, 3.2120634096859426)),
-        pytest.approx((93.0325329360723, 3.2120634096859426)),
         pytest.approx((93.62964762169312, 2.9848633800965727)),
         pytest.approx((94.22676231141571, 2.757663375072605)),
         pytest.approx((94.82387700807313, 2.5304633946455244)),
         pytest.approx((95.42099170742287, 2.3032634387673747)),
         pytest.approx((96.01810641322477, 2.0760635074742653)),
         pytest.approx((96.61522112487772, 1.8488636007734318)),
-        pytest.approx((96.61522112487772, 1.8488636007734318)),
-        pytest.approx((96.61522112487772, 1.8488636007734318)),
         pytest.approx((97.35194604020509, 1.6318429789816145)),
         pytest.approx((98.08867096043703, 1.4148223847569648)),
         pytest.approx((98.8253958863679, 1.1978018195217297)),
         pytest.approx((99.5621208165146, 0.9807812846144008)),
         pytest.approx((100.29884575248121, 0.7637607786729381)),
-        pytest.approx((101.03557069244674, 0.5467403003309471)),
-        pytest.approx((101.03557069244674, 0.5467403003309471)),
         pytest.approx((101.03557069244674, 0.5467403003309471))
     ]
     assert river_class_example.right_bank_relative_coordinates == [
@@ -2000,223 +2265,167 @@ def test_CenterlineWidth_interpolateTrue():
         pytest.approx((-14.975336796871842, 105.55213867491794)),
         pytest.approx((-14.850992615941983, 105.58869112859624)),
         pytest.approx((-14.726648435102671, 105.62524358470733)),
-        pytest.approx((-14.726648435102671, 105.62524358470733)),
-        pytest.approx((-14.726648435102671, 105.62524358470733)),
         pytest.approx((-14.10234616282189, 106.01825981502661)),
         pytest.approx((-13.478043877754804, 106.4112760033269)),
         pytest.approx((-12.853741577020662, 106.80429214796739)),
         pytest.approx((-12.22943926146699, 107.19730824534734)),
         pytest.approx((-11.605136932720168, 107.590324299008)),
         pytest.approx((-10.980834588706166, 107.98334030850498)),
-        pytest.approx((-10.980834588706166, 107.98334030850498)),
-        pytest.approx((-10.980834588706166, 107.98334030850498)),
         pytest.approx((-10.521492159418395, 108.25855987953766)),
         pytest.approx((-10.06214972236918, 108.53377942900788)),
         pytest.approx((-9.602807278836877, 108.8089989540503)),
         pytest.approx((-9.14346482758558, 109.08421845672726)),
         pytest.approx((-8.684122369410494, 109.35943793747248)),
         pytest.approx((-8.224779903906521, 109.63465739390857)),
-        pytest.approx((-8.224779903906521, 109.63465739390857)),
-        pytest.approx((-8.224779903906521, 109.63465739390857)),
         pytest.approx((-7.890336014303838, 109.6636412186505)),
         pytest.approx((-7.55589212339897, 109.69262504150882)),
         pytest.approx((-7.221448232441239, 109.72160886277365)),
         pytest.approx((-6.887004341402043, 109.75059268203398)),
         pytest.approx((-6.552560451516957, 109.77957649957516)),
         pytest.approx((-6.218116559125793, 109.80856031565474)),
-        pytest.approx((-6.218116559125793, 109.80856031565474)),
-        pytest.approx((-6.218116559125793, 109.80856031565474)),
         pytest.approx((-5.884606733286801, 110.04930915246563)),
         pytest.approx((-5.551096903493658, 110.29005797511032)),
         pytest.approx((-5.21758706728296, 110.53080678443223)),
         pytest.approx((-4.884077225490876, 110.77155557805509)),
         pytest.approx((-4.550567377280546, 111.01230435685076)),
         pytest.approx((-4.2170575255238525, 111.25305312138605)),
-        pytest.approx((-4.2170575255238525, 111.25305312138605)),
-        pytest.approx((-4.2170575255238525, 111.25305312138605)),
         pytest.approx((-3.6709457071651515, 111.48556731926283)),
         pytest.approx((-3.1248338824485287, 111.71808149442512)),
         pytest.approx((-2.578722052171496, 111.95059564635838)),
         pytest.approx((-2.0326102183809795, 112.18310977674813)),
         pytest.approx((-1.486498378223162, 112.41562388275604)),
         pytest.approx((-0.9403865325118183, 112.64813796581723)),
-        pytest.approx((-0.9403865325118183, 112.64813796581723)),
-        pytest.approx((-0.9403865325118183, 112.64813796581723)),
         pytest.approx((-0.26240396792542703, 112.91752665842465)),
         pytest.approx((0.4155786022817913, 113.186915316581)),
         pytest.approx((1.093561180555713, 113.45630394304986)),
         pytest.approx((1.7715437656734863, 113.72569253641639)),
         pytest.approx((2.449526358450872, 113.9950810953813)),
         pytest.approx((3.1275089584774993, 114.26446962246438)),
-        pytest.approx((3.1275089584774993, 114.26446962246438)),
-        pytest.approx((3.1275089584774993, 114.26446962246438)),
         pytest.approx((3.6377509091571802, 114.62571937823999)),
         pytest.approx((4.147992871715085, 114.98696910058355)),
         pytest.approx((4.658234846156605, 115.34821878962659)),
         pytest.approx((5.168476832890839, 115.70946844401124)),
         pytest.approx((5.678718831500057, 116.07071806705339)),
         pytest.approx((6.188960842797235, 116.43196765474976)),
-        pytest.approx((6.188960842797235, 116.43196765474976)),
-        pytest.approx((6.188960842797235, 116.43196765474976)),
         pytest.approx((6.828250476742086, 116.8328258406914)),
         pytest.approx((7.467540125762989, 117.23368397954823)),
         pytest.approx((8.106829789437628, 117.63454207259221)),
         pytest.approx((8.74611946821025, 118.03540011972058)),
         pytest.approx((9.385409162858446, 118.43625811959629)),
         pytest.approx((10.024698871772665, 118.8371160736737)),
-        pytest.approx((10.024698871772665, 118.8371160736737)),
-        pytest.approx((10.024698871772665, 118.8371160736737)),
         pytest.approx((10.750600038989587, 119.40667239817522)),
         pytest.approx((11.47650123549632, 119.97622864790875)),
         pytest.approx((12.20240246165959, 120.54578482594971)),
         pytest.approx((12.928303719103198, 121.11534092726967)),
         pytest.approx((13.65420500500919, 121.68489695268711)),
         pytest.approx((14.380106323415536, 122.25445290305235)),
-        pytest.approx((14.380106323415536, 122.25445290305235)),
-        pytest.approx((14.380106323415536, 122.25445290305235)),
         pytest.approx((15.067926976234254, 122.53119134227906)),
         pytest.approx((15.755747635440438, 122.80792974762709)),
         pytest.approx((16.44356830305525, 123.084668117841)),
         pytest.approx((17.131388978755457, 123.36140645364361)),
         pytest.approx((17.819209661637263, 123.63814475515153)),
         pytest.approx((18.507030352124634, 123.91488302281842)),
-        pytest.approx((18.507030352124634, 123.91488302281842)),
-        pytest.approx((18.507030352124634, 123.91488302281842)),
         pytest.approx((19.110879650636264, 124.23769596187702)),
         pytest.approx((19.714728959914954, 124.56050886580546)),
         pytest.approx((20.318578278564022, 124.8833217352533)),
         pytest.approx((20.922427606618456, 125.20613456887332)),
         pytest.approx((21.526276944469565, 125.52894736858958)),
         pytest.approx((22.130126292783142, 125.85176013231695)),
-        pytest.approx((22.130126292783142, 125.85176013231695)),
-        pytest.approx((22.130126292783142, 125.85176013231695)),
         pytest.approx((22.344864378450843, 126.05852980935643)),
         pytest.approx((22.55960246760861, 126.26529947886209)),
         pytest.approx((22.774340559727587, 126.47206914103262)),
         pytest.approx((22.98907865630092, 126.6788387957193)),
         pytest.approx((23.203816757781578, 126.88560844267667)),
         pytest.approx((23.41855486155756, 127.09237808056149)),
-        pytest.approx((23.41855486155756, 127.09237808056149)),
-        pytest.approx((23.41855486155756, 127.09237808056149)),
         pytest.approx((23.980461553925196, 127.33423249511533)),
         pytest.approx((24.542368251720088, 127.57608688686464)),
         pytest.approx((25.104274955972937, 127.81794125546394)),
         pytest.approx((25.666181664807993, 128.05979559661623)),
         pytest.approx((26.228088379181788, 128.3016499139833)),
         pytest.approx((26.7899951007169, 128.54350420820282)),
-        pytest.approx((26.7899951007169, 128.54350420820282)),
-        pytest.approx((26.7899951007169, 128.54350420820282)),
         pytest.approx((27.484916485659763, 128.82600271188278)),
         pytest.approx((28.17983787903796, 129.10850118061384)),
         pytest.approx((28.874759279693414, 129.3909996133234)),
         pytest.approx((29.56968068821777, 129.673498009392)),
         pytest.approx((30.26460210478444, 129.9559963707703)),
         pytest.approx((30.959523529647694, 130.23849469718746)),
-        pytest.approx((30.959523529647694, 130.23849469718746)),
-        pytest.approx((30.959523529647694, 130.23849469718746)),
         pytest.approx((31.310878975524115, 130.2732800868406)),
         pytest.approx((31.662234420469098, 130.30806547548207)),
         pytest.approx((32.013589865431655, 130.3428508601667)),
         pytest.approx((32.364945311474585, 130.37763624157736)),
         pytest.approx((32.71630075832399, 130.41242162495462)),
         pytest.approx((33.06765620516542, 130.44720700263116)),
-        pytest.approx((33.06765620516542, 130.44720700263116)),
-        pytest.approx((33.06765620516542, 130.44720700263116)),
         pytest.approx((33.68364360472166, 130.56195889331005)),
         pytest.approx((34.299631006858846, 130.6767107717839)),
         pytest.approx((34.91561840951857, 130.79146263680425)),
         pytest.approx((35.53160581576857, 130.90621448828537)),
         pytest.approx((36.14759322205002, 131.02096632848497)),
         pytest.approx((36.763580631114245, 131.13571815587736)),
-        pytest.approx((36.763580631114245, 131.13571815587736)),
-        pytest.approx((36.763580631114245, 131.13571815587736)),
         pytest.approx((37.38664682303806, 131.24935236605444)),
         pytest.approx((38.00971301718413, 131.36298656522368)),
         pytest.approx((38.63277921285705, 131.47662075110392)),
         pytest.approx((39.255845409955825, 131.59025492188178)),
         pytest.approx((39.8789116080933, 131.70388908235455)),
         pytest.approx((40.50197780926614, 131.8175232284112)),
-        pytest.approx((40.50197780926614, 131.8175232284112)),
-        pytest.approx((40.50197780926614, 131.8175232284112)),
         pytest.approx((41.221499853830494, 131.8858632698356)),
         pytest.approx((41.94102189877964, 131.95420329767248)),
         pytest.approx((42.66054394465523, 132.02254331992734)),
         pytest.approx((43.38006599209736, 132.09088333170715)),
         pytest.approx((44.09958804066891, 132.15922333358063)),
         pytest.approx((44.81911009107479, 132.22756332930945)),
-        pytest.approx((44.81911009107479, 132.22756332930945)),
-        pytest.approx((44.81911009107479, 132.22756332930945)),
         pytest.approx((45.222223765938395, 132.34764617713827)),
         pytest.approx((45.625337441688686, 132.46772901682172)),
         pytest.approx((46.028451118910084, 132.58781184662325)),
         pytest.approx((46.43156479852463, 132.707894668662)),
         pytest.approx((46.83467847951514, 132.82797748135843)),
         pytest.approx((47.23779216190811, 132.94806028612896)),
-        pytest.approx((47.23779216190811, 132.94806028612896)),
-        pytest.approx((47.23779216190811, 132.94806028612896)),
         pytest.approx((47.8233850105933, 132.97929030245456)),
         pytest.approx((48.408977860593076, 133.01052031510727)),
         pytest.approx((48.99457071128962, 133.04175032636596)),
         pytest.approx((49.58016356206395, 133.07298033326236)),
         pytest.approx((50.16575641398247, 133.1042103353353)),
         pytest.approx((50.75134926525543, 133.13544033498613)),
-        pytest.approx((50.75134926525543, 133.13544033498613)),
-        pytest.approx((50.75134926525543, 133.13544033498613)),
         pytest.approx((51.34017861399536, 133.16674907370552)),
         pytest.approx((51.92900796211323, 133.19805781001284)),
         pytest.approx((52.51783731018109, 133.2293665399446)),
         pytest.approx((53.106666659976376, 133.26067526849937)),
         pytest.approx((53.69549600931226, 133.2919839933097)),
         pytest.approx((54.28432536037567, 133.32329271445957)),
-        pytest.approx((54.28432536037567, 133.32329271445957)),
-        pytest.approx((54.28432536037567, 133.32329271445957)),
         pytest.approx((54.87616329358257, 133.35475580828995)),
         pytest.approx((55.46800122697353, 133.38621889721122)),
         pytest.approx((56.05983916087113, 133.41768198473727)),
         pytest.approx((56.65167709537443, 133.4491450688804)),
         pytest.approx((57.24351503047214, 133.48060814659675)),
         pytest.approx((57.83535296634942, 133.5120712243666)),
-        pytest.approx((57.83535296634942, 133.5120712243666)),
-        pytest.approx((57.83535296634942, 133.5120712243666)),
         pytest.approx((58.20064319090267, 133.54819302162122)),
         pytest.approx((58.56593341574673, 133.58431482054306)),
         pytest.approx((58.93122364162784, 133.6204366128282)),
         pytest.approx((59.29651386790601, 133.65655840562007)),
         pytest.approx((59.6618040944155, 133.69268019511836)),
         pytest.approx((60.027094320075, 133.7288019832939)),
-        pytest.approx((60.027094320075, 133.7288019832939)),
-        pytest.approx((60.027094320075, 133.7288019832939)),
         pytest.approx((60.75965492851349, 133.80188973397276)),
         pytest.approx((61.49221553647978, 133.87497747664625)),
         pytest.approx((62.224776146267544, 133.94806520770376)),
         pytest.approx((62.95733675802338, 134.02115293016735)),
         pytest.approx((63.68989737033755, 134.09424064384254)),
         pytest.approx((64.4224579843681, 134.1673283462854)),
-        pytest.approx((64.4224579843681, 134.1673283462854)),
-        pytest.approx((64.4224579843681, 134.1673283462854)),
         pytest.approx((64.88373045273698, 134.15889660830697)),
         pytest.approx((65.34500292298029, 134.1504648724988)),
         pytest.approx((65.80627539406689, 134.14203313600785)),
         pytest.approx((66.26754786360596, 134.1336014004578)),
         pytest.approx((66.72882033493202, 134.12516966686695)),
         pytest.approx((67.19009280594804, 134.11673793243338)),
-        pytest.approx((67.19009280594804, 134.11673793243338)),
-        pytest.approx((67.19009280594804, 134.11673793243338)),
         pytest.approx((67.60950935957122, 134.0217346991416)),
         pytest.approx((68.02892591337285, 133.9267314709747)),
         pytest.approx((68.44834246871405, 133.83172825196883)),
         pytest.approx((68.86775902545843, 133.7367250411627)),
         pytest.approx((69.28717558305524, 133.6417218361036)),
         pytest.approx((69.70659214132293, 133.54671863851024)),
-        pytest.approx((69.70659214132293, 133.54671863851024)),
-        pytest.approx((69.70659214132293, 133.54671863851024)),
         pytest.approx((70.4995300018371, 133.4880898367826)),
         pytest.approx((71.2924678631111, 133.42946104385751)),
         pytest.approx((72.08540572482488, 133.3708322603587)),
         pytest.approx((72.8783435878086, 133.3122034845606)),
         pytest.approx((73.6712814529808, 133.25357471613924)),
-        pytest.approx((74.46421931823045, 133.19494595720758)),
-        pytest.approx((74.46421931823045, 133.19494595720758)),
         pytest.approx((74.46421931823045, 133.19494595720758))
     ]
     assert river_class_example.right_bank_length == pytest.approx(
@@ -2724,6 +2933,525 @@ def test_CenterlineWidth_interpolateTrue():
     assert river_class_example.sinuosity == pytest.approx(1.0136729726038907)
 
 
+def test_CenterlineWidth_interpolateSpacing():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), interpolate_data=True, interpolate_spacing_m=2)
+    assert river_class_example.interpolate_spacing_m == 2
+    assert len(river_class_example.left_bank_coordinates) == 67
+    assert len(river_class_example.right_bank_coordinates) == 65
+    assert river_class_example.left_bank_coordinates[:3] == [
+        pytest.approx([-92.86856870164004, 30.03758064742554]),
+        pytest.approx([-92.86856224397519, 30.037591397860908]),
+        pytest.approx([-92.86855578630893, 30.03760214829596])
+    ]
+    assert river_class_example.left_bank_coordinates[-1] == pytest.approx(
+        [-92.86856303294287, 30.03849208414191])
+    # no repeated points and each point at most interpolate_spacing_m meters from the next point
+    for bank_coordinates in [
+            river_class_example.left_bank_coordinates,
+            river_class_example.right_bank_coordinates
+    ]:
+        bank_coordinates = np.array(bank_coordinates)
+        _, _, spacing_m = Geod(ellps="WGS84").inv(bank_coordinates[:-1, 0],
+                                                  bank_coordinates[:-1, 1],
+                                                  bank_coordinates[1:, 0],
+                                                  bank_coordinates[1:, 1])
+        assert (spacing_m > 0).all()
+        assert (spacing_m <= 2).all()
+    assert river_class_example.left_bank_length == pytest.approx(
+        0.10570962275794869)
+    assert river_class_example.right_bank_length == pytest.approx(
+        0.09705816897499008)
+    assert river_class_example.centerline_length == pytest.approx(
+        0.0862564786413138)
+
+
+def test_CenterlineWidth_interpolateWidthRatio():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(),
+        interpolate_data=True,
+        interpolate_width_ratio=0.05)
+    river_input = centerline_width.CenterlineWidth(csv_data=csv_data())
+    assert river_class_example.interpolate_width_ratio == 0.05
+    # only the segment longer than 0.05 * the local channel width gains a point on each bank
+    assert len(river_class_example.left_bank_coordinates) == 30
+    assert len(river_class_example.right_bank_coordinates) == 30
+    assert river_class_example.left_bank_coordinates[14] == pytest.approx(
+        [-92.86843600801737, 30.037990105850373])
+    assert river_class_example.right_bank_coordinates[10] == pytest.approx(
+        [-92.86731887233653, 30.03769071874509])
+    # all the input bank points are kept as is
+    left_bank_input = river_input.left_bank_coordinates
+    right_bank_input = river_input.right_bank_coordinates
+    assert river_class_example.left_bank_coordinates[:
+                                                     14] == left_bank_input[:
+                                                                            14]
+    assert river_class_example.left_bank_coordinates[15:] == left_bank_input[
+        14:]
+    assert river_class_example.right_bank_coordinates[:
+                                                      10] == right_bank_input[:
+                                                                              10]
+    assert river_class_example.right_bank_coordinates[11:] == right_bank_input[
+        10:]
+    assert river_class_example.centerline_length == pytest.approx(
+        0.08284076898938503)
+
+
+def test_CenterlineWidth_localChannelWidth():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    assert centerline_width._local_channel_width(
+        river_class_example.left_bank_coordinates,
+        river_class_example.right_bank_coordinates)[:4].tolist() == [
+            pytest.approx(106.53550910019163),
+            pytest.approx(105.27495287873818),
+            pytest.approx(105.74165302700976),
+            pytest.approx(105.43088503126629)
+        ]
+
+
+def sinuous_river_data():
+    # sinuous channel (~2.7 km long, ~65 m wide) with noise on the bank points
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1, 400)
+    longitude = -92.87 + 0.02 * t
+    latitude = 30.03 + 0.002 * np.sin(4 * np.pi * t)
+    return pd.DataFrame({
+        "llat": latitude + 0.0003 + rng.normal(0, 1e-5, t.size),
+        "llon": longitude + rng.normal(0, 1e-5, t.size),
+        "rlat": latitude - 0.0003 + rng.normal(0, 1e-5, t.size),
+        "rlon": longitude + rng.normal(0, 1e-5, t.size)
+    })
+
+
+def test_CenterlineWidth_simplifyTolerance():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), simplify_tolerance_m=0.5)
+    assert river_class_example.simplify_tolerance_m == 0.5
+    assert river_class_example.profile["bank interpolation"][
+        "simplified_removed_points"] == 39
+    assert river_class_example.profile["bank interpolation"][
+        "simplified_added_points"] == 8
+    assert len(river_class_example.left_bank_coordinates) == 14
+    assert len(river_class_example.right_bank_coordinates) == 13
+
+
+@pytest.mark.parametrize("simplify_tolerance_m", [0.5, 2, 5])
+def test_CenterlineWidth_simplifyToleranceCenterline(simplify_tolerance_m):
+    # the simplified banks are re-densified, the centerline has the same length and start/end as the input banks
+    geodesic = Geod(ellps="WGS84")
+    river_input = centerline_width.CenterlineWidth.from_dataframe(
+        dataframe=sinuous_river_data())
+    river_simplified = centerline_width.CenterlineWidth.from_dataframe(
+        dataframe=sinuous_river_data(),
+        simplify_tolerance_m=simplify_tolerance_m)
+    assert river_simplified.profile["bank interpolation"][
+        "simplified_removed_points"] > 0
+    assert river_simplified.centerline_length == pytest.approx(
+        river_input.centerline_length, rel=0.01)
+    for simplified_node, input_node in [
+        (river_simplified.starting_node, river_input.starting_node),
+        (river_simplified.ending_node, river_input.ending_node)
+    ]:
+        _, _, distance_m = geodesic.inv(simplified_node[0], simplified_node[1],
+                                        input_node[0], input_node[1])
+        assert distance_m < 15
+
+
+def test_CenterlineWidth_simplifyBankCoordinates():
+    # collinear points are removed, the first/last points are always kept
+    bank_coordinates = np.array([[-92.868, 30.037], [-92.8679, 30.0371],
+                                 [-92.8678, 30.0372], [-92.8677, 30.0373]])
+    assert centerline_width._simplify_bank_coordinates(
+        bank_coordinates, bank_coordinates[0],
+        1).tolist() == [[-92.868, 30.037], [-92.8677, 30.0373]]
+    assert centerline_width._simplify_bank_coordinates(
+        bank_coordinates[:2], bank_coordinates[0],
+        1).tolist() == [[-92.868, 30.037], [-92.8679, 30.0371]]
+    # the remaining bank points are an ordered subset of the input (first/last points are always kept)
+    river_input = centerline_width.CenterlineWidth(csv_data=csv_data())
+    left_bank_coordinates = np.array(river_input.left_bank_coordinates)
+    right_bank_coordinates = np.array(river_input.right_bank_coordinates)
+    assert centerline_width._simplify_bank_coordinates(
+        left_bank_coordinates, left_bank_coordinates[0],
+        0.5).tolist() == left_bank_coordinates[[
+            0, 1, 4, 10, 15, 20, 24, 25, 26, 28
+        ]].tolist()
+    assert centerline_width._simplify_bank_coordinates(
+        right_bank_coordinates, left_bank_coordinates[0],
+        0.5).tolist() == right_bank_coordinates[[
+            0, 3, 4, 7, 10, 15, 20, 25, 28
+        ]].tolist()
+    # repeated points are kept by index
+    repeated_coordinates = np.array([[-92.868, 30.037], [-92.8681, 30.0372],
+                                     [-92.868, 30.037], [-92.8677, 30.0373]])
+    assert centerline_width._simplify_bank_coordinates(
+        repeated_coordinates, repeated_coordinates[0],
+        1).tolist() == repeated_coordinates[[0, 1, 2, 3]].tolist()
+
+
+def test_CenterlineWidth_banksFlipped():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    left_bank_coordinates = river_class_example.left_bank_coordinates
+    right_bank_coordinates = river_class_example.right_bank_coordinates
+    assert centerline_width._banks_flipped(left_bank_coordinates,
+                                           right_bank_coordinates) is False
+    assert centerline_width._banks_flipped(
+        left_bank_coordinates, right_bank_coordinates[::-1]) is True
+
+
+def test_CenterlineWidth_autoOrient():
+    river_class_example = centerline_width.CenterlineWidth(csv_data=csv_data())
+    flipped_dataframe = pd.read_csv(csv_data())
+    flipped_dataframe[["rlat",
+                       "rlon"]] = flipped_dataframe[["rlat",
+                                                     "rlon"]].values[::-1]
+    river_auto_orient = centerline_width.CenterlineWidth.from_dataframe(
+        dataframe=flipped_dataframe, auto_orient=True)
+    assert river_auto_orient.auto_orient is True
+    assert river_auto_orient.profile["bank interpolation"][
+        "reversed_banks"] == 1
+    assert river_auto_orient.right_bank_coordinates == river_class_example.right_bank_coordinates
+    assert river_auto_orient.centerline_voronoi == river_class_example.centerline_voronoi
+    # banks in the correct order are not changed
+    river_in_order = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                      auto_orient=True)
+    assert "reversed_banks" not in river_in_order.profile["bank interpolation"]
+    assert river_in_order.right_bank_coordinates == river_class_example.right_bank_coordinates
+
+
+def test_CenterlineWidth_banksFlipped_polygonEllipsoid(monkeypatch):
+    # the flipped banks diagnostic of an invalid polygon uses the ellipsoid of the river
+    flipped_ellipsoids = []
+    banks_flipped = centerline_width.preprocessing._banks_flipped
+
+    def banks_flipped_recorded(left_bank_lst, right_bank_lst, ellipsoid):
+        flipped_ellipsoids.append(ellipsoid)
+        return banks_flipped(left_bank_lst, right_bank_lst, ellipsoid)
+
+    monkeypatch.setattr(centerline_width.preprocessing, "_banks_flipped",
+                        banks_flipped_recorded)
+    flipped_dataframe = pd.read_csv(csv_data())
+    flipped_dataframe[["rlat",
+                       "rlon"]] = flipped_dataframe[["rlat",
+                                                     "rlon"]].values[::-1]
+    river_flipped = centerline_width.CenterlineWidth.from_dataframe(
+        dataframe=flipped_dataframe, ellipsoid="sphere")
+    river_flipped.bank_polygon
+    assert flipped_ellipsoids == ["sphere"]
+
+
+@pytest.mark.parametrize("interpolate_data", [False, True])
+def test_CenterlineWidth_csgraphBackend(interpolate_data):
+    river_networkx = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), interpolate_data=interpolate_data)
+    river_csgraph = centerline_width.CenterlineWidth(
+        csv_data=csv_data(),
+        interpolate_data=interpolate_data,
+        graph_backend="csgraph")
+    assert river_csgraph.graph_backend == "csgraph"
+    # same starting/ending node, all possible paths, and centerline as the NetworkX graph
+    assert river_csgraph.starting_node == river_networkx.starting_node
+    assert river_csgraph.ending_node == river_networkx.ending_node
+    assert river_csgraph.x_voronoi_ridge_point == river_networkx.x_voronoi_ridge_point
+    assert river_csgraph.y_voronoi_ridge_point == river_networkx.y_voronoi_ridge_point
+    assert river_csgraph.centerline_voronoi == river_networkx.centerline_voronoi
+    assert river_csgraph.profile["graph build"][
+        "graph_nodes"] == river_networkx.profile["graph build"]["graph_nodes"]
+    assert river_csgraph.profile["graph build"][
+        "graph_edges"] == river_networkx.profile["graph build"]["graph_edges"]
+    # the NetworkX graph is not generated
+    assert "_voronoi_nx_graph" not in river_csgraph.__dict__
+
+
+def test_CenterlineWidth_csgraphTiles():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), interpolate_data=True, tile_size=60)
+    river_csgraph = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                     interpolate_data=True,
+                                                     tile_size=60,
+                                                     graph_backend="csgraph")
+    assert len(river_csgraph.centerline_voronoi) > 0
+    assert river_csgraph.centerline_voronoi == river_class_example.centerline_voronoi
+    assert "tiled centerline" in river_csgraph.profile
+
+
+def test_startingEndingNodeIndices():
+    # node 4 is the closest to the top but its start point (3) is not on the largest subgraph
+    connections = np.array([[0, 1], [0, 2], [2, 0], [3, 4]])
+    distance_to_top = np.array([5.0, 3.0, 3.0, 1.0, 0.0])
+    distance_to_bottom = np.array([0.0, 2.0, 1.0, 4.0, 5.0])
+    in_largest_subgraph = np.array([True, True, True, False, True])
+    # nodes 1 and 2 are the same distance from the top, the later node is kept
+    assert centerline_width._starting_ending_node_indices(
+        connections, distance_to_top, distance_to_bottom,
+        in_largest_subgraph) == (2, 0)
+    assert centerline_width._starting_ending_node_indices(
+        np.empty((0, 2)), np.array([]), np.array([]),
+        np.array([], dtype=bool)) == (None, None)
+
+
+def test_shortestPath_astar():
+    # fewest connections: (0, 0) -> (0.05, 0.01) -> (0, 0.02), shortest distance: along the longitude 0
+    all_points_dict = {
+        (0.0, 0.0): [(0.0, 0.005), (0.05, 0.01)],
+        (0.0, 0.005): [(0.0, 0.015)],
+        (0.0, 0.015): [(0.0, 0.02)],
+        (0.05, 0.01): [(0.0, 0.02)]
+    }
+    nx_graph, _ = centerline_width._generate_nx_graph(all_points_dict, "WGS84")
+    assert centerline_width._networkx_graph_shortest_path(
+        nx_graph, (0.0, 0.0), (0.0, 0.02), "breadth_first") == [(0.0, 0.0),
+                                                                (0.05, 0.01),
+                                                                (0.0, 0.02)]
+    assert centerline_width._networkx_graph_shortest_path(
+        nx_graph, (0.0, 0.0), (0.0, 0.02), "astar") == [(0.0, 0.0),
+                                                        (0.0, 0.005),
+                                                        (0.0, 0.015),
+                                                        (0.0, 0.02)]
+
+    vertex_positions = np.array(list(nx_graph.nodes()))
+    connection_ids = np.array([[0, 1], [0, 2], [1, 3], [3, 4], [2, 4]])
+    _, _, csgraph, _ = centerline_width._generate_csgraph(
+        vertex_positions, connection_ids)
+    assert centerline_width._csgraph_shortest_path(
+        csgraph, 0, 4, "breadth_first") == [0, 2, 4]
+    assert centerline_width._csgraph_shortest_path(csgraph, 0, 4,
+                                                   "astar") == [0, 1, 3, 4]
+
+
+@pytest.mark.parametrize("graph_backend", ["networkx", "csgraph"])
+def test_CenterlineWidth_pathSearchAstar(graph_backend):
+    river_breadth_first = centerline_width.CenterlineWidth(
+        csv_data=csv_data(),
+        interpolate_data=True,
+        graph_backend=graph_backend)
+    river_astar = centerline_width.CenterlineWidth(csv_data=csv_data(),
+                                                   interpolate_data=True,
+                                                   graph_backend=graph_backend,
+                                                   path_search="astar")
+    assert river_astar.path_search == "astar"
+    assert river_astar.starting_node == river_breadth_first.starting_node
+    assert river_astar.ending_node == river_breadth_first.ending_node
+    assert river_astar.centerline_voronoi[0] == river_astar.starting_node
+    assert river_astar.centerline_voronoi[-1] == river_astar.ending_node
+    assert river_astar.centerline_length <= river_breadth_first.centerline_length
+
+
+def test_generateNxGraph():
+    all_points_dict = {
+        (0.0, 0.0): [(0.0, 1.0), (1.0, 0.0)],
+        (0.0, 1.0): [(0.0, 2.0)],
+        (5.0, 5.0): [(5.0, 6.0)]
+    }
+    nx_graph, largest_subgraph_nodes = centerline_width._generate_nx_graph(
+        all_points_dict, "WGS84")
+    assert list(nx_graph.nodes()) == [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0),
+                                      (0.0, 2.0), (5.0, 5.0), (5.0, 6.0)]
+    assert nx_graph.nodes[(0.0, 1.0)]["pos"] == (0.0, 1.0)
+    # edges weighted by the geodesic distance (meters)
+    geodesic = Geod(ellps="WGS84")
+    assert nx_graph[(0.0, 0.0)][(0.0, 1.0)]["weight"] == pytest.approx(
+        geodesic.inv(0.0, 0.0, 0.0, 1.0)[2])
+    assert nx_graph[(0.0, 0.0)][(1.0, 0.0)]["weight"] == pytest.approx(
+        geodesic.inv(0.0, 0.0, 1.0, 0.0)[2])
+    assert nx_graph[(5.0, 5.0)][(5.0, 6.0)]["weight"] == pytest.approx(
+        geodesic.inv(5.0, 5.0, 5.0, 6.0)[2])
+    assert sorted(largest_subgraph_nodes) == [(0.0, 0.0), (0.0, 1.0),
+                                              (0.0, 2.0), (1.0, 0.0)]
+
+
+def test_generateCsgraph():
+    # connections 0 -> 1, 1 -> 2, 0 -> 3 (start points ordered as first found), 4 -> 5 (smaller subgraph)
+    vertex_positions = np.array([[0.0, 0.0], [0.0, 1.0], [0.0, 2.0],
+                                 [1.0, 0.0], [5.0, 5.0], [5.0, 6.0]])
+    connection_ids = np.array([[0, 1], [1, 2], [0, 3], [4, 5]])
+    node_coordinates, connections, csgraph, largest_subgraph_nodes = centerline_width._generate_csgraph(
+        vertex_positions, connection_ids)
+    assert connections.tolist() == [[0, 1], [0, 2], [1, 3], [4, 5]]
+    assert node_coordinates.tolist() == [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0],
+                                         [0.0, 2.0], [5.0, 5.0], [5.0, 6.0]]
+    assert largest_subgraph_nodes.tolist() == [0, 1, 2, 3]
+    # edges weighted by the geodesic distance (meters)
+    assert csgraph[0, 1] == pytest.approx(
+        Geod(ellps="WGS84").inv(0.0, 0.0, 0.0, 1.0)[2])
+    assert centerline_width._csgraph_shortest_path(csgraph, 3,
+                                                   2) == [3, 1, 0, 2]
+    assert centerline_width._csgraph_shortest_path(csgraph, 0, 5) is None
+
+
+def test_CenterlineWidth_delaunayEngine():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="delaunay")
+    assert river_class_example.centerline_engine == "delaunay"
+    assert river_class_example.starting_node == pytest.approx(
+        (-92.8678500102497, 30.038323122574653))
+    assert river_class_example.ending_node == pytest.approx(
+        (-92.86801258753664, 30.037526981524152))
+    assert len(river_class_example.centerline_voronoi) == 26
+    assert river_class_example.centerline_voronoi[:3] == [
+        pytest.approx((-92.8678500102497, 30.038323122574653)),
+        pytest.approx((-92.86782027086969, 30.038232757573375)),
+        pytest.approx((-92.8678178236689, 30.038213869789928))
+    ]
+    assert river_class_example.centerline_length == pytest.approx(
+        0.09264101735646041)
+    assert len(river_class_example.x_voronoi_ridge_point) == 69
+    assert river_class_example.x_voronoi_ridge_point[:2] == [
+        pytest.approx((-92.86785519963564, -92.86788152349135)),
+        pytest.approx((-92.86781210467674, -92.86785519963564))
+    ]
+    assert river_class_example.y_voronoi_ridge_point[:2] == [
+        pytest.approx((30.03789733406856, 30.03785907497921)),
+        pytest.approx((30.038016013599538, 30.03789733406856))
+    ]
+    assert river_class_example.profile["delaunay centerline"][
+        "coordinates"] == 26
+    # the Voronoi diagram and the river graph are not generated
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert "_voronoi_nx_graph" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_segmentVoronoiEngine():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="segment_voronoi")
+    assert river_class_example.centerline_engine == "segment_voronoi"
+    assert river_class_example.starting_node == pytest.approx(
+        (-92.8678215835874, 30.038275078792104))
+    assert river_class_example.ending_node == pytest.approx(
+        (-92.86801289742837, 30.03752504557166))
+    assert len(river_class_example.centerline_voronoi) == 22
+    assert river_class_example.centerline_voronoi[:3] == [
+        pytest.approx((-92.8678215835874, 30.038275078792104)),
+        pytest.approx((-92.86781887353752, 30.03824341873465)),
+        pytest.approx((-92.86781163449848, 30.038177751740243))
+    ]
+    assert river_class_example.centerline_length == pytest.approx(
+        0.08636035562544966)
+    assert len(river_class_example.x_voronoi_ridge_point) == 21
+    assert river_class_example.x_voronoi_ridge_point[:2] == [
+        pytest.approx((-92.86780915319046, -92.8678076556463)),
+        pytest.approx((-92.86780737688784, -92.8678076556463))
+    ]
+    assert river_class_example.y_voronoi_ridge_point[:2] == [
+        pytest.approx((30.038158019738553, 30.03812438147423)),
+        pytest.approx((30.03810952010084, 30.03812438147423))
+    ]
+    assert river_class_example.profile["segment voronoi centerline"][
+        "coordinates"] == 22
+    # the bank coordinates are not densified and the river graph is not generated
+    assert len(river_class_example.left_bank_coordinates) == 29
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert "_voronoi_nx_graph" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_rasterEngine():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="raster", raster_resolution_m=1)
+    assert river_class_example.centerline_engine == "raster"
+    assert river_class_example.raster_resolution_m == 1
+    assert river_class_example.starting_node == pytest.approx(
+        (-92.86787403500318, 30.038370224774162))
+    assert river_class_example.ending_node == pytest.approx(
+        (-92.86801919395451, 30.037513235306324))
+    assert len(river_class_example.centerline_voronoi) == 96
+    assert river_class_example.centerline_voronoi[:2] == [
+        pytest.approx((-92.86787403500318, 30.038370224774162)),
+        pytest.approx((-92.86788440322393, 30.038361203880083))
+    ]
+    assert river_class_example.centerline_length == pytest.approx(
+        0.10079898987230805)
+    # a raster does not generate all possible paths
+    assert river_class_example.x_voronoi_ridge_point == []
+    assert river_class_example.y_voronoi_ridge_point == []
+    assert river_class_example.profile["raster centerline"][
+        "raster_cells"] == 16048
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert "_voronoi_nx_graph" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_rasterEngineDefaultResolution():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="raster")
+    # resolution defaults to a tenth of the median channel width
+    assert len(river_class_example.centerline_voronoi) == 9
+    assert river_class_example.profile["raster centerline"][
+        "raster_cells"] == 168
+    assert river_class_example.centerline_length == pytest.approx(
+        0.09302050379884513)
+
+
+def test_CenterlineWidth_rasterEngineMaxCells(monkeypatch, caplog):
+    monkeypatch.setattr(centerline_width.centerlineEngines,
+                        "_raster_max_cells", 100)
+    # the default resolution is coarsened to limit the number of cells
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="raster")
+    river_class_example.centerline_voronoi
+    assert river_class_example.profile["raster centerline"][
+        "raster_cells"] <= 100
+    assert "coarsened to" in caplog.text
+    # a resolution set by the user is not changed
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="raster", raster_resolution_m=1)
+    river_class_example.centerline_voronoi
+    assert river_class_example.profile["raster centerline"][
+        "raster_cells"] == 16048
+    assert "will use a large amount of memory" in caplog.text
+
+
+def test_CenterlineWidth_bankPairingEngine():
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine="bank_pairing")
+    assert river_class_example.centerline_engine == "bank_pairing"
+    assert river_class_example.starting_node == pytest.approx(
+        (-92.86787537493574, 30.03837223112292))
+    assert river_class_example.ending_node == pytest.approx(
+        (-92.86802227403602, 30.037510855871584))
+    # each step moves along one bank: len(left bank) + len(right bank) - 1 matched pairs
+    assert len(river_class_example.centerline_voronoi) == 57
+    assert river_class_example.centerline_voronoi[:2] == [
+        pytest.approx((-92.86787537493574, 30.03837223112292)),
+        pytest.approx((-92.86786862462077, 30.0383522932499))
+    ]
+    assert river_class_example.centerline_voronoi[-1] == pytest.approx(
+        ((river_class_example.left_bank_coordinates[0][0] +
+          river_class_example.right_bank_coordinates[0][0]) / 2,
+         (river_class_example.left_bank_coordinates[0][1] +
+          river_class_example.right_bank_coordinates[0][1]) / 2))
+    assert river_class_example.centerline_length == pytest.approx(
+        0.10138388973244554)
+    assert river_class_example.x_voronoi_ridge_point == []
+    assert river_class_example.y_voronoi_ridge_point == []
+    assert "bank_voronoi" not in river_class_example.__dict__
+    assert "bank_polygon" not in river_class_example.__dict__
+
+
+@pytest.mark.parametrize("centerline_engine", ["bank_pairing", "raster"])
+def test_CenterlineWidth_runStage_withoutPolygon(centerline_engine):
+    river_class_example = centerline_width.CenterlineWidth(
+        csv_data=csv_data(), centerline_engine=centerline_engine)
+    assert "polygon" not in centerline_width._stage_dependencies(
+        river_class_example, "centerline")
+    # the Decimal Degree polygon is never generated for the centerline
+    river_class_example.run_stage("centerline")
+    assert "centerline_voronoi" in river_class_example.__dict__
+    assert "bank_polygon" not in river_class_example.__dict__
+    assert "polygon" not in river_class_example.profile
+    # the centerline does not read the "relative" stage (which depends on the centerline)
+    assert "bank_polygon_relative" not in river_class_example.__dict__
+    assert "left_bank_relative_coordinates" not in river_class_example.__dict__
+
+
+def test_CenterlineWidth_lonLatFromRelative():
+    lon_lat_coordinates = np.array([[-92.86, 30.03], [-92.87, 30.04],
+                                    [-92.9, 30.1]])
+    relative_coordinates = centerline_width._relative_coordinates_array(
+        lon_lat_coordinates[0], lon_lat_coordinates)
+    assert centerline_width._lon_lat_from_relative_array(
+        lon_lat_coordinates[0],
+        relative_coordinates) == pytest.approx(lon_lat_coordinates)
+
+
 def test_CenterlineWidth_interpolateTrue_incrementalSinuosity():
     river_class_example = centerline_width.CenterlineWidth(
         csv_data=csv_data(), interpolate_data=True)
@@ -97,6 +97,29 @@ def test_width_transectSlopeDirect_RelativeCenterline():
     })
 
 
+def test_width_applySmoothing():
+    river_width_dict = test_river.width(transect_span_distance=span_distance,
+                                        apply_smoothing=True)
+    assert river_width_dict == pytest.approx({
+        (-4.270100285886147, 48.28205552699758):
+        0.5031122921623009,
+        (-4.263053389356155, 48.28229323682582):
+        0.4814903499029504
+    })
+
+
+def test_width_relativeDistance():
+    river_width_dict = test_river.width(transect_span_distance=span_distance,
+                                        coordinate_unit="Relative Distance",
+                                        apply_smoothing=False)
+    assert list(river_width_dict.keys()) == pytest.approx([
+        (-474.5911031117466, -737.2226679958243),
+        (-499.350896429526, -247.39201451117282)
+    ])
+    assert list(river_width_dict.values()) == pytest.approx(
+        [0.515263253111841, 0.4739622115491252])
+
+
 def test_width_futureWarning_functionName():
     # Pending Deprecation: TO BE REMOVED
     with pytest.warns(
@@ -25,6 +25,18 @@
 #                                              Voronoi ridges coordinates to a relative           #
 #                                              distance                                           #
 #                                                                                                 #
+#                                       - _relative_coordinates_array: backend convert            #
+#                                              an array of coordinates to a relative              #
+#                                              distance in a single call                          #
+#                                                                                                 #
+#                                       - _lon_lat_from_relative_array: backend convert           #
+#                                              an array of relative distances back to             #
+#                                              longitude and latitude                             #
+#                                                                                                 #
+#                                       - _relative_voronoi: backend convert the                  #
+#                                              Voronoi diagram to a relative distance             #
+#                                              without generating a new diagram                   #
+#                                                                                                 #
 #                                       - _relative_width_coordinates: backend convert            #
 #                                              width dictionary to a relative distance            #
 #                                                                                                 #
@@ -32,12 +44,14 @@
 #                                                                                                 #
 
 # Standard Library Imports
+from collections import namedtuple
 import math
 
 # Related Third Party Imports
 import numpy as np
 import pyproj
 import geopy.distance
+from scipy.spatial import Voronoi
 
 
 def _relative_single_coordinate(first_point=None,
@@ -55,6 +69,40 @@ def _relative_single_coordinate(first_point=None,
     return (x, y)
 
 
+def _relative_coordinates_array(first_point=None,
+                                lon_lat_coordinates=None,
+                                ellipsoid: str = "WGS84") -> np.ndarray:
+    # Convert an (N, 2) array of [longitude, latitude] to relative positions from the first point in a single call
+    lon_lat_coordinates = np.asarray(lon_lat_coordinates,
+                                     dtype=np.float64).reshape(-1, 2)
+    geodesic = pyproj.Geod(ellps=ellipsoid)
+    forward_bearing, _, distance_between_meters = geodesic.inv(
+        np.full(len(lon_lat_coordinates), first_point[0]),
+        np.full(len(lon_lat_coordinates), first_point[1]),
+        lon_lat_coordinates[:, 0], lon_lat_coordinates[:, 1])
+    return np.column_stack([
+        distance_between_meters * np.cos(np.deg2rad(forward_bearing)),
+        distance_between_meters * np.sin(np.deg2rad(forward_bearing))
+    ])
+
+
+def _lon_lat_from_relative_array(first_point=None,
+                                 relative_coordinates=None,
+                                 ellipsoid: str = "WGS84") -> np.ndarray:
+    # Convert an (N, 2) array of relative positions from the first point back to [longitude, latitude] (inverse of _relative_coordinates_array)
+    relative_coordinates = np.asarray(relative_coordinates,
+                                      dtype=np.float64).reshape(-1, 2)
+    geodesic = pyproj.Geod(ellps=ellipsoid)
+    longitude, latitude, _ = geodesic.fwd(
+        np.full(len(relative_coordinates), first_point[0]),
+        np.full(len(relative_coordinates), first_point[1]),
+        np.rad2deg(
+            np.arctan2(relative_coordinates[:, 1], relative_coordinates[:,
+                                                                        0])),
+        np.hypot(relative_coordinates[:, 0], relative_coordinates[:, 1]))
+    return np.column_stack([longitude, latitude])
+
+
 def _relative_bank_coordinates(left_lon_lat_coordinates=None,
                                right_lon_lat_coordinates=None,
                                ellipsoid: str = "WGS84"):
@@ -65,23 +113,24 @@ def _relative_bank_coordinates(left_lon_lat_coordinates=None,
             right_lon_lat_coordinates) == 0:
         return None, None
 
+    left_lon_lat_coordinates = np.asarray(left_lon_lat_coordinates,
+                                          dtype=np.float64)
+    right_lon_lat_coordinates = np.asarray(right_lon_lat_coordinates,
+                                           dtype=np.float64)
     first_point = left_lon_lat_coordinates[
         0]  # first point is the first point on the left bank
 
-    left_relative_coordinates = []
-    for left_point in left_lon_lat_coordinates:
-        if left_point == first_point:
-            coord_pair = (0.0, 0.0)
-        else:
-            coord_pair = _relative_single_coordinate(first_point, left_point,
-                                                     ellipsoid)
-        left_relative_coordinates.append(coord_pair)
+    left_relative = _relative_coordinates_array(first_point,
+                                                left_lon_lat_coordinates,
+                                                ellipsoid)
+    at_first_point = (left_lon_lat_coordinates == first_point).all(axis=1)
+    left_relative[at_first_point] = 0.0
+    left_relative_coordinates = list(map(tuple, left_relative.tolist()))
 
-    right_relative_coordinates = []
-    for right_point in right_lon_lat_coordinates:
-        coord_pair = _relative_single_coordinate(first_point, right_point,
+    right_relative = _relative_coordinates_array(first_point,
+                                                 right_lon_lat_coordinates,
                                                  ellipsoid)
-        right_relative_coordinates.append(coord_pair)
+    right_relative_coordinates = list(map(tuple, right_relative.tolist()))
 
     return left_relative_coordinates, right_relative_coordinates
 
@@ -90,17 +139,15 @@ def _relative_centerline_coordinates(first_point=None,
                                      centerline_coordinates=None,
                                      ellipsoid: str = "WGS84"):
     # Convert centerline coordinates to relative distance from the first point on the left bank
-    centerline_relative_coordinates = []
-
     if centerline_coordinates is None:
         return None
+    if len(centerline_coordinates) == 0:
+        return []
 
-    for centerline_coords in centerline_coordinates:
-        coord_pair = _relative_single_coordinate(first_point,
-                                                 centerline_coords, ellipsoid)
-        centerline_relative_coordinates.append(coord_pair)
-
-    return centerline_relative_coordinates
+    centerline_relative = _relative_coordinates_array(first_point,
+                                                      centerline_coordinates,
+                                                      ellipsoid)
+    return list(map(tuple, centerline_relative.tolist()))
 
 
 def _relative_ridge_coordinates(first_point=None,
@@ -108,25 +155,53 @@ def _relative_ridge_coordinates(first_point=None,
                                 y_ridge=None,
                                 ellipsoid: str = "WGS84"):
     # Convert Voronoi ridges from Decimal Degree to Relative Distance
-
-    x_relative_ridges = []
-    y_relative_ridges = []
-    for i in range(len(x_ridge)):
-        # Coordinates are saved as a pair (x1, x2) and (y1, y2)
-        coord_pair = _relative_single_coordinate(
-            first_point, (x_ridge[i][0], y_ridge[i][0]), ellipsoid)
-        x1 = coord_pair[0]
-        y1 = coord_pair[1]
-        coord_pair = _relative_single_coordinate(
-            first_point, (x_ridge[i][1], y_ridge[i][1]), ellipsoid)
-        x2 = coord_pair[0]
-        y2 = coord_pair[1]
-        x_relative_ridges.append((x1, x2))
-        y_relative_ridges.append((y1, y2))
+    if len(x_ridge) == 0:
+        return [], []
+
+    # Coordinates are saved as a pair (x1, x2) and (y1, y2), both ends of all the ridges are converted in a single call
+    ridge_x = np.asarray(x_ridge, dtype=np.float64)
+    ridge_y = np.asarray(y_ridge, dtype=np.float64)
+    ridge_relative = _relative_coordinates_array(
+        first_point,
+        np.column_stack([ridge_x.reshape(-1),
+                         ridge_y.reshape(-1)]), ellipsoid).reshape(-1, 2, 2)
+    x_relative_ridges = list(map(tuple, ridge_relative[:, :, 0].tolist()))
+    y_relative_ridges = list(map(tuple, ridge_relative[:, :, 1].tolist()))
 
     return x_relative_ridges, y_relative_ridges
 
 
+# Voronoi diagram in Relative Distance, with the attributes of a scipy Voronoi object used to plot the diagram (voronoi_plot_2d)
+_RelativeVoronoi = namedtuple("_RelativeVoronoi", [
+    "points", "vertices", "ridge_vertices", "ridge_points", "regions",
+    "point_region", "min_bound", "max_bound", "furthest_site"
+])
+
+
+def _relative_voronoi(first_point=None,
+                      river_voronoi: Voronoi = None,
+                      left_relative_coordinates: list = None,
+                      right_relative_coordinates: list = None,
+                      ellipsoid: str = "WGS84") -> _RelativeVoronoi:
+    # Return the Voronoi diagram in Relative Distance from the Decimal Degree Voronoi diagram (without generating a second Voronoi diagram)
+    # Ridges and regions are the same, the bank points are replaced by the relative bank coordinates and the vertices are converted to Relative Distance
+    relative_points = np.concatenate([
+        np.asarray(left_relative_coordinates, dtype=np.float64),
+        np.asarray(right_relative_coordinates, dtype=np.float64)
+    ])
+    return _RelativeVoronoi(points=relative_points,
+                            vertices=_relative_coordinates_array(
+                                first_point, river_voronoi.vertices,
+                                ellipsoid),
+                            ridge_vertices=river_voronoi.ridge_vertices,
+                            ridge_points=river_voronoi.ridge_points,
+                            regions=river_voronoi.regions,
+                            point_region=river_voronoi.point_region,
+                            min_bound=relative_points.min(axis=0),
+                            max_bound=relative_points.max(axis=0),
+                            furthest_site=river_voronoi.furthest_site)
+
+
 def _relative_width_coordinates(first_point=None,
                                 width_dictionary: dict = None,
                                 ellipsoid: str = "WGS84") -> dict:
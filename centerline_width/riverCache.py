@@ -0,0 +1,274 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      riverCache.py stores the outputs of a river object on disk, so that repeated               #
+#      runs with the same bank coordinates and parameters are loaded instead of                   #
+#      being recomputed (CenterlineWidth(cache_dir=...)) and saves/loads a river object           #
+#      (CenterlineWidth.save() and CenterlineWidth.load())                                        #
+#                                                                                                 #
+#      Cached outputs are saved as float64 arrays in a .npz file named by a hash of the           #
+#      bank coordinates and river parameters. When the cache directory is larger than             #
+#      cache_max_mb, the least recently used files are removed                                    #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _cache_key: returns the hash of the bank                #
+#                                              coordinates and river parameters                   #
+#                                                                                                 #
+#                                       - _encode_outputs: converts river attributes to           #
+#                                              float64 arrays                                     #
+#                                                                                                 #
+#                                       - _decode_outputs: converts float64 arrays back           #
+#                                              to river attributes                                #
+#                                                                                                 #
+#                                       - _load_cached_outputs: returns the cached river          #
+#                                              attributes (if they exist)                         #
+#                                                                                                 #
+#                                       - _save_cached_outputs: saves the computed river          #
+#                                              attributes to the cache                            #
+#                                                                                                 #
+#                                       - _evict_cache: removes the least recently used           #
+#                                              files when the cache is too large                  #
+#                                                                                                 #
+#                                       - _save_river: saves the bank coordinates,                #
+#                                              parameters, and computed outputs of a river        #
+#                                              object to a .npz file                              #
+#                                                                                                 #
+#                                       - _load_river: returns a river object from a              #
+#                                              .npz file saved by _save_river                     #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Standard Library Imports
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zipfile
+
+# Related Third Party Imports
+import numpy as np
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+# Increase when the stages change the values of the cached outputs, invalidates existing cache files
+_cache_format_version = 3
+
+# River parameters saved with a river object (CenterlineWidth.save())
+_saved_parameter_names = [
+    "river_name", "cutoff", "df_len", "interpolate_data", "interpolate_n",
+    "interpolate_spacing_m", "interpolate_width_ratio", "simplify_tolerance_m",
+    "auto_orient", "interpolate_n_centerpoints", "equal_distance", "ellipsoid",
+    "tile_size", "tile_overlap", "centerline_engine", "raster_resolution_m",
+    "graph_backend", "path_search"
+]
+
+# Bank coordinate arrays saved with a river object (input and after interpolation)
+_saved_bank_names = [
+    "_left_bank_input", "_right_bank_input", "_left_bank_array",
+    "_right_bank_array"
+]
+
+# River parameters that change the outputs (included in the cache key)
+_cache_parameter_names = [
+    "cutoff", "interpolate_data", "interpolate_n", "interpolate_spacing_m",
+    "interpolate_width_ratio", "simplify_tolerance_m", "auto_orient",
+    "interpolate_n_centerpoints", "equal_distance", "ellipsoid", "tile_size",
+    "tile_overlap", "centerline_engine", "raster_resolution_m",
+    "graph_backend", "path_search"
+]
+
+# Coordinate and float attributes that are saved to the cache (geometries, Voronoi, and graphs are rebuilt when accessed)
+_cached_output_names = [
+    "starting_node", "ending_node", "x_voronoi_ridge_point",
+    "y_voronoi_ridge_point", "centerline_voronoi", "centerline_equal_distance",
+    "centerline_evenly_spaced", "centerline_smoothed",
+    "left_bank_relative_coordinates", "right_bank_relative_coordinates",
+    "starting_node_relative", "ending_node_relative",
+    "x_voronoi_ridge_point_relative", "y_voronoi_ridge_point_relative",
+    "centerline_voronoi_relative", "centerline_equal_distance_relative",
+    "centerline_evenly_spaced_relative", "centerline_smoothed_relative",
+    "right_bank_length", "left_bank_length", "area", "centerline_length",
+    "sinuosity"
+]
+
+
+def _cache_key(river_object=None) -> str:
+    # Return a hash of the input bank coordinates and the river parameters
+    key_hash = hashlib.sha256()
+    for bank_coordinates in [
+            river_object._left_bank_input, river_object._right_bank_input
+    ]:
+        bank_coordinates = np.ascontiguousarray(bank_coordinates,
+                                                dtype=np.float64)
+        key_hash.update(str(bank_coordinates.shape).encode())
+        key_hash.update(bank_coordinates.tobytes())
+
+    river_parameters = {
+        parameter_name: getattr(river_object, parameter_name)
+        for parameter_name in _cache_parameter_names
+    }
+    river_parameters["cache_format_version"] = _cache_format_version
+    key_hash.update(json.dumps(river_parameters, sort_keys=True).encode())
+    return key_hash.hexdigest()
+
+
+def _encode_outputs(outputs: dict = None) -> dict:
+    # Convert river attributes to float64 arrays, the type of each attribute is saved to rebuild the attribute
+    output_arrays = {}
+    output_types = {}
+    for output_name, output_value in outputs.items():
+        if output_value is None:
+            output_types[output_name] = "none"
+            continue
+        if isinstance(output_value, tuple):
+            output_types[output_name] = "point"
+        elif isinstance(output_value, (list, np.ndarray)):
+            output_types[output_name] = "coordinates"
+        else:
+            output_types[output_name] = "float"
+        output_arrays[output_name] = np.asarray(output_value, dtype=np.float64)
+    output_arrays["_output_types"] = np.array(json.dumps(output_types))
+    return output_arrays
+
+
+def _decode_outputs(output_arrays=None) -> dict:
+    # Convert float64 arrays back to river attributes: points as tuples, coordinates as a list of tuples
+    outputs = {}
+    output_types = json.loads(str(output_arrays["_output_types"]))
+    for output_name, output_type in output_types.items():
+        if output_type == "none":
+            outputs[output_name] = None
+        elif output_type == "float":
+            outputs[output_name] = float(output_arrays[output_name])
+        elif output_type == "point":
+            outputs[output_name] = tuple(output_arrays[output_name].tolist())
+        else:
+            outputs[output_name] = list(
+                map(tuple, output_arrays[output_name].tolist()))
+    return outputs
+
+
+def _load_cached_outputs(cache_path: str = None) -> dict:
+    # Return the river attributes saved in the cache file, empty when the file does not exist (or cannot be read)
+    if not os.path.isfile(cache_path):
+        return {}
+    try:
+        with np.load(cache_path, allow_pickle=False) as output_arrays:
+            outputs = _decode_outputs(output_arrays)
+        os.utime(cache_path)  # mark as recently used
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        logger.info(
+            f"[PROCESSING] Unable to read cache file, outputs will be recomputed - {cache_path}"
+        )
+        return {}
+    logger.info(f"[SUCCESS] Loaded {len(outputs)} cached outputs")
+    return outputs
+
+
+def _save_cached_outputs(river_object=None) -> None:
+    # Save all the computed cacheable attributes of the river object, then evict files if the cache is too large
+    outputs = {
+        output_name: river_object.__dict__[output_name]
+        for output_name in _cached_output_names
+        if output_name in river_object.__dict__
+    }
+    cache_dir = os.path.dirname(river_object._cache_path)
+
+    # write to a temporary file first, so other processes never read a partially written file
+    temporary_file, temporary_path = tempfile.mkstemp(dir=cache_dir,
+                                                      suffix=".tmp")
+    try:
+        with os.fdopen(temporary_file, "wb") as cache_file:
+            np.savez(cache_file, **_encode_outputs(outputs))
+        os.replace(temporary_path, river_object._cache_path)
+    finally:
+        if os.path.exists(temporary_path):  # not replaced, writing failed
+            os.remove(temporary_path)
+
+    _evict_cache(cache_dir=cache_dir,
+                 cache_max_mb=river_object._cache_max_mb,
+                 keep_path=river_object._cache_path)
+
+
+def _evict_cache(cache_dir: str = None,
+                 cache_max_mb: int = None,
+                 keep_path: str = None) -> None:
+    # Remove the least recently used cache files until the cache is smaller than cache_max_mb
+    cache_files = []
+    for file_name in os.listdir(cache_dir):
+        if not file_name.endswith(".npz"):
+            continue
+        file_path = os.path.join(cache_dir, file_name)
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:  # removed by another process
+            continue
+        cache_files.append((file_stat.st_mtime, file_stat.st_size, file_path))
+
+    cache_size = sum(file_size for _, file_size, _ in cache_files)
+    for _, file_size, file_path in sorted(cache_files):
+        if cache_size <= cache_max_mb * 1024 * 1024:
+            break
+        if file_path == keep_path:
+            continue
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        cache_size -= file_size
+
+
+def _save_river(river_object=None, path: str = None) -> None:
+    # Save the bank coordinates, parameters, and computed coordinate/float outputs of a river object
+    river_parameters = {
+        parameter_name: getattr(river_object, parameter_name)
+        for parameter_name in _saved_parameter_names
+    }
+    if not isinstance(river_parameters["river_name"], str):
+        river_parameters["river_name"] = None  # csv_data read from a buffer
+
+    outputs = {
+        output_name: river_object.__dict__[output_name]
+        for output_name in _cached_output_names
+        if output_name in river_object.__dict__
+    }
+    river_arrays = _encode_outputs(outputs)
+    for bank_name in _saved_bank_names:
+        river_arrays[bank_name] = np.ascontiguousarray(getattr(
+            river_object, bank_name),
+                                                       dtype=np.float64)
+    river_arrays["_river_parameters"] = np.array(json.dumps(river_parameters))
+
+    with open(path, "wb") as river_file:
+        np.savez(river_file, **river_arrays)
+    logger.info(f"[SUCCESS] Saved river object with {len(outputs)} outputs")
+
+
+def _load_river(river_class=None, path: str = None):
+    # Return a river object with the bank coordinates, parameters, and outputs saved by _save_river
+    # Polygons, Voronoi diagrams, and graphs are rebuilt from the bank coordinates when first accessed
+    with np.load(path, allow_pickle=False) as river_arrays:
+        river_parameters = json.loads(str(river_arrays["_river_parameters"]))
+        bank_arrays = {
+            bank_name: river_arrays[bank_name]
+            for bank_name in _saved_bank_names
+        }
+        outputs = _decode_outputs(river_arrays)
+
+    river_object = river_class.__new__(river_class)
+    river_object.__dict__.update(
+        _left_bank_array=bank_arrays["_left_bank_array"],
+        _right_bank_array=bank_arrays["_right_bank_array"])
+    river_object._initialize_river(
+        left_bank_coordinates=bank_arrays["_left_bank_input"],
+        right_bank_coordinates=bank_arrays["_right_bank_input"],
+        **river_parameters)
+    river_object.__dict__.update(outputs)
+    logger.info(f"[SUCCESS] Loaded river object with {len(outputs)} outputs")
+    return river_object
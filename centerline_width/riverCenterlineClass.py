@@ -12,15 +12,71 @@
 #                                                                                                 #
 
 # Standard Library Imports
+import functools
+import os
 import warnings  # Pending Deprecation
 
 # Related Third Party Imports
+import numpy as np
 import pandas as pd
 
 # Internal Local Imports
 import centerline_width
 
 
+class _PendingDeprecationAttribute:
+    ### Pending Deprecation for attribute names replaced with snake_case names
+    ## To be removed
+    # Alias to the replacement attribute, the value is never computed or stored twice
+
+    def __init__(self, replacement_name: str = None):
+        self.replacement_name = replacement_name
+
+    def __set_name__(self, owner, name):
+        self.deprecated_name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        warnings.warn(
+            f"{self.deprecated_name} has been replaced with {self.replacement_name} and will be removed in the future",
+            FutureWarning,
+            stacklevel=2)
+        return getattr(instance, self.replacement_name)
+
+
+def _save_cache_on_return(method):
+    # Save the cached attributes generated during the outermost call (attribute access or stage) once it returns, instead of after each step
+
+    @functools.wraps(method)
+    def method_saving_cache(river_object, *args, **kwargs):
+        river_object._cache_depth += 1
+        try:
+            returned_value = method(river_object, *args, **kwargs)
+        finally:
+            river_object._cache_depth -= 1
+        if river_object._cache_depth == 0 and river_object._cache_outdated:
+            river_object._cache_outdated = False
+            if river_object._cache_path is not None:
+                centerline_width._save_cached_outputs(river_object)
+        return returned_value
+
+    return method_saving_cache
+
+
+class _StageAttribute:
+    # Attribute generated by a stage (see: riverStages.py), computed on first access and then stored on the object
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        instance._run_stage_step(self.name)
+        return instance.__dict__[self.name]
+
+
 class CenterlineWidth:
 
     def __init__(self,
@@ -31,7 +87,20 @@ class CenterlineWidth:
                  interpolate_n: int = 5,
                  interpolate_n_centerpoints: int = None,
                  equal_distance: int = 10,
-                 ellipsoid: str = "WGS84"):
+                 ellipsoid: str = "WGS84",
+                 interpolate_spacing_m: [int, float] = None,
+                 interpolate_width_ratio: [int, float] = None,
+                 simplify_tolerance_m: [int, float] = None,
+                 auto_orient: bool = False,
+                 tile_size: int = None,
+                 tile_overlap: int = None,
+                 centerline_engine: str = "voronoi",
+                 raster_resolution_m: [int, float] = None,
+                 graph_backend: str = "networkx",
+                 path_search: str = "breadth_first",
+                 cache_dir: str = None,
+                 cache_max_mb: int = 100,
+                 outputs: list = None):
 
         centerline_width._error_handling_centerline_width(
             csv_data=csv_data,
@@ -40,7 +109,20 @@ class CenterlineWidth:
             interpolate_n=interpolate_n,
             interpolate_n_centerpoints=interpolate_n_centerpoints,
             equal_distance=equal_distance,
-            ellipsoid=ellipsoid)
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
 
         if optional_cutoff is not None and cutoff is None:
             ### Pending Deprecation for function name replaced with cutoff()
@@ -51,177 +133,439 @@ class CenterlineWidth:
                 stacklevel=2)
             cutoff = optional_cutoff
 
-        # Description and dataframe
-        self.river_name = csv_data
+        with centerline_width._profile_stage(self, "bank load") as counts:
+            # Description and dataframe
+            df = pd.read_csv(csv_data)
+            if cutoff:
+                df = df.head(cutoff)
+
+            # Left and Right Coordinates from the given csv data and data cutoff
+            left_bank_coordinates, right_bank_coordinates = centerline_width._left_right_coordinates(
+                df)
+            counts["left_bank_points"] = len(left_bank_coordinates)
+            counts["right_bank_points"] = len(right_bank_coordinates)
+
+        self._initialize_river(
+            river_name=csv_data,
+            cutoff=cutoff,
+            df_len=len(df),
+            left_bank_coordinates=left_bank_coordinates,
+            right_bank_coordinates=right_bank_coordinates,
+            interpolate_data=interpolate_data,
+            interpolate_n=interpolate_n,
+            interpolate_n_centerpoints=interpolate_n_centerpoints,
+            equal_distance=equal_distance,
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
+
+    @classmethod
+    def from_dataframe(cls,
+                       dataframe: pd.DataFrame = None,
+                       river_name: str = None,
+                       cutoff: int = None,
+                       interpolate_data: bool = False,
+                       interpolate_n: int = 5,
+                       interpolate_n_centerpoints: int = None,
+                       equal_distance: int = 10,
+                       ellipsoid: str = "WGS84",
+                       interpolate_spacing_m: [int, float] = None,
+                       interpolate_width_ratio: [int, float] = None,
+                       simplify_tolerance_m: [int, float] = None,
+                       auto_orient: bool = False,
+                       tile_size: int = None,
+                       tile_overlap: int = None,
+                       centerline_engine: str = "voronoi",
+                       raster_resolution_m: [int, float] = None,
+                       graph_backend: str = "networkx",
+                       path_search: str = "breadth_first",
+                       cache_dir: str = None,
+                       cache_max_mb: int = 100,
+                       outputs: list = None):
+        # Create a river object from a dataframe with the columns llat, llon, rlat, rlon (without reading a csv file)
+        centerline_width._error_handling_from_dataframe(
+            dataframe=dataframe,
+            river_name=river_name,
+            cutoff=cutoff,
+            interpolate_data=interpolate_data,
+            interpolate_n=interpolate_n,
+            interpolate_n_centerpoints=interpolate_n_centerpoints,
+            equal_distance=equal_distance,
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
+
+        river_object = cls.__new__(cls)
+        with centerline_width._profile_stage(river_object,
+                                             "bank load") as counts:
+            if cutoff:
+                dataframe = dataframe.head(cutoff)
+            left_bank_coordinates, right_bank_coordinates = centerline_width._left_right_coordinates(
+                dataframe)
+            counts["left_bank_points"] = len(left_bank_coordinates)
+            counts["right_bank_points"] = len(right_bank_coordinates)
+
+        river_object._initialize_river(
+            river_name=river_name,
+            cutoff=cutoff,
+            df_len=len(dataframe),
+            left_bank_coordinates=left_bank_coordinates,
+            right_bank_coordinates=right_bank_coordinates,
+            interpolate_data=interpolate_data,
+            interpolate_n=interpolate_n,
+            interpolate_n_centerpoints=interpolate_n_centerpoints,
+            equal_distance=equal_distance,
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
+        return river_object
+
+    @classmethod
+    def from_arrays(cls,
+                    left_bank_coordinates: np.ndarray = None,
+                    right_bank_coordinates: np.ndarray = None,
+                    river_name: str = None,
+                    cutoff: int = None,
+                    interpolate_data: bool = False,
+                    interpolate_n: int = 5,
+                    interpolate_n_centerpoints: int = None,
+                    equal_distance: int = 10,
+                    ellipsoid: str = "WGS84",
+                    interpolate_spacing_m: [int, float] = None,
+                    interpolate_width_ratio: [int, float] = None,
+                    simplify_tolerance_m: [int, float] = None,
+                    auto_orient: bool = False,
+                    tile_size: int = None,
+                    tile_overlap: int = None,
+                    centerline_engine: str = "voronoi",
+                    raster_resolution_m: [int, float] = None,
+                    graph_backend: str = "networkx",
+                    path_search: str = "breadth_first",
+                    cache_dir: str = None,
+                    cache_max_mb: int = 100,
+                    outputs: list = None):
+        # Create a river object from (N, 2) arrays of [longitude, latitude] for the left and right bank
+        centerline_width._error_handling_from_arrays(
+            left_bank_coordinates=left_bank_coordinates,
+            right_bank_coordinates=right_bank_coordinates,
+            river_name=river_name,
+            cutoff=cutoff,
+            interpolate_data=interpolate_data,
+            interpolate_n=interpolate_n,
+            interpolate_n_centerpoints=interpolate_n_centerpoints,
+            equal_distance=equal_distance,
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
+
+        river_object = cls.__new__(cls)
+        with centerline_width._profile_stage(river_object,
+                                             "bank load") as counts:
+            # float64 arrays are used as is (not copied)
+            left_bank_coordinates = np.asarray(left_bank_coordinates,
+                                               dtype=np.float64)
+            right_bank_coordinates = np.asarray(right_bank_coordinates,
+                                                dtype=np.float64)
+            if cutoff:
+                left_bank_coordinates = left_bank_coordinates[:cutoff]
+                right_bank_coordinates = right_bank_coordinates[:cutoff]
+            df_len = max(len(left_bank_coordinates),
+                         len(right_bank_coordinates))
+
+            # only save non-nan values
+            left_nan_rows = np.isnan(left_bank_coordinates).any(axis=1)
+            if left_nan_rows.any():
+                left_bank_coordinates = left_bank_coordinates[~left_nan_rows]
+            right_nan_rows = np.isnan(right_bank_coordinates).any(axis=1)
+            if right_nan_rows.any():
+                right_bank_coordinates = right_bank_coordinates[
+                    ~right_nan_rows]
+            counts["left_bank_points"] = len(left_bank_coordinates)
+            counts["right_bank_points"] = len(right_bank_coordinates)
+
+        river_object._initialize_river(
+            river_name=river_name,
+            cutoff=cutoff,
+            df_len=df_len,
+            left_bank_coordinates=left_bank_coordinates,
+            right_bank_coordinates=right_bank_coordinates,
+            interpolate_data=interpolate_data,
+            interpolate_n=interpolate_n,
+            interpolate_n_centerpoints=interpolate_n_centerpoints,
+            equal_distance=equal_distance,
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
+        return river_object
+
+    def _initialize_river(self,
+                          river_name: str = None,
+                          cutoff: int = None,
+                          df_len: int = None,
+                          left_bank_coordinates=None,
+                          right_bank_coordinates=None,
+                          interpolate_data: bool = False,
+                          interpolate_n: int = 5,
+                          interpolate_n_centerpoints: int = None,
+                          equal_distance: int = 10,
+                          ellipsoid: str = "WGS84",
+                          interpolate_spacing_m: [int, float] = None,
+                          interpolate_width_ratio: [int, float] = None,
+                          simplify_tolerance_m: [int, float] = None,
+                          auto_orient: bool = False,
+                          tile_size: int = None,
+                          tile_overlap: int = None,
+                          centerline_engine: str = "voronoi",
+                          raster_resolution_m: [int, float] = None,
+                          graph_backend: str = "networkx",
+                          path_search: str = "breadth_first",
+                          cache_dir: str = None,
+                          cache_max_mb: int = 100,
+                          outputs: list = None) -> None:
+        # Set the river description and input bank coordinates shared by all constructors
+        # Wall time, peak memory, and number of items for each stage (see: riverProfile.py), bank load is recorded by the constructor
+        self.profile = self.__dict__.get("profile", {})
+        self.river_name = river_name
+        self.cutoff = cutoff
         self.interpolate_data = interpolate_data
         self.interpolate_n = interpolate_n
-        df = pd.read_csv(csv_data)
-        if cutoff:
-            df = df.head(cutoff)
-        self.df_len = len(df)
+        self.interpolate_spacing_m = interpolate_spacing_m
+        self.interpolate_width_ratio = interpolate_width_ratio
+        self.simplify_tolerance_m = simplify_tolerance_m
+        self.auto_orient = auto_orient
+        self.df_len = df_len
         self.interpolate_n_centerpoints = interpolate_n_centerpoints
         if self.interpolate_n_centerpoints is None:
             self.interpolate_n_centerpoints = self.df_len
         self.ellipsoid = ellipsoid
-
-        # Left and Right Coordinates from the given csv data and data cutoff
-        left_bank_coordinates, right_bank_coordinates = centerline_width._left_right_coordinates(
-            df)
-        if interpolate_data:
-            right_bank_coordinates, left_bank_coordinates = centerline_width._interpolate_between_points(
-                left_bank_coordinates, right_bank_coordinates, interpolate_n)
-        self.left_bank_coordinates = left_bank_coordinates
-        self.right_bank_coordinates = right_bank_coordinates
-        self.left_bank_relative_coordinates, self.right_bank_relative_coordinates = centerline_width._relative_bank_coordinates(
-            self.left_bank_coordinates, self.right_bank_coordinates,
-            self.ellipsoid)
-
-        # Right/Length Bank Length
-        self.rightBankLength = centerline_width._centerline_length(
-            centerline_coordinates=right_bank_coordinates,
-            ellipsoid=self.ellipsoid)  # Pending Deprecation
-        self.right_bank_length = centerline_width._centerline_length(
-            centerline_coordinates=right_bank_coordinates,
-            ellipsoid=self.ellipsoid)
-        self.leftBankLength = centerline_width._centerline_length(
-            centerline_coordinates=left_bank_coordinates,
-            ellipsoid=self.ellipsoid)  # Pending Deprecation
-        self.left_bank_length = centerline_width._centerline_length(
-            centerline_coordinates=left_bank_coordinates,
-            ellipsoid=self.ellipsoid)
-
-        # Decimal Degrees: River polygon, position of the top/bottom polygon
-        river_bank_polygon, top_bank, bottom_bank = centerline_width._generate_polygon(
-            self.left_bank_coordinates,
-            self.right_bank_coordinates,
-            coord_type="Decimal Degrees")
-        self.bank_polygon = river_bank_polygon
-        self.top_bank = top_bank
-        self.bottom_bank = bottom_bank
-
-        # Area contained within river polygon
-        self.area = centerline_width._calculate_river_area(
-            self.bank_polygon, self.ellipsoid)
-
-        # Relative Coordinates: River polygon, position of the top/bottom polygon
-        river_bank_polygon, top_bank, bottom_bank = centerline_width._generate_polygon(
-            self.left_bank_relative_coordinates,
-            self.right_bank_relative_coordinates,
-            coord_type="Relative Distance")
-        self.bank_polygon_relative = river_bank_polygon
-        self.top_bank_relative = top_bank
-        self.bottom_bank_relative = bottom_bank
-
-        # Decimal Degrees; Voronoi generated by left/right bank coordinates
-        river_bank_voronoi = centerline_width._generate_voronoi(
-            self.left_bank_coordinates,
-            self.right_bank_coordinates,
-            coord_type="Decimal Degrees")
-        self.bank_voronoi = river_bank_voronoi
-
-        # Relative Distance; Voronoi generated by left/right bank coordinates
-        river_bank_voronoi = centerline_width._generate_voronoi(
-            self.left_bank_relative_coordinates,
-            self.right_bank_relative_coordinates,
-            coord_type="Relative Distance")
-        self.bank_voronoi_relative = river_bank_voronoi
-
-        # Decimal Degrees all possible paths: starting/ending node, all possible paths (ridges), paths dictionary
-        starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._centerline_path(
-            self.bank_voronoi, self.bank_polygon, self.top_bank,
-            self.bottom_bank)
-        self.starting_node = starting_node  # starting position for centerline
-        self.ending_node = ending_node  # ending position for centerline
-        self.x_voronoi_ridge_point = x_ridge_point  # Voronoi x positions
-        self.y_voronoi_ridge_point = y_ridge_point  # Voronoi y positions
-
-        # Relative Distances all possible paths: starting/ending node, all possible paths (ridges), paths dictionary
-        self.starting_node_relative = centerline_width._relative_single_coordinate(
-            self.left_bank_coordinates[0], self.starting_node,
-            self.ellipsoid)  # starting position for centerline
-        self.ending_node_relative = centerline_width._relative_single_coordinate(
-            self.left_bank_coordinates[0], self.ending_node,
-            self.ellipsoid)  # ending position for centerline
-        x_relative_ridges, y_relative_ridges = centerline_width._relative_ridge_coordinates(
-            self.left_bank_coordinates[0], self.x_voronoi_ridge_point,
-            self.y_voronoi_ridge_point, self.ellipsoid)
-        self.x_voronoi_ridge_point_relative = x_relative_ridges  # Voronoi relative x positions
-        self.y_voronoi_ridge_point_relative = y_relative_ridges  # Voronoi relative y positions
-
-        # Voronoi Centerline Coordinates
-        self.centerlineVoronoi = shortest_path_coordinates  # pending deprecation
-        self.centerline_voronoi = shortest_path_coordinates
-
-        # Centerline length
-        self.centerlineLength = centerline_width._centerline_length(
-            centerline_coordinates=shortest_path_coordinates,
-            ellipsoid=self.ellipsoid)  # Pending Deprecation
-        self.centerline_length = centerline_width._centerline_length(
-            centerline_coordinates=shortest_path_coordinates,
-            ellipsoid=self.ellipsoid)
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        self.centerline_engine = centerline_engine
+        self.raster_resolution_m = raster_resolution_m
+        self.graph_backend = graph_backend
+        self.path_search = path_search
+        if self.tile_size is not None and self.tile_overlap is None:
+            self.tile_overlap = self.tile_size // 4
+
+        # Left and Right Coordinates before interpolation
+        self._left_bank_input = left_bank_coordinates
+        self._right_bank_input = right_bank_coordinates
 
         # Set the different types of Centerline coordinates
         self.equal_distance = equal_distance
 
-        self.centerlineEqualDistance = centerline_width._equal_distance_centerline(
-            centerline_coordinates=self.centerline_voronoi,
-            equal_distance=self.equal_distance,
-            ellipsoid=self.ellipsoid)  # Pending Deprecation
-        self.centerline_equal_distance = centerline_width._equal_distance_centerline(
-            centerline_coordinates=self.centerline_voronoi,
-            equal_distance=self.equal_distance,
-            ellipsoid=self.ellipsoid)
-
-        self.centerlineEvenlySpaced = centerline_width._evenly_spaced_centerline(
-            centerline_coordinates=self.centerline_voronoi,
-            number_of_fixed_points=self.interpolate_n_centerpoints
-        )  # Pending Deprecation
-        self.centerline_evenly_spaced = centerline_width._evenly_spaced_centerline(
-            centerline_coordinates=self.centerline_voronoi,
-            number_of_fixed_points=self.interpolate_n_centerpoints)
-
-        self.centerlineSmoothed = centerline_width._smoothed_centerline(
-            river_object=self,
-            centerline_coordinates=self.centerline_evenly_spaced,
-            interprolate_num=self.interpolate_n_centerpoints
-        )  # Pending Deprecation
-        self.centerline_smoothed = centerline_width._smoothed_centerline(
-            river_object=self,
-            centerline_coordinates=self.centerline_evenly_spaced,
-            interprolate_num=self.interpolate_n_centerpoints)
-
-        # Relative Distance from bottom left bank point to each Centerline coordinates
-        self.centerlineVoronoiRelative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_voronoi,
-            self.ellipsoid)  # Pending Deprecation
-        self.centerline_voronoi_relative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_voronoi,
-            self.ellipsoid)
-
-        self.centerlineEqualDistanceRelative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_equal_distance,
-            self.ellipsoid)  # Pending Deprecation
-        self.centerline_equal_distance_relative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_equal_distance,
-            self.ellipsoid)
-
-        self.centerlineEvenlySpacedRelative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_evenly_spaced,
-            self.ellipsoid)  # Pending Deprecation
-        self.centerline_evenly_spaced_relative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_evenly_spaced,
-            self.ellipsoid)
-
-        self.centerlineSmoothedRelative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_smoothed,
-            self.ellipsoid)  # Pending Deprecation
-        self.centerline_smoothed_relative = centerline_width._relative_centerline_coordinates(
-            self.left_bank_coordinates[0], self.centerline_smoothed,
-            self.ellipsoid)
-
-        # Overall Sinuosity
-        self.sinuosity = centerline_width._calculate_sinuosity(
-            self.centerline_evenly_spaced, self.ellipsoid)
+        # Bank coordinates are always generated (to verify input), all other attributes are computed on first access
+        self._cache_path = None
+        self._cache_depth = 0
+        self._cache_outdated = False
+        getattr(self, "_left_bank_array"
+                )  # already set when loaded (see: CenterlineWidth.load())
+
+        # Load previously computed attributes for the same bank coordinates and parameters
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._cache_max_mb = cache_max_mb
+            self._cache_path = os.path.join(
+                cache_dir, f"{centerline_width._cache_key(self)}.npz")
+            self.__dict__.update(
+                centerline_width._load_cached_outputs(self._cache_path))
+
+        if outputs is not None:
+            for output_name in outputs:
+                getattr(self, output_name)
+
+    def save(self, path: str = None) -> None:
+        # Save the bank coordinates, parameters, and computed outputs to a .npz file
+        centerline_width._error_handling_save_river(path=path)
+        centerline_width._save_river(river_object=self, path=path)
+
+    @classmethod
+    def load(cls, path: str = None):
+        # Create a river object from a .npz file saved by CenterlineWidth.save()
+        centerline_width._error_handling_load_river(path=path)
+        return centerline_width._load_river(river_class=cls, path=path)
+
+    @_save_cache_on_return
+    def _run_stage_step(self, output_name: str = None) -> None:
+        # Run the step that generates an attribute and store all the attributes generated by the step
+        _, step_outputs, step_function = centerline_width._stage_step_for_output(
+            output_name)
+        self.__dict__.update(step_function(self))
+        self._update_cache(step_outputs)
+
+    def _update_cache(self, step_outputs: tuple = None) -> None:
+        # Mark the cache to be saved when a step generated attributes that are cached (see: _save_cache_on_return)
+        if self._cache_path is not None and any(
+                output_name in centerline_width._cached_output_names
+                for output_name in step_outputs):
+            self._cache_outdated = True
+
+    @_save_cache_on_return
+    def run_stage(self, stage_name: str = None, stage_function=None) -> dict:
+        # Run a stage (and the stages it depends on), returns {attribute name: value} for the stage
+        # stage_function replaces the default steps of the stage: stage_function(river_object) -> {attribute name: value}
+        centerline_width._error_handling_run_stage(
+            stage_name=stage_name, stage_function=stage_function)
+
+        for dependency_stage in centerline_width._stage_dependencies(
+                self, stage_name):
+            self.run_stage(dependency_stage)
+
+        output_names = centerline_width._stage_output_names(stage_name)
+        if stage_function is not None:
+            stage_outputs = stage_function(self)
+            missing_outputs = [
+                output_name for output_name in output_names
+                if output_name not in stage_outputs
+            ]
+            if missing_outputs:
+                raise ValueError(
+                    f"[stage_function]: Must return all the attributes generated by the '{stage_name}' stage, missing = {missing_outputs}"
+                )
+            # attributes from later stages were generated with the replaced stage outputs and are recomputed on next access
+            # outputs no longer match the cache key, so they are not saved to the cache
+            self._cache_path = None
+            for dependent_output in centerline_width._dependent_stage_output_names(
+                    stage_name):
+                self.__dict__.pop(dependent_output, None)
+            self.__dict__.update({
+                output_name: stage_outputs[output_name]
+                for output_name in output_names
+            })
+        else:
+            for step_outputs, step_function in centerline_width.river_stages[
+                    stage_name]["steps"]:
+                if any(output_name not in self.__dict__
+                       for output_name in step_outputs):
+                    self.__dict__.update(step_function(self))
+                    self._update_cache(step_outputs)
+
+        return {
+            output_name: self.__dict__[output_name]
+            for output_name in output_names
+        }
+
+    # Attributes generated by the stages in riverStages.py
+    # banks
+    _left_bank_array = _StageAttribute()
+    _right_bank_array = _StageAttribute()
+    left_bank_coordinates = _StageAttribute()
+    right_bank_coordinates = _StageAttribute()
+    # polygon
+    bank_polygon = _StageAttribute()
+    top_bank = _StageAttribute()
+    bottom_bank = _StageAttribute()
+    # voronoi
+    bank_voronoi = _StageAttribute()
+    # graph
+    _voronoi_points_dict = _StageAttribute()
+    _voronoi_nx_graph = _StageAttribute()
+    _largest_subgraph_nodes = _StageAttribute()
+    # centerline
+    starting_node = _StageAttribute()
+    ending_node = _StageAttribute()
+    x_voronoi_ridge_point = _StageAttribute()
+    y_voronoi_ridge_point = _StageAttribute()
+    centerline_voronoi = _StageAttribute()
+    # resample
+    centerline_equal_distance = _StageAttribute()
+    centerline_evenly_spaced = _StageAttribute()
+    centerline_smoothed = _StageAttribute()
+    # relative
+    left_bank_relative_coordinates = _StageAttribute()
+    right_bank_relative_coordinates = _StageAttribute()
+    bank_polygon_relative = _StageAttribute()
+    top_bank_relative = _StageAttribute()
+    bottom_bank_relative = _StageAttribute()
+    bank_voronoi_relative = _StageAttribute()
+    starting_node_relative = _StageAttribute()
+    ending_node_relative = _StageAttribute()
+    x_voronoi_ridge_point_relative = _StageAttribute()
+    y_voronoi_ridge_point_relative = _StageAttribute()
+    centerline_voronoi_relative = _StageAttribute()
+    centerline_equal_distance_relative = _StageAttribute()
+    centerline_evenly_spaced_relative = _StageAttribute()
+    centerline_smoothed_relative = _StageAttribute()
+    # features
+    right_bank_length = _StageAttribute()
+    left_bank_length = _StageAttribute()
+    area = _StageAttribute()
+    centerline_length = _StageAttribute()
+    sinuosity = _StageAttribute()
+
+    # Pending Deprecation: camelCase attribute names replaced with snake_case
+    rightBankLength = _PendingDeprecationAttribute("right_bank_length")
+    leftBankLength = _PendingDeprecationAttribute("left_bank_length")
+    centerlineVoronoi = _PendingDeprecationAttribute("centerline_voronoi")
+    centerlineLength = _PendingDeprecationAttribute("centerline_length")
+    centerlineEqualDistance = _PendingDeprecationAttribute(
+        "centerline_equal_distance")
+    centerlineEvenlySpaced = _PendingDeprecationAttribute(
+        "centerline_evenly_spaced")
+    centerlineSmoothed = _PendingDeprecationAttribute("centerline_smoothed")
+    centerlineVoronoiRelative = _PendingDeprecationAttribute(
+        "centerline_voronoi_relative")
+    centerlineEqualDistanceRelative = _PendingDeprecationAttribute(
+        "centerline_equal_distance_relative")
+    centerlineEvenlySpacedRelative = _PendingDeprecationAttribute(
+        "centerline_evenly_spaced_relative")
+    centerlineSmoothedRelative = _PendingDeprecationAttribute(
+        "centerline_smoothed_relative")
 
     def incremental_sinuosity(self,
                               incremental_points: int = 10,
@@ -487,7 +831,20 @@ class riverCenterline(CenterlineWidth):
                  interpolate_n: int = 5,
                  interpolate_n_centerpoints: int = None,
                  equal_distance: int = 10,
-                 ellipsoid: str = "WGS84"):
+                 ellipsoid: str = "WGS84",
+                 interpolate_spacing_m: [int, float] = None,
+                 interpolate_width_ratio: [int, float] = None,
+                 simplify_tolerance_m: [int, float] = None,
+                 auto_orient: bool = False,
+                 tile_size: int = None,
+                 tile_overlap: int = None,
+                 centerline_engine: str = "voronoi",
+                 raster_resolution_m: [int, float] = None,
+                 graph_backend: str = "networkx",
+                 path_search: str = "breadth_first",
+                 cache_dir: str = None,
+                 cache_max_mb: int = 100,
+                 outputs: list = None):
         warnings.warn(
             "riverCenterline() has been replaced with CenterlineWidth() and will be removed in the future",
             FutureWarning,
@@ -501,4 +858,17 @@ class riverCenterline(CenterlineWidth):
             interpolate_n=interpolate_n,
             interpolate_n_centerpoints=interpolate_n_centerpoints,
             equal_distance=equal_distance,
-            ellipsoid=ellipsoid)
+            ellipsoid=ellipsoid,
+            interpolate_spacing_m=interpolate_spacing_m,
+            interpolate_width_ratio=interpolate_width_ratio,
+            simplify_tolerance_m=simplify_tolerance_m,
+            auto_orient=auto_orient,
+            tile_size=tile_size,
+            tile_overlap=tile_overlap,
+            centerline_engine=centerline_engine,
+            raster_resolution_m=raster_resolution_m,
+            graph_backend=graph_backend,
+            path_search=path_search,
+            cache_dir=cache_dir,
+            cache_max_mb=cache_max_mb,
+            outputs=outputs)
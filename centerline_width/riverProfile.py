@@ -0,0 +1,123 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      riverProfile.py records the wall time, peak memory, and number of items for each           #
+#      internal stage of a river object (CenterlineWidth.profile)                                 #
+#                                                                                                 #
+#      River profile: {stage label: {"calls": number of times the stage ran,                      #
+#                                    "wall_time_s": total time (without nested stages),           #
+#                                    "peak_memory_mb": peak memory allocated by the stage         #
+#                                                      (when tracemalloc is tracing),             #
+#                                    "max_rss_mb": peak memory of the process,                    #
+#                                    item name: number of items}}                                 #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _profile_stage: context manager that records            #
+#                                              a stage in the profile of a river object           #
+#                                                                                                 #
+#                                       - _profile_function: decorator that records each call     #
+#                                              of a function as a stage in the profile of its     #
+#                                              river object                                       #
+#                                                                                                 #
+#                                       - _max_rss_mb: returns the peak memory of the             #
+#                                              current process                                    #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Standard Library Imports
+from contextlib import contextmanager
+import functools
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+
+def _max_rss_mb() -> float:
+    # Return the peak resident memory of the current process (in megabytes)
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return max_rss / 1024**2  # bytes
+    return max_rss / 1024  # kilobytes
+
+
+@contextmanager
+def _profile_stage(river_object=None, stage_label: str = None):
+    # Record the wall time, peak memory, and item counts of a stage, yields a dictionary to add item counts {item name: number}
+    # Wall time of nested stages (a stage that triggers another stage) is only counted in the nested stage
+    profile_stack = river_object.__dict__.setdefault("_profile_stack", [])
+    stage_frame = {"nested_time": 0.0, "observed_peak": 0}
+    stage_counts = {}
+
+    memory_traced = tracemalloc.is_tracing()
+    if memory_traced:
+        start_memory, current_peak = tracemalloc.get_traced_memory()
+        if profile_stack:
+            # keep the peak of the outer stage before resetting the peak for this stage
+            profile_stack[-1]["observed_peak"] = max(
+                profile_stack[-1]["observed_peak"], current_peak)
+        tracemalloc.reset_peak()
+
+    profile_stack.append(stage_frame)
+    start_time = time.perf_counter()
+    try:
+        yield stage_counts
+    finally:
+        elapsed_time = time.perf_counter() - start_time
+        profile_stack.pop()
+
+        peak_memory_mb = None
+        if memory_traced and tracemalloc.is_tracing():
+            _, current_peak = tracemalloc.get_traced_memory()
+            stage_peak = max(stage_frame["observed_peak"], current_peak)
+            peak_memory_mb = max(stage_peak - start_memory, 0) / 1024**2
+            if profile_stack:
+                profile_stack[-1]["observed_peak"] = max(
+                    profile_stack[-1]["observed_peak"], stage_peak)
+        if profile_stack:
+            profile_stack[-1]["nested_time"] += elapsed_time
+
+        river_profile = river_object.__dict__.setdefault("profile", {})
+        stage_profile = river_profile.setdefault(
+            stage_label, {
+                "calls": 0,
+                "wall_time_s": 0.0,
+                "peak_memory_mb": None,
+                "max_rss_mb": None
+            })
+        stage_profile["calls"] += 1
+        stage_profile[
+            "wall_time_s"] += elapsed_time - stage_frame["nested_time"]
+        if peak_memory_mb is not None:
+            stage_profile["peak_memory_mb"] = max(
+                stage_profile["peak_memory_mb"] or 0, peak_memory_mb)
+        stage_profile["max_rss_mb"] = _max_rss_mb()
+        for item_name, item_count in stage_counts.items():
+            # item counts are totals across all the times the stage ran
+            stage_profile[item_name] = stage_profile.get(item_name,
+                                                         0) + item_count
+
+
+def _profile_function(stage_label: str = None, item_counts=None):
+    # Decorator to record each call of a function as a stage in the profile of its river object (river_object keyword argument)
+    # item_counts(returned value) returns the item counts of the stage {item name: number}
+    def profile_decorator(function):
+
+        @functools.wraps(function)
+        def profiled_function(*args, **kwargs):
+            with _profile_stage(kwargs["river_object"], stage_label) as counts:
+                returned_value = function(*args, **kwargs)
+                if item_counts is not None:
+                    counts.update(item_counts(returned_value))
+            return returned_value
+
+        return profiled_function
+
+    return profile_decorator
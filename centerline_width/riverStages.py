@@ -0,0 +1,617 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      riverStages.py defines the stages used to compute the attributes of the river              #
+#      class and the dependencies between each stage                                              #
+#                                                                                                 #
+#      Stages: banks -> polygon/voronoi -> graph -> centerline -> resample ->                     #
+#              relative/features                                                                  #
+#                                                                                                 #
+#      Each stage is made up of steps, where each step generates one or more river                #
+#      attributes. Attributes are only computed when they are first accessed, when                #
+#      requested with CenterlineWidth(outputs=[...]), or when the stage is run with               #
+#      CenterlineWidth.run_stage()                                                                #
+#                                                                                                 #
+#      Steps are recorded in the river profile (CenterlineWidth.profile, see:                     #
+#      riverProfile.py)                                                                           #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _profiled_step: returns a step that is recorded         #
+#                                              in the river profile                               #
+#                                                                                                 #
+#                                       - _stage_output_names: returns a list of all              #
+#                                              attributes generated by a stage                    #
+#                                                                                                 #
+#                                       - _stage_step_for_output: returns the stage and           #
+#                                              step that generates an attribute                   #
+#                                                                                                 #
+#                                       - _uses_voronoi_graph: check if the centerline is         #
+#                                              found through the Voronoi river graph              #
+#                                                                                                 #
+#                                       - _stage_dependencies: returns the stages a stage         #
+#                                              depends on for a river object                      #
+#                                                                                                 #
+#                                       - _dependent_stage_output_names: returns a list           #
+#                                              of all attributes generated by stages that         #
+#                                              depend on a stage                                  #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Standard Library Imports
+import logging
+
+# Related Third Party Imports
+import numpy as np
+
+# Internal Local Imports
+import centerline_width
+
+# Simplified bank segments longer than this ratio of the local channel width are re-densified (the Voronoi diagram of the simplified banks does not follow the channel)
+_simplified_bank_width_ratio = 0.1
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+
+def _profiled_step(stage_label: str = None, step_function=None):
+    # Returns a step that records the step in the river profile (see: riverProfile.py) with the number of coordinates generated
+
+    def _step(river_object=None) -> dict:
+        with centerline_width._profile_stage(river_object,
+                                             stage_label) as counts:
+            step_outputs = step_function(river_object)
+            output_coordinates = [
+                output_value for output_value in step_outputs.values()
+                if isinstance(output_value, list)
+            ]
+            if output_coordinates:
+                counts["coordinates"] = sum(
+                    len(coordinates) for coordinates in output_coordinates)
+        return step_outputs
+
+    return _step
+
+
+## banks: left/right bank coordinates (after interpolation)
+def _bank_coordinates_step(river_object=None) -> dict:
+    # Left and Right Coordinates from the given data as (N, 2) arrays, interpolated when interpolate_data=True
+    with centerline_width._profile_stage(river_object,
+                                         "bank interpolation") as counts:
+        left_bank_coordinates = river_object._left_bank_input
+        right_bank_coordinates = river_object._right_bank_input
+        centerline_width._verify_bank_coordinates(left_bank_coordinates,
+                                                  right_bank_coordinates)
+        if river_object.auto_orient and centerline_width._banks_flipped(
+                left_bank_coordinates, right_bank_coordinates,
+                river_object.ellipsoid):
+            # right bank is in the reverse order of the left bank
+            right_bank_coordinates = right_bank_coordinates[::-1]
+            counts["reversed_banks"] = 1
+            logger.info(
+                "[SUCCESS] Flipped banks detected, reversed the order of the right bank (auto_orient=True)"
+            )
+        if river_object.simplify_tolerance_m is not None:
+            # simplify the banks before interpolation, relative to the first point of the left bank
+            input_points = len(left_bank_coordinates) + len(
+                right_bank_coordinates)
+            left_bank_coordinates, right_bank_coordinates = (
+                centerline_width._simplify_bank_coordinates(
+                    bank_coordinates, left_bank_coordinates[0],
+                    river_object.simplify_tolerance_m, river_object.ellipsoid)
+                for bank_coordinates in (left_bank_coordinates,
+                                         right_bank_coordinates))
+            removed_points = input_points - len(left_bank_coordinates) - len(
+                right_bank_coordinates)
+            # add points back to the segments that are long compared to the channel width, so the centerline does not change
+            right_bank_coordinates, left_bank_coordinates = centerline_width._interpolate_between_points(
+                left_bank_coordinates,
+                right_bank_coordinates,
+                interpolate_width_ratio=_simplified_bank_width_ratio,
+                ellipsoid=river_object.ellipsoid)
+            added_points = len(left_bank_coordinates) + len(
+                right_bank_coordinates) - input_points + removed_points
+            counts["simplified_removed_points"] = removed_points
+            counts["simplified_added_points"] = added_points
+            logger.info(
+                f"[SUCCESS] Simplified banks with a tolerance of {river_object.simplify_tolerance_m} meters, removed {removed_points} of {input_points} bank points and added {added_points} points to the long segments"
+            )
+        if river_object.interpolate_data:
+            right_bank_coordinates, left_bank_coordinates = centerline_width._interpolate_between_points(
+                left_bank_coordinates, right_bank_coordinates,
+                river_object.interpolate_n, river_object.interpolate_spacing_m,
+                river_object.interpolate_width_ratio, river_object.ellipsoid)
+        counts["left_bank_points"] = len(left_bank_coordinates)
+        counts["right_bank_points"] = len(right_bank_coordinates)
+    return {
+        "_left_bank_array": left_bank_coordinates,
+        "_right_bank_array": right_bank_coordinates
+    }
+
+
+def _bank_coordinate_lists_step(river_object=None) -> dict:
+    # Left and Right Coordinates as a list of [longitude, latitude]
+    return {
+        "left_bank_coordinates": river_object._left_bank_array.tolist(),
+        "right_bank_coordinates": river_object._right_bank_array.tolist()
+    }
+
+
+## polygon: river polygon and the top/bottom of the polygon
+def _bank_polygon_step(river_object=None) -> dict:
+    # Decimal Degrees: River polygon, position of the top/bottom polygon
+    left_bank_coordinates = river_object._left_bank_array
+    right_bank_coordinates = river_object._right_bank_array
+    with centerline_width._profile_stage(river_object, "polygon") as counts:
+        river_bank_polygon, top_bank, bottom_bank = centerline_width._generate_polygon(
+            left_bank_coordinates,
+            right_bank_coordinates,
+            coord_type="Decimal Degrees",
+            ellipsoid=river_object.ellipsoid)
+        counts["polygon_vertices"] = len(river_bank_polygon.exterior.coords)
+    return {
+        "bank_polygon": river_bank_polygon,
+        "top_bank": top_bank,
+        "bottom_bank": bottom_bank
+    }
+
+
+## voronoi: Voronoi diagram generated by the bank points
+def _bank_voronoi_step(river_object=None) -> dict:
+    # Decimal Degrees; Voronoi generated by left/right bank coordinates
+    left_bank_coordinates = river_object._left_bank_array
+    right_bank_coordinates = river_object._right_bank_array
+    with centerline_width._profile_stage(river_object, "voronoi") as counts:
+        river_voronoi = centerline_width._generate_voronoi(
+            left_bank_coordinates,
+            right_bank_coordinates,
+            coord_type="Decimal Degrees")
+        counts["voronoi_vertices"] = len(river_voronoi.vertices)
+        counts["voronoi_ridges"] = len(river_voronoi.ridge_vertices)
+    return {"bank_voronoi": river_voronoi}
+
+
+## graph: all possible paths through the Voronoi vertices within the polygon
+def _voronoi_graph_step(river_object=None) -> dict:
+    # All possible path connections from Voronoi, NetworkX graph, and nodes in the largest subgraph
+    river_voronoi = river_object.bank_voronoi
+    river_polygon = river_object.bank_polygon
+    with centerline_width._profile_stage(river_object,
+                                         "ridge filtering") as counts:
+        start_end_points_dict = centerline_width._points_from_voronoi(
+            river_voronoi, river_polygon)
+        counts["ridges_in_polygon"] = sum(
+            len(end_points) for end_points in start_end_points_dict.values())
+    with centerline_width._profile_stage(river_object,
+                                         "graph build") as counts:
+        nx_graph, largest_subgraph_nodes = centerline_width._generate_nx_graph(
+            start_end_points_dict, river_object.ellipsoid)
+        counts["graph_nodes"] = nx_graph.number_of_nodes()
+        counts["graph_edges"] = nx_graph.number_of_edges()
+    return {
+        "_voronoi_points_dict": start_end_points_dict,
+        "_voronoi_nx_graph": nx_graph,
+        "_largest_subgraph_nodes": largest_subgraph_nodes
+    }
+
+
+## centerline: starting/ending node and shortest path through the graph
+def _uses_tiles(river_object=None) -> bool:
+    # Centerline is found separately for each tile when the banks are longer than the tile size
+    return river_object.tile_size is not None and max(
+        len(river_object._left_bank_array), len(
+            river_object._right_bank_array)) > river_object.tile_size
+
+
+def _uses_voronoi_graph(river_object=None) -> bool:
+    # Centerline is found through the river graph (Voronoi engine and NetworkX graph without tiles)
+    return (river_object.centerline_engine == "voronoi"
+            and river_object.graph_backend == "networkx"
+            and not _uses_tiles(river_object))
+
+
+def _uses_bank_polygon(river_object=None) -> bool:
+    # Centerline is found within the river polygon (bank pairing does not use a polygon, raster uses the relative polygon, each tile generates its own polygon)
+    return (river_object.centerline_engine not in ["bank_pairing", "raster"]
+            and not _uses_tiles(river_object))
+
+
+def _voronoi_centerline_step(river_object=None) -> dict:
+    # Decimal Degrees all possible paths: starting/ending node, all possible paths (ridges), centerline
+    if river_object.centerline_engine == "delaunay":
+        # skeleton through the Delaunay triangles within the polygon (the Voronoi diagram and river graph are not generated)
+        with centerline_width._profile_stage(river_object,
+                                             "delaunay centerline") as counts:
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._delaunay_centerline_path(
+                river_object._left_bank_array, river_object._right_bank_array,
+                river_object.bank_polygon, river_object.top_bank,
+                river_object.bottom_bank, river_object.ellipsoid)
+            counts["coordinates"] = len(shortest_path_coordinates or [])
+    elif river_object.centerline_engine == "segment_voronoi":
+        # skeleton through the Voronoi ridges between the bank segments (the river graph is not generated)
+        with centerline_width._profile_stage(
+                river_object, "segment voronoi centerline") as counts:
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._segment_voronoi_centerline_path(
+                river_object._left_bank_array,
+                river_object._right_bank_array,
+                river_object.bank_polygon,
+                river_object.top_bank,
+                river_object.bottom_bank,
+                ellipsoid=river_object.ellipsoid)
+            counts["coordinates"] = len(shortest_path_coordinates or [])
+    elif river_object.centerline_engine == "raster":
+        # ridge of the distance to the banks in the rasterized polygon (the Voronoi diagram and river graph are not generated)
+        # The relative polygon is built here rather than read from the "relative" stage, which itself depends on "centerline"
+        with centerline_width._profile_stage(river_object,
+                                             "raster centerline") as counts:
+            left_bank_relative, right_bank_relative = centerline_width._relative_bank_coordinates(
+                river_object._left_bank_array, river_object._right_bank_array,
+                river_object.ellipsoid)
+            raster_polygon, raster_top_bank, raster_bottom_bank = centerline_width._generate_polygon(
+                left_bank_relative,
+                right_bank_relative,
+                coord_type="Relative Distance",
+                ellipsoid=river_object.ellipsoid)
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates, raster_cells = centerline_width._raster_centerline_path(
+                river_object._left_bank_array,
+                river_object._right_bank_array,
+                raster_polygon,
+                raster_top_bank,
+                raster_bottom_bank,
+                raster_resolution_m=river_object.raster_resolution_m,
+                ellipsoid=river_object.ellipsoid)
+            counts["raster_cells"] = raster_cells
+            counts["coordinates"] = len(shortest_path_coordinates or [])
+    elif river_object.centerline_engine == "bank_pairing":
+        # middle of the matched left/right bank points (the Voronoi diagram and river graph are not generated)
+        with centerline_width._profile_stage(
+                river_object, "bank pairing centerline") as counts:
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._bank_pairing_centerline_path(
+                river_object._left_bank_array, river_object._right_bank_array)
+            counts["coordinates"] = len(shortest_path_coordinates)
+    elif _uses_tiles(river_object):
+        # each tile generates its own polygon, Voronoi, and graph (the river graph is not generated)
+        with centerline_width._profile_stage(river_object,
+                                             "tiled centerline") as counts:
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._tiled_centerline_path(
+                river_object._left_bank_array, river_object._right_bank_array,
+                river_object.tile_size, river_object.tile_overlap,
+                river_object.graph_backend, river_object.ellipsoid,
+                river_object.path_search)
+            counts["coordinates"] = len(shortest_path_coordinates or [])
+    elif river_object.graph_backend == "csgraph":
+        # all possible paths as a scipy sparse graph of integer node indices (the NetworkX river graph is not generated)
+        river_voronoi = river_object.bank_voronoi
+        river_polygon = river_object.bank_polygon
+        with centerline_width._profile_stage(river_object,
+                                             "ridge filtering") as counts:
+            vertex_positions, connection_ids = centerline_width._voronoi_connections(
+                river_voronoi, river_polygon)
+            counts["ridges_in_polygon"] = len(connection_ids)
+        with centerline_width._profile_stage(river_object,
+                                             "graph build") as counts:
+            node_coordinates, connections, csgraph, largest_subgraph_nodes = centerline_width._generate_csgraph(
+                vertex_positions, connection_ids, river_object.ellipsoid)
+            counts["graph_nodes"] = len(node_coordinates)
+            # connections in both directions are a single edge
+            counts["graph_edges"] = len(
+                np.unique(np.sort(connections, axis=1), axis=0))
+        with centerline_width._profile_stage(river_object,
+                                             "shortest path") as counts:
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._centerline_path_from_csgraph(
+                node_coordinates, connections, csgraph, largest_subgraph_nodes,
+                river_object.top_bank, river_object.bottom_bank,
+                river_object.path_search)
+            counts["coordinates"] = len(shortest_path_coordinates or [])
+    else:
+        start_end_points_dict = river_object._voronoi_points_dict
+        nx_graph = river_object._voronoi_nx_graph
+        largest_subgraph_nodes = river_object._largest_subgraph_nodes
+        top_bank = river_object.top_bank
+        bottom_bank = river_object.bottom_bank
+        with centerline_width._profile_stage(river_object,
+                                             "shortest path") as counts:
+            starting_node, ending_node, x_ridge_point, y_ridge_point, shortest_path_coordinates = centerline_width._centerline_path_from_graph(
+                start_end_points_dict,
+                nx_graph,
+                largest_subgraph_nodes,
+                top_bank,
+                bottom_bank,
+                path_search=river_object.path_search,
+                ellipsoid=river_object.ellipsoid)
+            counts["coordinates"] = len(shortest_path_coordinates or [])
+    return {
+        "starting_node": starting_node,  # starting position for centerline
+        "ending_node": ending_node,  # ending position for centerline
+        "x_voronoi_ridge_point": x_ridge_point,  # Voronoi x positions
+        "y_voronoi_ridge_point": y_ridge_point,  # Voronoi y positions
+        "centerline_voronoi": shortest_path_coordinates
+    }
+
+
+## resample: Voronoi centerline resampled as equal distance, evenly spaced, and smoothed
+def _equal_distance_centerline_step(river_object=None) -> dict:
+    return {
+        "centerline_equal_distance":
+        centerline_width._equal_distance_centerline(
+            centerline_coordinates=river_object.centerline_voronoi,
+            equal_distance=river_object.equal_distance,
+            ellipsoid=river_object.ellipsoid)
+    }
+
+
+def _evenly_spaced_centerline_step(river_object=None) -> dict:
+    return {
+        "centerline_evenly_spaced":
+        centerline_width._evenly_spaced_centerline(
+            centerline_coordinates=river_object.centerline_voronoi,
+            number_of_fixed_points=river_object.interpolate_n_centerpoints)
+    }
+
+
+def _smoothed_centerline_step(river_object=None) -> dict:
+    return {
+        "centerline_smoothed":
+        centerline_width._smoothed_centerline(
+            river_object=river_object,
+            centerline_coordinates=river_object.centerline_evenly_spaced,
+            interprolate_num=river_object.interpolate_n_centerpoints)
+    }
+
+
+## relative: Decimal Degree attributes converted to a Relative Distance from the first point on the left bank
+def _relative_bank_coordinates_step(river_object=None) -> dict:
+    left_bank_relative, right_bank_relative = centerline_width._relative_bank_coordinates(
+        river_object._left_bank_array, river_object._right_bank_array,
+        river_object.ellipsoid)
+    return {
+        "left_bank_relative_coordinates": left_bank_relative,
+        "right_bank_relative_coordinates": right_bank_relative
+    }
+
+
+def _relative_bank_polygon_step(river_object=None) -> dict:
+    # Relative Coordinates: River polygon, position of the top/bottom polygon
+    river_bank_polygon, top_bank, bottom_bank = centerline_width._generate_polygon(
+        river_object.left_bank_relative_coordinates,
+        river_object.right_bank_relative_coordinates,
+        coord_type="Relative Distance",
+        ellipsoid=river_object.ellipsoid)
+    return {
+        "bank_polygon_relative": river_bank_polygon,
+        "top_bank_relative": top_bank,
+        "bottom_bank_relative": bottom_bank
+    }
+
+
+def _relative_bank_voronoi_step(river_object=None) -> dict:
+    # Relative Distance; Voronoi generated by left/right bank coordinates, converted from the Decimal Degrees Voronoi
+    return {
+        "bank_voronoi_relative":
+        centerline_width._relative_voronoi(
+            river_object._left_bank_array[0], river_object.bank_voronoi,
+            river_object.left_bank_relative_coordinates,
+            river_object.right_bank_relative_coordinates,
+            river_object.ellipsoid)
+    }
+
+
+def _relative_nodes_step(river_object=None) -> dict:
+    # Relative Distances: starting/ending position for centerline
+    first_point = river_object._left_bank_array[0]
+    return {
+        "starting_node_relative":
+        centerline_width._relative_single_coordinate(
+            first_point, river_object.starting_node, river_object.ellipsoid),
+        "ending_node_relative":
+        centerline_width._relative_single_coordinate(first_point,
+                                                     river_object.ending_node,
+                                                     river_object.ellipsoid)
+    }
+
+
+def _relative_ridges_step(river_object=None) -> dict:
+    # Relative Distances: all possible paths (ridges)
+    x_relative_ridges, y_relative_ridges = centerline_width._relative_ridge_coordinates(
+        river_object._left_bank_array[0], river_object.x_voronoi_ridge_point,
+        river_object.y_voronoi_ridge_point, river_object.ellipsoid)
+    return {
+        "x_voronoi_ridge_point_relative": x_relative_ridges,
+        "y_voronoi_ridge_point_relative": y_relative_ridges
+    }
+
+
+def _relative_centerline_step(centerline_name: str = None):
+    # Returns a step to convert a centerline to Relative Distance from the first point on the left bank
+
+    def _step(river_object=None) -> dict:
+        return {
+            f"{centerline_name}_relative":
+            centerline_width._relative_centerline_coordinates(
+                river_object._left_bank_array[0],
+                getattr(river_object, centerline_name), river_object.ellipsoid)
+        }
+
+    return _step
+
+
+## features: lengths, area, and sinuosity
+def _bank_lengths_step(river_object=None) -> dict:
+    # Right/Length Bank Length
+    return {
+        "right_bank_length":
+        centerline_width._centerline_length(
+            centerline_coordinates=river_object._right_bank_array,
+            ellipsoid=river_object.ellipsoid),
+        "left_bank_length":
+        centerline_width._centerline_length(
+            centerline_coordinates=river_object._left_bank_array,
+            ellipsoid=river_object.ellipsoid)
+    }
+
+
+def _river_area_step(river_object=None) -> dict:
+    # Area contained within river polygon
+    return {
+        "area":
+        centerline_width._calculate_river_area(river_object.bank_polygon,
+                                               river_object.ellipsoid)
+    }
+
+
+def _centerline_length_step(river_object=None) -> dict:
+    return {
+        "centerline_length":
+        centerline_width._centerline_length(
+            centerline_coordinates=river_object.centerline_voronoi,
+            ellipsoid=river_object.ellipsoid)
+    }
+
+
+def _river_sinuosity_step(river_object=None) -> dict:
+    # Overall Sinuosity
+    return {
+        "sinuosity":
+        centerline_width._calculate_sinuosity(
+            river_object.centerline_evenly_spaced, river_object.ellipsoid)
+    }
+
+
+# {stage name: {"depends_on": [stages], "steps": [((attributes generated), step function)]}}
+river_stages = {
+    "banks": {
+        "depends_on": [],
+        "steps":
+        [(("_left_bank_array", "_right_bank_array"), _bank_coordinates_step),
+         (("left_bank_coordinates", "right_bank_coordinates"),
+          _bank_coordinate_lists_step)]
+    },
+    "polygon": {
+        "depends_on": ["banks"],
+        "steps":
+        [(("bank_polygon", "top_bank", "bottom_bank"), _bank_polygon_step)]
+    },
+    "voronoi": {
+        "depends_on": ["banks"],
+        "steps": [(("bank_voronoi", ), _bank_voronoi_step)]
+    },
+    "graph": {
+        "depends_on": ["polygon", "voronoi"],
+        "steps": [(("_voronoi_points_dict", "_voronoi_nx_graph",
+                    "_largest_subgraph_nodes"), _voronoi_graph_step)]
+    },
+    "centerline": {
+        "depends_on": ["polygon", "graph"],
+        "steps": [(("starting_node", "ending_node", "x_voronoi_ridge_point",
+                    "y_voronoi_ridge_point", "centerline_voronoi"),
+                   _voronoi_centerline_step)]
+    },
+    "resample": {
+        "depends_on": ["polygon", "centerline"],
+        "steps": [(("centerline_equal_distance", ),
+                   _profiled_step("equal distance resampling",
+                                  _equal_distance_centerline_step)),
+                  (("centerline_evenly_spaced", ),
+                   _profiled_step("evenly spaced resampling",
+                                  _evenly_spaced_centerline_step)),
+                  (("centerline_smoothed", ),
+                   _profiled_step("smoothed resampling",
+                                  _smoothed_centerline_step))]
+    },
+    "relative": {
+        "depends_on": ["banks", "centerline", "resample"],
+        "steps":
+        [(("left_bank_relative_coordinates",
+           "right_bank_relative_coordinates"),
+          _profiled_step("relative conversion",
+                         _relative_bank_coordinates_step)),
+         (("bank_polygon_relative", "top_bank_relative",
+           "bottom_bank_relative"),
+          _profiled_step("relative polygon", _relative_bank_polygon_step)),
+         (("bank_voronoi_relative", ),
+          _profiled_step("relative voronoi", _relative_bank_voronoi_step)),
+         (("starting_node_relative", "ending_node_relative"),
+          _profiled_step("relative conversion", _relative_nodes_step)),
+         (("x_voronoi_ridge_point_relative", "y_voronoi_ridge_point_relative"),
+          _profiled_step("relative conversion", _relative_ridges_step)),
+         (("centerline_voronoi_relative", ),
+          _profiled_step("relative conversion",
+                         _relative_centerline_step("centerline_voronoi"))),
+         (("centerline_equal_distance_relative", ),
+          _profiled_step(
+              "relative conversion",
+              _relative_centerline_step("centerline_equal_distance"))),
+         (("centerline_evenly_spaced_relative", ),
+          _profiled_step(
+              "relative conversion",
+              _relative_centerline_step("centerline_evenly_spaced"))),
+         (("centerline_smoothed_relative", ),
+          _profiled_step("relative conversion",
+                         _relative_centerline_step("centerline_smoothed")))]
+    },
+    "features": {
+        "depends_on": ["banks", "polygon", "centerline", "resample"],
+        "steps":
+        [(("right_bank_length", "left_bank_length"),
+          _profiled_step("river features", _bank_lengths_step)),
+         (("area", ), _profiled_step("river features", _river_area_step)),
+         (("centerline_length", ),
+          _profiled_step("river features", _centerline_length_step)),
+         (("sinuosity", ),
+          _profiled_step("river features", _river_sinuosity_step))]
+    }
+}
+
+
+def _stage_output_names(stage_name: str = None) -> list:
+    # Return a list of all the attributes generated by a stage
+    output_names = []
+    for step_outputs, _ in river_stages[stage_name]["steps"]:
+        output_names.extend(step_outputs)
+    return output_names
+
+
+def _stage_step_for_output(output_name: str = None):
+    # Return the stage name, attributes generated, and step function that generates an attribute
+    for stage_name, stage in river_stages.items():
+        for step_outputs, step_function in stage["steps"]:
+            if output_name in step_outputs:
+                return stage_name, step_outputs, step_function
+    return None, None, None
+
+
+def _stage_dependencies(river_object=None, stage_name: str = None) -> list:
+    # Return the stages that a stage depends on for a river object (tiled rivers and other centerline engines do not use the river graph or polygon)
+    depends_on = river_stages[stage_name]["depends_on"]
+    if stage_name == "centerline" and not _uses_voronoi_graph(river_object):
+        depends_on = [
+            dependency_stage for dependency_stage in depends_on
+            if dependency_stage != "graph"
+        ]
+    if stage_name == "centerline" and not _uses_bank_polygon(river_object):
+        depends_on = [
+            dependency_stage for dependency_stage in depends_on
+            if dependency_stage != "polygon"
+        ]
+    return depends_on
+
+
+def _dependent_stage_output_names(stage_name: str = None) -> list:
+    # Return a list of all the attributes generated by stages that depend (directly or indirectly) on a stage
+    dependent_stages = []
+    stages_to_check = [stage_name]
+    while stages_to_check:
+        stage_to_check = stages_to_check.pop()
+        for dependent_stage, stage in river_stages.items():
+            if stage_to_check in stage[
+                    "depends_on"] and dependent_stage not in dependent_stages:
+                dependent_stages.append(dependent_stage)
+                stages_to_check.append(dependent_stage)
+
+    output_names = []
+    for dependent_stage in dependent_stages:
+        output_names.extend(_stage_output_names(dependent_stage))
+    return output_names
@@ -26,6 +26,8 @@ import math
 import geopy.distance
 import numpy as np
 from pyproj import Geod
+import shapely
+from shapely import STRtree
 from shapely.geometry import Point, LineString
 from shapely.ops import split
 
@@ -39,6 +41,12 @@ stream_handler = logging.StreamHandler()
 logger.addHandler(stream_handler)
 
 
+@centerline_width._profile_function(
+    "width transects",
+    item_counts=lambda width_coordinates: {
+        "width_lines": len(width_coordinates[2]),
+        "removed_lines": len(width_coordinates[2]) - len(width_coordinates[0])
+    })
 def _width_from_centerline_coordinates(
         river_object: centerline_width.CenterlineWidth = None,
         centerline_coordinates: list = None,
@@ -139,6 +147,38 @@ def _width_from_centerline_coordinates(
             points_intersect_false_edges = True
         return points_intersect_false_edges
 
+    def _width_line_around_centerline_point(sloped_line,
+                                            line_intersection_points,
+                                            centerline_point):
+        # returns the start/end of the section of the sloped line (split by the polygon) that contains the centerline point
+        intersection_coordinates = shapely.get_coordinates(
+            line_intersection_points)
+        # sloped line goes from min_x to max_x, so the position along the line increases with x
+        intersection_coordinates = intersection_coordinates[np.argsort(
+            intersection_coordinates[:, 0], kind="stable")]
+        section_end = np.searchsorted(intersection_coordinates[:, 0],
+                                      centerline_point[0])
+        if line_intersection_points.geom_type == "MultiPoint" and np.min(
+                np.hypot(intersection_coordinates[:, 0] - centerline_point[0],
+                         intersection_coordinates[:, 1] -
+                         centerline_point[1])) >= 1e-8:
+            if 0 < section_end < len(intersection_coordinates):
+                return Point(intersection_coordinates[section_end - 1]), Point(
+                    intersection_coordinates[section_end])
+            return None, None
+
+        # line overlaps the bank or the centerline point is on the bank, split linestring where it intersects the polygon
+        left_point = None
+        right_point = None
+        for possible_linestring in split(sloped_line,
+                                         river_object.bank_polygon).geoms:
+            if possible_linestring.distance(
+                    Point(centerline_point)
+            ) < 1e-8:  # select linestring that contains the centerline point
+                left_point = Point(possible_linestring.coords[0])
+                right_point = Point(possible_linestring.coords[1])
+        return left_point, right_point
+
     # Generate a list of lines from the centerline point with its normal
     logger.info(
         "[PROCESSING] Calculating and positioning width lines, may take a few minutes..."
@@ -149,6 +189,7 @@ def _width_from_centerline_coordinates(
     num_intersection_coordinates = {}
 
     min_x, min_y, max_x, max_y = river_object.bank_polygon.bounds
+    bank_polygon_exterior = river_object.bank_polygon.exterior
     for centerline_point, slope in centerline_slope.items():
         # draw a max line that extends the entire distance of the available space, will be trimmed below to just within polygon
         left_y = slope * (min_x - centerline_point[0]) + centerline_point[1]
@@ -157,7 +198,7 @@ def _width_from_centerline_coordinates(
         # Save the points where they intersect the polygon
         sloped_line = LineString([(min_x, left_y), (max_x, right_y)
                                   ])  # sloped line from the centerpoint
-        line_intersection_points = river_object.bank_polygon.exterior.intersection(
+        line_intersection_points = bank_polygon_exterior.intersection(
             sloped_line)  # points where the line intersects the polygon
 
         # if the line only intersects in two places (does not intersect polygon any additional times)
@@ -180,19 +221,9 @@ def _width_from_centerline_coordinates(
                 if river_object.bank_polygon.contains(
                         Point(centerline_point)
                 ):  # width line made by centering centerline point, skip this width line if the centerline is outside of the polygon due to smoothing
-                    all_linestring = split(
-                        sloped_line, river_object.bank_polygon
-                    )  # split linestring where it intersects the polygon
-                    left_point = None
-                    right_point = None
-                    for i, possible_linestring in enumerate(
-                            all_linestring.geoms
-                    ):  # iterate through all linestrings
-                        if possible_linestring.distance(
-                                Point(centerline_point)
-                        ) < 1e-8:  # select linestring that contains the centerline point
-                            left_point = Point(possible_linestring.coords[0])
-                            right_point = Point(possible_linestring.coords[1])
+                    left_point, right_point = _width_line_around_centerline_point(
+                        sloped_line, line_intersection_points,
+                        centerline_point)
 
                     # linestring contains the centerline, save coordinates
                     if left_point is not None and right_point is not None:
@@ -220,31 +251,32 @@ def _width_from_centerline_coordinates(
         ])
         linestring_with_centerlines[linestring_generated] = centerline_coord
         all_linestrings.append(linestring_generated)
+    # all pairs of linestrings that intersect, found with a spatial index of the linestrings (instead of checking every pair)
+    linestrings_index = STRtree(all_linestrings)
+    linestrings_that_intersect = [[] for _ in all_linestrings]
+    if all_linestrings:
+        for linestring_number, linestring_against_number in sorted(
+                zip(*linestrings_index.query(
+                    all_linestrings, predicate="intersects").tolist())):
+            linestrings_that_intersect[linestring_number].append(
+                linestring_against_number)
     # count the number of intersections for each linestring, +1 for each time one line string intersects another
-    for linestring_to_check in all_linestrings:
+    for linestring_number, linestring_to_check in enumerate(all_linestrings):
         num_intersection_coordinates[linestring_with_centerlines[
             linestring_to_check]] = 0  # default set all intersects to zero
-        for linestring_to_check_against in all_linestrings:
+        for linestring_against_number in linestrings_that_intersect[
+                linestring_number]:
+            linestring_to_check_against = all_linestrings[
+                linestring_against_number]
             if linestring_to_check != linestring_to_check_against:
-                if linestring_to_check.intersects(
-                        linestring_to_check_against
-                ):  # check if two lines intersect
-                    intersection_points_linestrings = linestring_to_check.intersection(
-                        linestring_to_check_against
-                    )  # return point positions where intersection occurs
-                    if str(
-                            intersection_points_linestrings
-                    ) != "LINESTRING Z EMPTY":  # if linestring has intersect (not empty), increment count
-                        num_intersection_coordinates[
-                            linestring_with_centerlines[
-                                linestring_to_check]] += 1
-                        if linestring_to_check not in linestring_with_linestrings_that_intersect.keys(
-                        ):
-                            linestring_with_linestrings_that_intersect[
-                                linestring_to_check] = []
-                        linestring_with_linestrings_that_intersect[
-                            linestring_to_check].append(
-                                linestring_to_check_against)
+                num_intersection_coordinates[
+                    linestring_with_centerlines[linestring_to_check]] += 1
+                if linestring_to_check not in linestring_with_linestrings_that_intersect.keys(
+                ):
+                    linestring_with_linestrings_that_intersect[
+                        linestring_to_check] = []
+                linestring_with_linestrings_that_intersect[
+                    linestring_to_check].append(linestring_to_check_against)
 
     # Remove Intersection Lines
     centerline_coordinates_to_be_removed = []
@@ -312,14 +344,14 @@ def _width_from_centerline_coordinates(
     # if using Relative Distance, convert points from Decimal Degrees to Relative Distance
     if coordinate_unit == "Relative Distance":
         right_width_coordinates = centerline_width._relative_width_coordinates(
-            river_object.left_bank_coordinates[0], right_width_coordinates,
+            river_object._left_bank_array[0], right_width_coordinates,
             river_object.ellipsoid)
         left_width_coordinates = centerline_width._relative_width_coordinates(
-            river_object.left_bank_coordinates[0], left_width_coordinates,
+            river_object._left_bank_array[0], left_width_coordinates,
             river_object.ellipsoid)
         num_intersection_coordinates = centerline_width._relative_width_coordinates(
-            river_object.left_bank_coordinates[0],
-            num_intersection_coordinates, river_object.ellipsoid)
+            river_object._left_bank_array[0], num_intersection_coordinates,
+            river_object.ellipsoid)
 
     return right_width_coordinates, left_width_coordinates, num_intersection_coordinates
 
@@ -361,7 +393,7 @@ def width(river_object: centerline_width.CenterlineWidth = None,
     # Run all as "Decimal Degrees" to be able to calculate width below
     if apply_smoothing:
         # if using smoothing, replace left/right coordinates with the smoothed variation
-        right_width_coordinates, left_width_coordinates, num_intersection_coordinates = centerline_width.riverWidthFromCenterlineCoordinates(
+        right_width_coordinates, left_width_coordinates, num_intersection_coordinates = centerline_width._width_from_centerline_coordinates(
             river_object=river_object,
             centerline_coordinates=river_object.centerline_smoothed,
             transect_span_distance=transect_span_distance,
@@ -394,11 +426,11 @@ def width(river_object: centerline_width.CenterlineWidth = None,
 
     # Convert to Relative Distance after accounting for the width dictionary
     if coordinate_unit == "Relative Distance":
-        right_width_coordinates = centerline_width.relativeWidthCoordinates(
-            river_object.left_bank_coordinates[0], right_width_coordinates,
+        right_width_coordinates = centerline_width._relative_width_coordinates(
+            river_object._left_bank_array[0], right_width_coordinates,
             river_object.ellipsoid)
-        left_width_coordinates = centerline_width.relativeWidthCoordinates(
-            river_object.left_bank_coordinates[0], left_width_coordinates,
+        left_width_coordinates = centerline_width._relative_width_coordinates(
+            river_object._left_bank_array[0], left_width_coordinates,
             river_object.ellipsoid)
         if coordinate_reference == "Banks":
             # store the coordinates of the right/left bank
@@ -407,8 +439,8 @@ def width(river_object: centerline_width.CenterlineWidth = None,
                 right_left_coords[centerline_relative_coord] = (
                     right_width_coordinates[centerline_relative_coord],
                     left_width_coordinates[centerline_relative_coord])
-        width_dict = centerline_width.relativeWidthCoordinates(
-            river_object.left_bank_coordinates[0], width_dict,
+        width_dict = centerline_width._relative_width_coordinates(
+            river_object._left_bank_array[0], width_dict,
             river_object.ellipsoid)
 
     # If width reference set to "Banks", convert from referencing the centerline to reference left/right banks
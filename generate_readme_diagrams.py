@@ -393,7 +393,7 @@ if __name__ == "__main__":
         start_end_points_dict = centerline_width._points_from_voronoi(
             ro_15.bank_voronoi, ro_15.bank_polygon)
         nx_graphs, largest_subgraph_nodes = centerline_width._generate_nx_graph(
-            start_end_points_dict)
+            start_end_points_dict, ro_15.ellipsoid)
         nx.draw(nx_graphs, with_labels=True, font_size=10)
         plt.draw()
         if is_debug: plt.show()